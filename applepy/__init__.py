@@ -1,67 +1,87 @@
 from .backend import _MACOS, _IOS
+from .base.lazy import lazy_exports
+
+# public names are only imported the first time they are used
+_exports = []
 
 if _MACOS:
-    from .base.app import App, StatusBarApp, get_current_app
-    from .base.scene import Scene
-    from .base.view import View, StackedView, PartialView
-    from .base.types import (
-        Color,
-        Padding,
-        Image,
-        Size,
-        Point,
-        Alignment,
-        Orientation,
-        StackDistribution,
-        ImagePosition,
-        Date,
-        AlertResponse,
-        AlertStyle,
-        DialogResponse,
-        ProgressStyle,
-        ButtonStyle,
-        ToolbarStyle,
-        ToolbarDisplayMode,
-        ToolbarItemSystemIdentifier,
-        TitlePosition,
-        BorderType,
-        BoxType
-    )
-    from .base.binding import (
-        bindable,
-        Signal,
-        Binding,
-        BindingExpression,
-        AbstractBinding,
-        BindableMixin
-    )
-    from .views.timer import Timer
+    _exports += [
+        ('.base.app', ('App', 'StatusBarApp', 'get_current_app')),
+        ('.base.scene', ('Scene',)),
+        ('.base.view', ('View', 'StackedView', 'PartialView')),
+        ('.base.types', (
+            'Color',
+            'Padding',
+            'Image',
+            'Size',
+            'Point',
+            'Alignment',
+            'Orientation',
+            'StackDistribution',
+            'ImagePosition',
+            'Date',
+            'AlertResponse',
+            'AlertStyle',
+            'DialogResponse',
+            'ProgressStyle',
+            'ButtonStyle',
+            'ToolbarStyle',
+            'ToolbarDisplayMode',
+            'ToolbarItemSystemIdentifier',
+            'TitlePosition',
+            'BorderType',
+            'BoxType',
+            'Concurrency',
+            'ActionPolicy',
+            'TimerOverrun'
+        )),
+        ('.base.binding', (
+            'bindable',
+            'Signal',
+            'Binding',
+            'BindingExpression',
+            'AbstractBinding',
+            'BindableMixin'
+        )),
+        ('.base.template', ('template', 'ViewTemplate')),
+        ('.base.chunked', ('chunked',)),
+        ('.base.actions', ('ProcessAction', 'ProgressReporter')),
+        ('.views.timer', ('Timer',))
+    ]
 
 if _IOS:
-    from .base.app import App, get_current_app
-    from .base.scene import Scene
-    from .base.view import View, StackedView, PartialView
-    from .base.types import (
-        Color,
-        Padding,
-        Image,
-        Size,
-        Point,
-        Alignment,
-        Orientation,
-        StackDistribution,
-        ImagePosition,
-        Date,
-        ButtonStyle,
-        AlertResponse,
-        AlertActionStyle,
-        AlertAction
-    )
-    from .base.binding import (
-        bindable,
-        Signal,
-        Binding,
-        BindingExpression,
-        AbstractBinding,
-        BindableMixin
-    )
+    _exports += [
+        ('.base.app', ('App', 'get_current_app')),
+        ('.base.scene', ('Scene',)),
+        ('.base.view', ('View', 'StackedView', 'PartialView')),
+        ('.base.types', (
+            'Color',
+            'Padding',
+            'Image',
+            'Size',
+            'Point',
+            'Alignment',
+            'Orientation',
+            'StackDistribution',
+            'ImagePosition',
+            'Date',
+            'ButtonStyle',
+            'AlertResponse',
+            'AlertActionStyle',
+            'AlertAction',
+            'Concurrency',
+            'ActionPolicy'
+        )),
+        ('.base.binding', (
+            'bindable',
+            'Signal',
+            'Binding',
+            'BindingExpression',
+            'AbstractBinding',
+            'BindableMixin'
+        )),
+        ('.base.template', ('template', 'ViewTemplate')),
+        ('.base.chunked', ('chunked',))
+    ]
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), _exports)
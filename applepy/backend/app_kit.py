@@ -3,14 +3,11 @@ from rubicon.objc import (
     ObjCClass, ObjCProtocol, ObjCInstance, NSObject, objc_method, objc_classmethod
 )
 from rubicon.objc.eventloop import EventLoopPolicy, CocoaLifecycle, iOSLifecycle
-from rubicon.objc.runtime import load_library, send_super, SEL, objc_id, Foundation
+from rubicon.objc.runtime import load_library, send_super, SEL, objc_id, objc_const, Foundation
 from rubicon.objc.types import NSRect, NSPoint, NSSize
 from enum import Enum
 
 
-load_library('AppKit')
-load_library('Cocoa')
-
 UIApplication = Any
 UIWindow = Any
 UIViewController = Any
@@ -29,41 +26,41 @@ NSStringFromClass = Foundation.NSStringFromClass
 NSStringFromClass.restype = objc_id
 NSStringFromClass.argtypes = [objc_id]
 
-NSDate = ObjCClass('NSDate')
-NSURL = ObjCClass('NSURL')
-NSSet = ObjCClass('NSSet')
-
-NSColor = ObjCClass('NSColor')
-NSApplication = ObjCClass('NSApplication')
-NSWindow = ObjCClass('NSWindow')
-NSNotification = ObjCClass('NSNotification')
-NSImage = ObjCClass('NSImage')
-NSMenu = ObjCClass('NSMenu')
-NSMenuItem = ObjCClass('NSMenuItem')
-NSStackView = ObjCClass('NSStackView')
-NSView = ObjCClass('NSView')
-NSTextField = ObjCClass('NSTextField')
-NSButton = ObjCClass('NSButton')
-NSControl = ObjCClass('NSControl')
-NSLayoutConstraint = ObjCClass('NSLayoutConstraint')
-NSStatusBar = ObjCClass('NSStatusBar')
-NSStatusItem = ObjCClass('NSStatusItem')
-NSAlert = ObjCClass('NSAlert')
-NSOpenPanel = ObjCClass('NSOpenPanel')
-NSSavePanel = ObjCClass('NSSavePanel')
-NSDateComponents = ObjCClass('NSDateComponents')
-NSCalendar = ObjCClass('NSCalendar')
-NSDatePicker = ObjCClass('NSDatePicker')
-NSDatePickerCell = ObjCClass('NSDatePickerCell')
-NSProgressIndicator = ObjCClass('NSProgressIndicator')
-NSToolbar = ObjCClass('NSToolbar')
-NSToolbarItem = ObjCClass('NSToolbarItem')
-NSToolbarItemGroup = ObjCClass('NSToolbarItemGroup')
-NSBox = ObjCClass('NSBox')
-
-NSApp = NSApplication.sharedApplication
-
-UTType = ObjCClass('UTType')
+NSDefaultRunLoopMode = objc_const(Foundation, 'NSDefaultRunLoopMode')
+NSEventMaskAny = 0xffffffffffffffff
+
+# native classes are only looked up, and AppKit only loaded, when a name is first imported
+_CLASSES = frozenset((
+    'NSDate', 'NSURL', 'NSSet', 'NSColor', 'NSApplication', 'NSWindow', 'NSNotification', 'NSImage',
+    'NSMenu', 'NSMenuItem', 'NSStackView', 'NSView', 'NSTextField', 'NSButton', 'NSControl',
+    'NSLayoutConstraint', 'NSStatusBar', 'NSStatusItem', 'NSAlert', 'NSOpenPanel', 'NSSavePanel',
+    'NSDateComponents', 'NSCalendar', 'NSDatePicker', 'NSDatePickerCell', 'NSProgressIndicator',
+    'NSToolbar', 'NSToolbarItem', 'NSToolbarItemGroup', 'NSBox', 'UTType'
+))
+
+_libraries_loaded = False
+
+
+def _load_libraries() -> None:
+    global _libraries_loaded
+    if not _libraries_loaded:
+        load_library('AppKit')
+        load_library('Cocoa')
+        _libraries_loaded = True
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CLASSES:
+        _load_libraries()
+        value = ObjCClass(name)
+    elif name == 'NSApp':
+        value = __getattr__('NSApplication').sharedApplication
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # cached as a regular global, so the lookup only runs once per name
+    globals()[name] = value
+    return value
 
 
 class NSWindowStyleMask(Enum):
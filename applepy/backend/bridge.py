@@ -0,0 +1,145 @@
+import weakref
+
+from typing import Any, Dict, Optional, Tuple
+
+from . import _MACOS, _IOS
+
+if _MACOS or _IOS:
+    from rubicon.objc.api import ObjCMethod
+    from rubicon.objc.runtime import libobjc, SEL
+
+
+# values compared by equality, anything else (native objects) is only the same value if it is
+# the very same object. Booleans are compared as the ints they are.
+_VALUE_TYPES = (str, int, float, tuple)
+
+
+class BridgeStats:
+    """
+    BridgeStats
+    Counters of the native property writes requested through `set_property`.
+    """
+
+    def __init__(self) -> None:
+        self.issued = 0
+        self.skipped = 0
+
+    def reset(self) -> None:
+        """
+        Set both counters back to zero.
+        """
+        self.issued = 0
+        self.skipped = 0
+
+    def __repr__(self) -> str:
+        return f'<BridgeStats issued={self.issued} skipped={self.skipped}>'
+
+
+stats = BridgeStats()
+
+# native object -> last value written to each of its properties. Entries go away with the
+# object's wrapper, so a new object allocated at the same address never inherits them.
+_shadow: 'weakref.WeakKeyDictionary[Any, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+
+# (native class address, selector) -> resolved method, or None when the class does not implement it
+_methods: Dict[Tuple[int, str], Optional['ObjCMethod']] = {}
+
+
+def _resolve(ns_object: Any, selector: str) -> Optional['ObjCMethod']:
+    objc_class = ns_object.objc_class
+    key = (objc_class.ptr.value, selector)
+
+    try:
+        return _methods[key]
+    except KeyError:
+        pointer = libobjc.class_getInstanceMethod(objc_class, SEL(selector))
+        method = _methods[key] = ObjCMethod(pointer) if pointer else None
+        return method
+
+
+def send(ns_object: Any, selector: str, *args) -> Any:
+    """
+    Call an Objective-C method, resolving its selector and signature only once per class.
+    Prefer it over rubicon's dynamic attribute lookup in hot paths, e.g.
+    `send(stack_view, 'addArrangedSubview:', view)` instead of `stack_view.addArrangedSubview_(view)`.
+
+    Args:
+        ns_object (Any): The receiver.
+        selector (str): The full selector name, including colons.
+        *args: The method's arguments.
+
+    Returns:
+        Any: The method's result, converted like rubicon does.
+    """
+    method = _resolve(ns_object, selector)
+    if method is None:
+        raise AttributeError(f'{ns_object.objc_class.name} does not respond to {selector}')
+
+    return method(ns_object, *args)
+
+
+def _plain(value: Any) -> Any:
+    # bindable getters return subclasses of the value types, such as `wrapped_str`
+    for value_type in _VALUE_TYPES:
+        if isinstance(value, value_type):
+            return value if type(value) is value_type else value_type(value)
+
+    return value
+
+
+def _same(a: Any, b: Any) -> bool:
+    return a is b or (type(a) in _VALUE_TYPES and type(b) in _VALUE_TYPES and a == b)
+
+
+def set_property(ns_object: Any, name: str, value: Any) -> bool:
+    """
+    Write a property of a native object, unless the last value written to it through this
+    function, or recorded with `remember`, is the same value.
+
+    Args:
+        ns_object (Any): The native object.
+        name (str): The Objective-C property name.
+        value (Any): The new value.
+
+    Returns:
+        bool: `True` if the property was written, `False` if the write was skipped.
+    """
+    shadow = _shadow.setdefault(ns_object, {})
+    plain = _plain(value)
+
+    if name in shadow and _same(shadow[name], plain):
+        stats.skipped += 1
+        return False
+
+    setter = _resolve(ns_object, f'set{name[0].upper()}{name[1:]}:')
+    if setter:
+        setter(ns_object, value)
+    else:
+        setattr(ns_object, name, value)
+
+    shadow[name] = plain
+    stats.issued += 1
+    return True
+
+
+def remember(ns_object: Any, name: str, value: Any) -> None:
+    """
+    Record a value the native object changed by itself, e.g. the text typed by the user,
+    so writing it back is skipped.
+
+    Args:
+        ns_object (Any): The native object.
+        name (str): The Objective-C property name.
+        value (Any): The property's current value.
+    """
+    _shadow.setdefault(ns_object, {})[name] = _plain(value)
+
+
+def forget(ns_object: Any) -> None:
+    """
+    Drop every value recorded for a native object, e.g. when it is released.
+
+    Args:
+        ns_object (Any): The native object.
+    """
+    _shadow.pop(ns_object, None)
@@ -20,8 +20,6 @@ from rubicon.objc.runtime import (
 )
 from ctypes import c_int, c_char_p
 
-uilib = load_library('UIKit')
-
 NSMenuItem = Any
 NSButton = Any
 NSView = Any
@@ -33,36 +31,43 @@ NSAlert = Any
 NSOpenPanel = Any
 NSSavePanel = Any
 
-NSDate = ObjCClass('NSDate')
-NSURL = ObjCClass('NSURL')
-NSDictionary = ObjCClass('NSDictionary')
-
-UTType = ObjCClass('UTType')
-
-UIApplication = ObjCClass('UIApplication')
-UIWindow = ObjCClass('UIWindow')
-UIScreen = ObjCClass('UIScreen')
-UIView = ObjCClass('UIView')
-UIViewController = ObjCClass('UIViewController')
-UITabBarController = ObjCClass('UITabBarController')
-UIPageViewController = ObjCClass('UIPageViewController')
-UIStackView = ObjCClass('UIStackView')
-UILabel = ObjCClass('UILabel')
-UIColor = ObjCClass('UIColor')
-UITextField = ObjCClass('UITextField')
-UIButton = ObjCClass('UIButton')
-UIButtonConfiguration = ObjCClass('UIButtonConfiguration')
-UIAlertController = ObjCClass('UIAlertController')
-UIAlertAction = ObjCClass('UIAlertAction')
-
-UIApplicationMain = uilib.UIApplicationMain
-UIApplicationMain.restype = c_int
-UIApplicationMain.argtypes = [c_int, c_char_p, objc_id, objc_id]
-
 NSStringFromClass = Foundation.NSStringFromClass
 NSStringFromClass.restype = objc_id
 NSStringFromClass.argtypes = [objc_id]
 
+# native classes are only looked up, and UIKit only loaded, when a name is first imported
+_CLASSES = frozenset((
+    'NSDate', 'NSURL', 'NSDictionary', 'UTType', 'UIApplication', 'UIWindow', 'UIScreen', 'UIView',
+    'UIViewController', 'UITabBarController', 'UIPageViewController', 'UIStackView', 'UILabel',
+    'UIColor', 'UITextField', 'UIButton', 'UIButtonConfiguration', 'UIAlertController', 'UIAlertAction'
+))
+
+_uilib = None
+
+
+def _load_libraries() -> Any:
+    global _uilib
+    if _uilib is None:
+        _uilib = load_library('UIKit')
+
+    return _uilib
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CLASSES:
+        _load_libraries()
+        value = ObjCClass(name)
+    elif name == 'UIApplicationMain':
+        value = _load_libraries().UIApplicationMain
+        value.restype = c_int
+        value.argtypes = [c_int, c_char_p, objc_id, objc_id]
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # cached as a regular global, so the lookup only runs once per name
+    globals()[name] = value
+    return value
+
 
 class UIButtonType(Enum):
     UIButtonTypeCustom = 0
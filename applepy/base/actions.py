@@ -0,0 +1,676 @@
+import asyncio
+import logging
+
+from collections import deque
+from concurrent.futures import Future
+from math import ceil, log2
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .binding import AbstractBinding, EmitTimer, _emit_timer, measure_emits
+from ..backend.bridge import set_property
+from .types import ActionPolicy, Concurrency
+from .utils import try_call, try_call_async
+
+
+logger = logging.getLogger(__name__)
+
+# sent through the progress queue when the worker process is done
+_PUMP_STOP = '__applepy_progress_done__'
+
+
+def _is_pump_stop(value: Any) -> bool:
+    return isinstance(value, str) and value == _PUMP_STOP
+
+
+class LatencyHistogram:
+    """
+    LatencyHistogram
+    Counts durations in buckets whose upper bounds are powers of two milliseconds.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty `LatencyHistogram`.
+        """
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+
+    def add(self, seconds: float) -> None:
+        """
+        Count a duration.
+
+        Args:
+            seconds (float): The duration, in seconds.
+        """
+        ms = seconds * 1000.
+        bucket = max(0, ceil(log2(ms))) if ms > 1. else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean duration, in seconds.
+
+        Returns:
+            float: The mean duration.
+        """
+        return self.total / self.count if self.count else 0.
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket that contains it.
+
+        Args:
+            p (float): Percentile, between 0 and 100.
+
+        Returns:
+            float: The estimated duration, in seconds.
+        """
+        target = self.count * p / 100.
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return min(2 ** bucket / 1000., self.max)
+
+        return self.max
+
+
+class ActionSample(NamedTuple):
+    action: str
+    # from the native event to the start of the handler, only for async actions
+    queue: float
+    # handler run time, without the time spent in signals
+    body: float
+    # time spent updating bindings and native views from signals emitted by the handler
+    emit: float
+
+    @property
+    def total(self) -> float:
+        return self.queue + self.body + self.emit
+
+
+class ActionStats:
+    """
+    ActionStats
+    Latency histograms of one action.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty `ActionStats`.
+        """
+        self.queue = LatencyHistogram()
+        self.body = LatencyHistogram()
+        self.emit = LatencyHistogram()
+        self.total = LatencyHistogram()
+
+
+class ActionMetrics:
+    """
+    ActionMetrics
+    Collects the latency of every action dispatched by the App, and reports
+    the runs slower than a threshold.
+    """
+
+    def __init__(self, threshold_ms: Optional[float]=100.,
+                       on_slow: Optional[Callable[[ActionSample], None]]=None) -> None:
+        """
+        Initialize a new `ActionMetrics`.
+
+        Args:
+            threshold_ms (Optional[float], optional): Runs that take longer are reported. Use None to never report.
+                Defaults to 100.
+            on_slow (Optional[Callable[[ActionSample], None]], optional): Called with the samples of slow runs.
+                Defaults to logging a warning.
+        """
+        self.threshold_ms = threshold_ms
+        self.on_slow = on_slow
+        self.stats: Dict[str, ActionStats] = {}
+
+    def record(self, sample: ActionSample) -> None:
+        """
+        Add a run of an action to its histograms.
+        It is used internally to dispatch actions. Do not call it directly.
+
+        Args:
+            sample (ActionSample): The run's timings.
+        """
+        stats = self.stats.get(sample.action)
+        if not stats:
+            stats = self.stats[sample.action] = ActionStats()
+
+        stats.queue.add(sample.queue)
+        stats.body.add(sample.body)
+        stats.emit.add(sample.emit)
+        stats.total.add(sample.total)
+
+        if self.threshold_ms is not None and sample.total * 1000. > self.threshold_ms:
+            if self.on_slow:
+                self.on_slow(sample)
+            else:
+                logger.warning('Slow action %s: %.1f ms (queue %.1f ms, body %.1f ms, bindings %.1f ms)',
+                               sample.action,
+                               sample.total * 1000.,
+                               sample.queue * 1000.,
+                               sample.body * 1000.,
+                               sample.emit * 1000.)
+
+    def run(self, action: Callable, name: Optional[str]=None) -> Any:
+        """
+        Call a sync action and record its timings.
+        It is used internally to dispatch actions. Do not call it directly.
+
+        Args:
+            action (Callable): The action to be called.
+            name (Optional[str], optional): Name the timings are recorded under. Defaults to the action's name.
+
+        Returns:
+            Any: The value returned by the action.
+        """
+        started = perf_counter()
+        res, timer = measure_emits(lambda: try_call(action))
+        elapsed = perf_counter() - started
+        self.record(ActionSample(name or action_name(action), 0., elapsed - timer.elapsed, timer.elapsed))
+
+        return res
+
+    async def run_async(self, action: Callable, triggered_at: float, name: Optional[str]=None) -> Any:
+        """
+        Await an async action and record its timings.
+        It is used internally to dispatch actions. Do not call it directly.
+
+        Args:
+            action (Callable): The coroutine function to be awaited.
+            triggered_at (float): `perf_counter` value of the native event.
+            name (Optional[str], optional): Name the timings are recorded under. Defaults to the action's name.
+
+        Returns:
+            Any: The value returned by the action.
+        """
+        timer = EmitTimer()
+        _emit_timer.set(timer)
+
+        started = perf_counter()
+        try:
+            return await try_call_async(action)
+        finally:
+            elapsed = perf_counter() - started
+            self.record(ActionSample(name or action_name(action),
+                                     started - triggered_at,
+                                     elapsed - timer.elapsed,
+                                     timer.elapsed))
+
+
+def action_name(action: Callable) -> str:
+    """
+    Return a readable name for an action.
+
+    Args:
+        action (Callable): The action.
+
+    Returns:
+        str: The action's qualified name.
+    """
+    action = getattr(action, 'action', action)
+    module = getattr(action, '__module__', None)
+    name = getattr(action, '__qualname__', None) or type(action).__qualname__
+    return f'{module}.{name}' if module else name
+
+
+def action_label(action: Callable, caller: Optional[Any]=None) -> str:
+    """
+    Return the name the timings of an action registered for a control are recorded under.
+    Lambdas, or the closure shared by every checkbox, all have the same name, so the
+    control's slot in the action table is appended to tell their registrations apart.
+
+    Args:
+        action (Callable): The action.
+        caller (Optional[Any], optional): The native control the action is registered for. Defaults to None.
+
+    Returns:
+        str: The action's qualified name, followed by the control's tag.
+    """
+    name = action_name(action)
+    tag = getattr(caller, 'tag', 0) if caller is not None else 0
+    return f'{name} #{tag}' if tag else name
+
+
+class ActionTable:
+    """
+    ActionTable
+    Dense table of the actions registered for native controls. Each control carries
+    its slot in its `tag`, so dispatching an action is a list lookup.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty `ActionTable`.
+        """
+        self._slots: List[Optional[Callable]] = []
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots) - len(self._free)
+
+    def add(self, action: Callable) -> int:
+        """
+        Store an action in a free slot.
+
+        Args:
+            action (Callable): Action to be stored.
+
+        Returns:
+            int: The tag to be assigned to the control, never 0.
+        """
+        if self._free:
+            index = self._free.pop()
+            self._slots[index] = action
+        else:
+            index = len(self._slots)
+            self._slots.append(action)
+
+        return index + 1
+
+    def replace(self, tag: int, action: Callable) -> None:
+        """
+        Replace the action stored for a tag.
+
+        Args:
+            tag (int): Tag returned by `add`.
+            action (Callable): New action.
+        """
+        self._slots[tag - 1] = action
+
+    def get(self, tag: int) -> Optional[Callable]:
+        """
+        Return the action stored for a tag.
+
+        Args:
+            tag (int): Tag returned by `add`.
+
+        Returns:
+            Optional[Callable]: The stored action, or None for an unknown tag.
+        """
+        if 0 < tag <= len(self._slots):
+            return self._slots[tag - 1]
+
+        return None
+
+    def remove(self, tag: int) -> None:
+        """
+        Free the slot of a tag, so it can be reused.
+
+        Args:
+            tag (int): Tag returned by `add`.
+        """
+        if 0 < tag <= len(self._slots) and self._slots[tag - 1] is not None:
+            self._slots[tag - 1] = None
+            self._free.append(tag - 1)
+
+    def owns(self, tag: int) -> bool:
+        """
+        Checks whether a tag refers to a used slot.
+
+        Args:
+            tag (int): Tag to be checked.
+
+        Returns:
+            bool: True if the tag refers to a stored action. False otherwise.
+        """
+        return self.get(tag) is not None
+
+
+class AsyncActionRunner:
+    """
+    AsyncActionRunner
+    Starts the runs of an async action according to an `ActionPolicy`, and keeps
+    track of their tasks so they can be cancelled.
+    """
+
+    def __init__(self, action: Callable,
+                       policy: Optional[ActionPolicy]=None,
+                       metrics: Optional[ActionMetrics]=None,
+                       caller: Optional[Any]=None) -> None:
+        """
+        Initialize a new `AsyncActionRunner`.
+
+        Args:
+            action (Callable): The coroutine function to be run.
+            policy (Optional[ActionPolicy], optional): How overlapping runs are handled.
+                Defaults to running every click in parallel, without limit.
+            metrics (Optional[ActionMetrics], optional): Where the runs' timings are recorded. Defaults to None.
+            caller (Optional[Any], optional): The native control that triggers the action. Defaults to None.
+        """
+        self.action = action
+        self.policy = policy or ActionPolicy()
+        self.metrics = metrics
+        self.caller = caller
+
+        self._tasks: List[asyncio.Task] = []
+        # trigger time of each queued run
+        self._pending = deque()
+
+    @property
+    def running(self) -> int:
+        """
+        The number of runs in progress.
+
+        Returns:
+            int: The number of runs in progress.
+        """
+        return len(self._tasks)
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of queued runs.
+
+        Returns:
+            int: The number of queued runs.
+        """
+        return len(self._pending)
+
+    def _has_room(self) -> bool:
+        limit = self.policy.max_concurrency
+        if self.policy.concurrency != Concurrency.parallel:
+            limit = limit or 1
+
+        return limit is None or len(self._tasks) < limit
+
+    def trigger(self) -> None:
+        """
+        Start a run, or queue, drop or restart it as the policy says.
+        It is used internally to dispatch actions. Do not call it directly.
+        """
+        triggered_at = perf_counter()
+
+        if self._has_room():
+            self._start(triggered_at)
+        elif self.policy.concurrency == Concurrency.queue:
+            if self.policy.max_queue is None or len(self._pending) < self.policy.max_queue:
+                self._pending.append(triggered_at)
+        elif self.policy.concurrency == Concurrency.restart:
+            self._tasks.pop(0).cancel()
+            self._start(triggered_at)
+
+    def _start(self, triggered_at: float) -> None:
+        if self.metrics:
+            coroutine = self.metrics.run_async(self.action, triggered_at, action_label(self.action, self.caller))
+        else:
+            coroutine = try_call_async(self.action)
+
+        task = asyncio.get_event_loop().create_task(coroutine)
+        task.add_done_callback(self._on_done)
+        self._tasks.append(task)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        if task in self._tasks:
+            self._tasks.remove(task)
+
+        if self._pending and self._has_room():
+            self._start(self._pending.popleft())
+
+    def cancel(self) -> None:
+        """
+        Cancel the runs in progress and drop the queued ones.
+        """
+        self._pending.clear()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+
+
+class ThreadActionRunner:
+    """
+    ThreadActionRunner
+    Runs a sync action in the App's thread pool, keeping its control disabled
+    until the action finishes.
+    """
+
+    def __init__(self, action: Callable,
+                       caller: Any,
+                       owner: Optional[Any]=None,
+                       metrics: Optional[ActionMetrics]=None) -> None:
+        """
+        Initialize a new `ThreadActionRunner`.
+
+        Args:
+            action (Callable): The function to be run.
+            caller (Any): The native control that triggers the action.
+            owner (Optional[Any], optional): The view of the control, whose `enabled` state is given
+                back to the control once the action finishes. Defaults to None, giving back the
+                state the control had when the action started.
+            metrics (Optional[ActionMetrics], optional): Where the runs' timings are recorded. Defaults to None.
+        """
+        self.action = action
+        self.caller = caller
+        self.owner = owner
+        self.metrics = metrics
+
+        self._future: Optional[Future] = None
+        self._was_enabled = True
+        self._cancelled = False
+        # `perf_counter` values of the click and of the start of the run in a worker
+        self._triggered_at = 0.
+        self._started = 0.
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the action is in flight, including a cancelled one that did not finish yet.
+
+        Returns:
+            bool: True if the action is running. False otherwise.
+        """
+        return self._future is not None
+
+    def __call__(self) -> None:
+        from .app import get_current_app
+
+        if self._future:
+            return
+
+        app = get_current_app()
+        self._was_enabled = self.caller.isEnabled()
+        self._cancelled = False
+        self._triggered_at = self._started = perf_counter()
+        set_property(self.caller, 'enabled', False)
+
+        try:
+            self._future = self._submit(app)
+        except Exception:
+            self._restore_enabled()
+            raise
+
+        self._future.add_done_callback(lambda future: app.call_on_ui_thread(self._on_done, future, perf_counter()))
+
+    def _submit(self, app: Any) -> Future:
+        return app.executor.submit(self._run)
+
+    def _run(self) -> Any:
+        # runs in a worker thread, the time spent waiting for it is the run's queueing time
+        self._started = perf_counter()
+        return try_call(self.action)
+
+    def _restore_enabled(self) -> None:
+        # the view may have been enabled or disabled meanwhile, e.g. by the action itself
+        enabled = self._was_enabled if self.owner is None else self.owner.enabled
+        set_property(self.caller, 'enabled', enabled)
+
+    def _on_done(self, future: Future, finished_at: float) -> None:
+        if not future.cancelled():
+            if future.exception():
+                logger.error('Action %r failed.', self.action, exc_info=future.exception())
+
+            if self.metrics:
+                # bindings changed by the action are updated later, by the main thread
+                self.metrics.record(ActionSample(action_label(self.action, self.caller),
+                                                 self._started - self._triggered_at,
+                                                 finished_at - self._started,
+                                                 0.))
+
+        if self._future is future:
+            self._future = None
+            self._restore_enabled()
+
+    def cancel(self) -> None:
+        """
+        Cancel the action in flight. A function that already started running in a thread
+        cannot be interrupted: its control stays disabled until it finishes, and its result
+        is ignored.
+        """
+        if self._future:
+            self._cancelled = True
+            self._future.cancel()
+
+
+class ProgressReporter:
+    """
+    ProgressReporter
+    Picklable callable that sends progress values from a worker process back to the App.
+    """
+
+    def __init__(self, queue: Any) -> None:
+        """
+        Initialize a new `ProgressReporter`.
+        It is used internally by `ProcessAction`. Do not create it directly.
+
+        Args:
+            queue (Any): Queue proxy shared with the App's process.
+        """
+        self._queue = queue
+
+    def __call__(self, value: Any) -> None:
+        """
+        Report a new progress value.
+
+        Args:
+            value (Any): The progress value, assigned to the action's `progress` binding.
+        """
+        self._queue.put(value)
+
+
+class ProcessAction:
+    """
+    ProcessAction
+    Describes a CPU-bound function to be run in a worker process when a control
+    with `run_in='process'` is activated.
+    """
+
+    def __init__(self, fn: Callable, *args,
+                       progress: Optional[AbstractBinding]=None,
+                       on_result: Optional[Callable[[Any], None]]=None,
+                       **kwargs) -> None:
+        """
+        Create a new `ProcessAction`. `fn` and its arguments must be picklable, e.g. a module
+        level function. Worker processes are started with the `spawn` method on macOS, which
+        imports the App's main module again in every worker: the code that creates and runs
+        the App must be guarded by `if __name__ == '__main__':`, or each worker starts another App. When `progress` is given, `fn` receives a `ProgressReporter` as its
+        `progress` keyword argument, and every value reported is assigned to the binding in the
+        main thread. The value returned by `fn` is passed to `on_result`, also in the main thread:
+
+        >>> Button(title='Import',
+                   run_in='process',
+                   action=ProcessAction(parse_files, self.vm.paths,
+                                        progress=Binding(ViewModel.progress, self.vm),
+                                        on_result=self.files_parsed))
+
+        Args:
+            fn (Callable): The function to be run in a worker process.
+            *args: Positional arguments passed to `fn`.
+            progress (Optional[AbstractBinding], optional): Binding that receives the reported progress. Defaults to None.
+            on_result (Optional[Callable[[Any], None]], optional): Called with the value returned by `fn`. Defaults to None.
+            **kwargs: Keyword arguments passed to `fn`.
+        """
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.progress = progress
+        self.on_result = on_result
+
+    def __call__(self) -> Any:
+        return self.fn(*self.args, **self.kwargs)
+
+
+def _run_process_action(fn: Callable, args: tuple, kwargs: dict, reporter: Optional[ProgressReporter]) -> Any:
+    if reporter:
+        kwargs = dict(kwargs, progress=reporter)
+
+    return fn(*args, **kwargs)
+
+
+class ProcessActionRunner(ThreadActionRunner):
+    """
+    ProcessActionRunner
+    Runs a `ProcessAction` in the App's process pool, keeping its control disabled
+    until the action finishes.
+    """
+
+    def __init__(self, action: Callable,
+                       caller: Any,
+                       owner: Optional[Any]=None,
+                       metrics: Optional[ActionMetrics]=None) -> None:
+        """
+        Initialize a new `ProcessActionRunner`. Its timings have no queueing time, the
+        time spent waiting for a worker process is part of the run.
+
+        Args:
+            action (Callable): The `ProcessAction`, or a picklable function, to be run.
+            caller (Any): The native control that triggers the action.
+            owner (Optional[Any], optional): The view of the control, whose `enabled` state is given
+                back to the control once the action finishes. Defaults to None, giving back the
+                state the control had when the action started.
+            metrics (Optional[ActionMetrics], optional): Where the runs' timings are recorded. Defaults to None.
+        """
+        if not isinstance(action, ProcessAction):
+            action = ProcessAction(action)
+
+        super().__init__(action, caller, owner, metrics)
+
+    def _submit(self, app: Any) -> Future:
+        reporter = None
+        if self.action.progress:
+            queue = app.process_manager.Queue()
+            reporter = ProgressReporter(queue)
+
+        future = app.process_executor.submit(_run_process_action,
+                                             self.action.fn,
+                                             self.action.args,
+                                             self.action.kwargs,
+                                             reporter)
+        if reporter:
+            # only started once the action is submitted, a failed submit would leave it waiting forever
+            app.executor.submit(self._pump_progress, app, queue)
+            future.add_done_callback(lambda _: queue.put(_PUMP_STOP))
+
+        return future
+
+    def _pump_progress(self, app: Any, queue: Any) -> None:
+        stop = False
+        while not stop:
+            # only the latest of the values reported meanwhile reaches the UI
+            values = [queue.get()]
+            while not queue.empty():
+                values.append(queue.get())
+
+            stop = any(_is_pump_stop(v) for v in values)
+            values = [v for v in values if not _is_pump_stop(v)]
+            if values:
+                app.call_on_ui_thread(self._set_progress, values[-1])
+
+    def _set_progress(self, value: Any) -> None:
+        self.action.progress.value = value
+
+    def _on_done(self, future: Future, finished_at: float) -> None:
+        super()._on_done(future, finished_at)
+
+        if not self._cancelled and not future.cancelled() and not future.exception():
+            try_call(self.action.on_result, future.result())
+
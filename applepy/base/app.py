@@ -1,11 +1,32 @@
 import asyncio
+import logging
+import threading
 
 from abc import ABC, abstractmethod
-from typing import Callable, Union, Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from multiprocessing import Manager
+from multiprocessing.managers import SyncManager
+from time import perf_counter
+from typing import Callable, Iterable, List, Optional, Union, Any
 
 from ..backend import _IOS, _MACOS
-from .utils import try_call, try_call_async
-from .errors import NotSupportedError
+from .actions import (
+    ActionTable,
+    ActionMetrics,
+    AsyncActionRunner,
+    action_label,
+    ThreadActionRunner,
+    ProcessActionRunner
+)
+from .types import ActionPolicy
+from .idle import IdleQueue, IdleTask
+from .scheduler import TimerScheduler
+from .scope import reset_scope
+from .watchdog import Stall, StallDetector
+from .utils import try_call
+from .errors import NotSupportedError, InvalidRunInError
 
 if _MACOS:
     from ..backend.app_kit import (
@@ -15,6 +36,8 @@ if _MACOS:
         NSButton,
         NSStatusBar,
         UIButton,
+        NSDefaultRunLoopMode,
+        NSEventMaskAny,
         EventLoopPolicy,
         CocoaLifecycle,
         objc_method,
@@ -40,69 +63,14 @@ if _IOS:
     )
 
 
-_current_app = None
-
-
-class StackMixin:
-    """
-    StackMixin
-    Mixin that adds a `list` variable to the target class and methods to handle
-    it as a Stack data structure.
-    """
-
-    def __init__(self) -> None:
-        """
-        Initialize the `StackMixin`.
-        """    
-        self._stack: list = []
-
-    def stack(self, child: Any) -> None:
-        """
-        Add a child element to the top of the stack.
-
-        Args:
-            child (Any): Child element to be added to stack.
-        """        
-        self._stack.append(child)
-
-    def pop(self) -> Any:
-        """
-        Remove and return the last element in the stack.
-
-        Returns:
-            Any: Item removed from the stack.
-        """        
-        return self._stack.pop()
+logger = logging.getLogger(__name__)
 
-    def pop_first(self) -> Any:
-        """
-        Remove and return the first element in the stack.
-
-        Returns:
-            Any: Item removed from the stack.
-        """        
-        return self._stack.pop(0)
-
-    def get(self) -> Any:
-        """
-        Return the last element in the stack without removing it.
-
-        Returns:
-            Any: Last item in the stack.
-        """        
-        return self._stack[-1] if len(self._stack) > 0 else None
-
-    def is_stacked(self, ptr: Any) -> bool:
-        """
-        Checks whether the provided object has been stacked already.
-
-        Args:
-            ptr (Any): Pointer to be object to be checked.
+_current_app = None
+# App building a view tree in the current context, takes precedence over `_current_app`
+_building_app: 'ContextVar[Optional[App]]' = ContextVar('applepy_building_app', default=None)
+# callbacks waiting for an App to run, such as timers enabled before `App.run`
+_waiting_for_app: List[Callable[['App'], None]] = []
 
-        Returns:
-            bool: True is pointer has alsready been stacked. False otherwise.
-        """        
-        return ptr in self._stack
 
 if _MACOS:
     class _ApplicationController(NSObject):
@@ -116,7 +84,15 @@ if _MACOS:
 
         @objc_method
         def actionProxyAsync_(self, target):
-            asyncio.create_task(_current_app.invoke_action_async(target))
+            _current_app.trigger_action(target)
+
+        @objc_method
+        def drainUiCalls_(self, sender):
+            _current_app._drain_ui_calls()
+
+        @objc_method
+        def idleTick_(self, sender):
+            _current_app._idle.tick()
 
 if _IOS:
     class _TouchApplicationController(NSObject):
@@ -133,13 +109,27 @@ if _IOS:
 
         @objc_method
         def actionProxyAsync_(self, target):
-            asyncio.create_task(_current_app.invoke_action_async(target))
+            _current_app.trigger_action(target)
 
+        @objc_method
+        def drainUiCalls_(self, sender):
+            _current_app._drain_ui_calls()
+
+        @objc_method
+        def idleTick_(self, sender):
+            _current_app._idle.tick()
 
-class App(ABC, StackMixin):
-    def __init__(self) -> None:
-        StackMixin.__init__(self)
 
+class App(ABC):
+    def __init__(self, *, background_construction: bool = False) -> None:
+        """
+        Initialize a new `App` instance.
+
+        Args:
+            background_construction (bool, optional): When running with `run_async`, evaluate the
+                `body` method in a worker thread and only parse the native views in the main thread.
+                See `build_async` for what `body` may do in that thread. Defaults to False.
+        """
         if _MACOS:
             self._controller = _ApplicationController.alloc().init()
             NSApp.delegate = self._controller
@@ -147,8 +137,18 @@ class App(ABC, StackMixin):
         if _IOS:
             self._controller = _TouchApplicationController.alloc().init()
 
-        self._actions = {}
-        self._async_actions = {}
+        self._actions = ActionTable()
+        self.action_metrics = ActionMetrics()
+
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._background_construction = background_construction
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_manager: Optional[SyncManager] = None
+        self._ui_calls = deque()
+        self._scheduler: Optional[TimerScheduler] = None
+        self._idle: Optional[IdleQueue] = None
+        self.stall_detector: Optional[StallDetector] = None
 
     def _register_scene(self) -> None:
         if _MACOS:
@@ -169,8 +169,7 @@ class App(ABC, StackMixin):
         return self
 
     def run(self) -> int:
-        global _current_app
-        _current_app = self
+        _set_current_app(self)
 
         if _MACOS:
             return NSApp.run()
@@ -179,8 +178,7 @@ class App(ABC, StackMixin):
             return UIApplicationMain(0, None, None, ObjCInstance(NSStringFromClass(_TouchApplicationController)))
         
     def run_async(self) -> int:
-        global _current_app
-        _current_app = self
+        _set_current_app(self)
 
         asyncio.set_event_loop_policy(EventLoopPolicy())
         self.loop = asyncio.new_event_loop()
@@ -199,26 +197,354 @@ class App(ABC, StackMixin):
             return UIApplicationMain(0, None, None, ObjCInstance(NSStringFromClass(_TouchAsyncApplicationController)))
 
     def setup_scene(self) -> None:
-        self._scene = self.body().parse()
+        if self._background_construction and self.loop and self.loop.is_running():
+            task = self.loop.create_task(self.setup_scene_async())
+            task.add_done_callback(self._on_scene_setup_done)
+            return
+
+        self._scene = self.build(self.body).parse()
+        self._register_scene()
+
+    def _on_scene_setup_done(self, task: asyncio.Task) -> None:
+        # nothing awaits the task, so its errors would otherwise go unnoticed
+        if not task.cancelled() and task.exception():
+            logger.error('Scene setup failed.', exc_info=task.exception())
+
+    async def setup_scene_async(self) -> None:
+        """
+        Evaluate the App's body in a worker thread and parse the resulting scene
+        in the main thread.
+        """
+        self._scene = await self.present_async(self.body)
         self._register_scene()
 
-    def register_action(self, caller: Union[NSMenuItem, NSButton, UIButton], action: Callable) -> SEL:
-        self._actions[caller] = action
+    def build(self, body: Callable[[], Any]) -> Any:
+        """
+        Run the construction phase of a view tree, i.e. evaluate `body`. Views create
+        their native objects when parsed, but `body` itself may create some, such as
+        `Image` and `Color` values. The returned scene or view must be parsed afterwards,
+        in the main thread.
+
+        Args:
+            body (Callable[[], Any]): Function that builds and returns a `Scene` or `View`.
+
+        Returns:
+            Any: The unparsed `Scene` or `View` returned by `body`.
+        """
+        # every build runs in its own context, so trees can be built concurrently
+        return copy_context().run(self._build, body)
+
+    def _build(self, body: Callable[[], Any]) -> Any:
+        _building_app.set(self)
+        reset_scope()
+        return body()
+
+    async def build_async(self, body: Callable[[], Any]) -> Any:
+        """
+        Run the construction phase of a view tree in a worker thread, keeping the
+        main thread free to process events meanwhile. Everything `body` calls runs in
+        that thread too, including the `Image` and `Color` factories, which create native
+        objects. Create the images and colors such a body needs in the main thread beforehand,
+        e.g. in the App's `__init__`, and never read or change views that are already displayed.
+
+        Args:
+            body (Callable[[], Any]): Function that builds and returns a `Scene` or `View`.
+
+        Returns:
+            Any: The unparsed `Scene` or `View` returned by `body`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.build, body)
+
+    async def present_async(self, body: Callable[[], Any]) -> Any:
+        """
+        Build a scene in a worker thread and parse it in the main thread.
+        Use it to open secondary windows without blocking the user interface:
+
+        >>> async def open_document(self):
+                await get_current_app().present_async(lambda: self.document_window())
+
+        Args:
+            body (Callable[[], Any]): Function that builds and returns a `Scene`.
+
+        Returns:
+            Any: The parsed `Scene`.
+        """
+        scene = await self.build_async(body)
+        return scene.parse()
+
+    def _store_action(self, caller: Union[NSMenuItem, NSButton, UIButton], action: Callable) -> None:
+        # the control's tag holds its slot in the action table
+        if self._actions.owns(caller.tag):
+            previous = self._actions.get(caller.tag)
+            if isinstance(previous, (AsyncActionRunner, ThreadActionRunner)):
+                previous.cancel()
+            self._actions.replace(caller.tag, action)
+        else:
+            caller.tag = self._actions.add(action)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        The thread pool shared by the App's background work, such as building views
+        and running actions with `run_in='thread'`.
+
+        Returns:
+            ThreadPoolExecutor: The App's thread pool.
+        """
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(thread_name_prefix='applepy')
+
+        return self._executor
+
+    @property
+    def process_executor(self) -> ProcessPoolExecutor:
+        """
+        The process pool used by actions with `run_in='process'`.
+
+        Returns:
+            ProcessPoolExecutor: The App's process pool.
+        """
+        if not self._process_executor:
+            self._process_executor = ProcessPoolExecutor()
+
+        return self._process_executor
+
+    @property
+    def process_manager(self) -> SyncManager:
+        """
+        The manager that provides the queues used to report progress from worker processes.
+
+        Returns:
+            SyncManager: The App's process manager.
+        """
+        if not self._process_manager:
+            self._process_manager = Manager()
+
+        return self._process_manager
+
+    @property
+    def scheduler(self) -> TimerScheduler:
+        """
+        The scheduler that runs every `Timer` of the App in a single thread,
+        delivering their callbacks in the main thread.
+
+        Returns:
+            TimerScheduler: The App's timer scheduler.
+        """
+        if not self._scheduler:
+            self._scheduler = TimerScheduler(self.call_on_ui_thread)
+
+        return self._scheduler
+
+    def call_on_ui_thread(self, fn: Callable, *args) -> None:
+        """
+        Call `fn` in the main thread. When called from the main thread, `fn` runs immediately,
+        otherwise it is scheduled to run as soon as the main thread processes its events.
+
+        Args:
+            fn (Callable): Function to be called.
+            *args: Arguments passed to `fn`.
+        """
+        if threading.current_thread() is threading.main_thread():
+            fn(*args)
+        elif self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(fn, *args)
+        else:
+            self._ui_calls.append((fn, args))
+            self._controller.performSelectorOnMainThread_withObject_waitUntilDone_(SEL('drainUiCalls:'),
+                                                                                  None,
+                                                                                  False)
+
+    def _drain_ui_calls(self) -> None:
+        while self._ui_calls:
+            fn, args = self._ui_calls.popleft()
+            try_call(fn, *args)
+
+    def run_when_idle(self, fn: Callable, budget_ms: float=8., priority: int=0) -> IdleTask:
+        """
+        Run `fn` in the main thread when it has no pending events, such as user input.
+        Housekeeping work, like building an index or trimming a cache, can be split in steps by making `fn`
+        a generator (function): each `yield` gives the main thread back if the tick's budget is spent
+        or events are waiting, and the generator is resumed in a later tick.
+        Must be called from the main thread.
+        Example:
+        >>>def warm_up():
+               for path in paths:
+                   cache.load(path)
+                   yield
+
+        >>>get_current_app().run_when_idle(warm_up, budget_ms=4.)
+
+        Args:
+            fn (Callable): Function, generator function or generator to be run.
+            budget_ms (float, optional): How long a tick may run before giving the main thread back,
+                in milliseconds. Defaults to 8.
+            priority (int, optional): Tasks with higher priority run first. Defaults to 0.
+
+        Returns:
+            IdleTask: Handle that can cancel the task.
+        """
+        if not self._idle:
+            self._idle = IdleQueue(self._has_pending_events, self._request_idle_tick)
+
+        return self._idle.add(fn, budget_ms, priority)
+
+    def _has_pending_events(self) -> bool:
+        if _MACOS:
+            event = NSApp.nextEventMatchingMask_untilDate_inMode_dequeue_(NSEventMaskAny,
+                                                                          None,
+                                                                          NSDefaultRunLoopMode,
+                                                                          False)
+            return event is not None
+
+        return False
+
+    def _request_idle_tick(self, delay: float) -> None:
+        self._controller.performSelector_withObject_afterDelay_(SEL('idleTick:'), None, delay)
+
+    def enable_stall_detector(self, threshold_ms: float=250.,
+                                    interval_ms: float=100.,
+                                    on_stall: Optional[Callable[[Stall, float], None]]=None) -> StallDetector:
+        """
+        Start a watchdog that captures the Python stack of the main thread whenever it takes longer
+        than `threshold_ms` to handle a heartbeat. The stalls are logged and aggregated by stack
+        in `stall_detector.stalls`. Works both with `run` and `run_async`.
+
+        Args:
+            threshold_ms (float, optional): Longest acceptable stall, in milliseconds. Defaults to 250.
+            interval_ms (float, optional): Time between heartbeats, in milliseconds. Defaults to 100.
+            on_stall (Optional[Callable[[Stall, float], None]], optional): Called from the watchdog thread
+                with the aggregated stall and the duration of the new one. Defaults to logging a warning.
+
+        Returns:
+            StallDetector: The running detector, also available as `stall_detector`.
+        """
+        if self.stall_detector:
+            self.stall_detector.stop()
+
+        self.stall_detector = StallDetector(self.call_on_ui_thread, threshold_ms, interval_ms, on_stall)
+        self.stall_detector.start()
+        return self.stall_detector
+
+    def register_action(self, caller: Union[NSMenuItem, NSButton, UIButton],
+                              action: Callable,
+                              run_in: Optional[str]=None,
+                              owner: Optional[Any]=None) -> SEL:
+        """
+        Register a function as the action of a native control.
+
+        Args:
+            caller (Union[NSMenuItem, NSButton, UIButton]): The native control.
+            action (Callable): The function to be called when the control is activated.
+            run_in (Optional[str], optional): Where the action runs: None to run it in the main thread,
+                'thread' to run it in the App's thread pool or 'process' to run a `ProcessAction`
+                in the App's process pool, disabling the control meanwhile. Defaults to None.
+            owner (Optional[Any], optional): The view of the control, whose `enabled` state is given back
+                to the control once a 'thread' or 'process' action finishes. Defaults to None.
+
+        Raises:
+            InvalidRunInError: `run_in` is not a supported value.
+
+        Returns:
+            SEL: The selector to be set as the control's action.
+        """
+        if run_in == 'thread':
+            action = ThreadActionRunner(action, caller, owner, self.action_metrics)
+        elif run_in == 'process':
+            action = ProcessActionRunner(action, caller, owner, self.action_metrics)
+        elif run_in is not None:
+            raise InvalidRunInError(run_in)
+
+        self._store_action(caller, action)
         return SEL('actionProxy:')
     
-    def register_async_action(self, caller: Union[NSMenuItem, NSButton, UIButton], action: Callable) -> SEL:
-        self._async_actions[caller] = action
+    def register_async_action(self, caller: Union[NSMenuItem, NSButton, UIButton],
+                                    action: Callable,
+                                    policy: Optional[ActionPolicy]=None) -> SEL:
+        """
+        Register a coroutine function as the action of a native control.
+
+        Args:
+            caller (Union[NSMenuItem, NSButton, UIButton]): The native control.
+            action (Callable): The coroutine function to be run when the control is activated.
+            policy (Optional[ActionPolicy], optional): How runs overlapping a previous one are handled.
+                Defaults to running every activation in parallel.
+
+        Returns:
+            SEL: The selector to be set as the control's action.
+        """
+        self._store_action(caller, AsyncActionRunner(action, policy, self.action_metrics, caller))
         return SEL('actionProxyAsync:')
 
+    def unregister_action(self, caller: Union[NSMenuItem, NSButton, UIButton]) -> None:
+        """
+        Forget the action registered for a native control.
+
+        Args:
+            caller (Union[NSMenuItem, NSButton, UIButton]): The native control.
+        """
+        self.unregister_actions((caller,))
+
+    def unregister_actions(self, callers: Iterable[Union[NSMenuItem, NSButton, UIButton]]) -> None:
+        """
+        Forget the actions registered for several native controls at once.
+
+        Args:
+            callers (Iterable[Union[NSMenuItem, NSButton, UIButton]]): The native controls.
+        """
+        for caller in callers:
+            # other native objects, such as constraints, have no tag
+            tag = getattr(caller, 'tag', 0)
+            if self._actions.owns(tag):
+                action = self._actions.get(tag)
+                if isinstance(action, (AsyncActionRunner, ThreadActionRunner)):
+                    action.cancel()
+
+                self._actions.remove(tag)
+                caller.tag = 0
+
+    def cancel_actions(self, callers: Iterable[Union[NSMenuItem, NSButton, UIButton]]) -> None:
+        """
+        Cancel the running and queued actions of several native controls,
+        keeping them registered.
+
+        Args:
+            callers (Iterable[Union[NSMenuItem, NSButton, UIButton]]): The native controls.
+        """
+        for caller in callers:
+            action = self._actions.get(getattr(caller, 'tag', 0))
+            if isinstance(action, (AsyncActionRunner, ThreadActionRunner)):
+                action.cancel()
+
     def invoke_action(self, caller: Union[NSMenuItem, NSButton, UIButton]):
-        action = self._actions.get(caller)
-        try_call(action)
+        action = self._actions.get(caller.tag)
+        if isinstance(action, ThreadActionRunner):
+            # the UI thread only submits the action
+            action()
+        elif action:
+            self.action_metrics.run(action, action_label(action, caller))
+
+    def trigger_action(self, caller: Union[NSMenuItem, NSButton, UIButton]):
+        runner = self._actions.get(caller.tag)
+        if runner:
+            runner.trigger()
 
     async def invoke_action_async(self, caller: Union[NSMenuItem, NSButton, UIButton]):
-        action = self._async_actions.get(caller)
-        await try_call_async(action)
+        runner = self._actions.get(caller.tag)
+        if runner:
+            await self.action_metrics.run_async(runner.action, perf_counter(), action_label(runner.action, caller))
 
     def quit(self):
+        if self.stall_detector:
+            self.stall_detector.stop()
+
+        if self._process_executor:
+            self._process_executor.shutdown(wait=False)
+
+        if self._process_manager:
+            self._process_manager.shutdown()
+
         if _MACOS:
             NSApp.terminate_(None)
 
@@ -231,22 +557,50 @@ class StatusBarApp(App):
     An `App` that may use a button in the Operating System's Status Bar
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, background_construction: bool = False) -> None:
         """
         Initialize a new `StatusBarApp` instance.
+
+        Args:
+            background_construction (bool, optional): When running with `run_async`, evaluate the
+                `body` method in a worker thread. Defaults to False.
         """
         if _IOS:
             raise NotSupportedError()
 
-        super().__init__()
+        super().__init__(background_construction=background_construction)
         self.status_bar_icon = NSStatusBar.systemStatusBar.statusItemWithLength_(-1.)
 
 
+def _set_current_app(app: App) -> None:
+    global _current_app
+    _current_app = app
+
+    while _waiting_for_app:
+        _waiting_for_app.pop(0)(app)
+
+
+def call_when_app_available(fn: Callable[[App], None]) -> None:
+    """
+    Call `fn` with the current `App`, right away if there is one, otherwise as soon as an App runs.
+    It is used internally by components that can be created before the App. Do not call it directly.
+
+    Args:
+        fn (Callable[[App], None]): Function called with the App.
+    """
+    app = get_current_app()
+    if app:
+        fn(app)
+    else:
+        _waiting_for_app.append(fn)
+
+
 def get_current_app() -> App:
     """
-    Return the current running `App` instance.
+    Return the current running `App` instance, or the `App` building
+    the view tree in the current context.
 
     Returns:
         App: Current running `App` instance.
     """
-    return _current_app
+    return _building_app.get() or _current_app
@@ -1,4 +1,8 @@
-from typing import Any, Callable, Tuple
+import threading
+
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple
 from uuid import uuid4
 from pydispatch import dispatcher
 from abc import ABC, abstractmethod
@@ -9,16 +13,103 @@ from .errors import (
 )
 
 
+# `@bindable` values read while a partial view evaluates its body, keyed by property and instance
+_tracked_dependencies: 'ContextVar[Optional[Dict[Tuple[int, int], Tuple[Bindable, Any, Any]]]]' = \
+    ContextVar('applepy_tracked_dependencies', default=None)
+
+
+def track_dependencies(fn: Callable[[], Any]) -> Tuple[Any, Dict[Tuple[int, int], Tuple['Bindable', Any, Any]]]:
+    """
+    Call `fn` while recording every `@bindable` property read through an instance.
+    It is used internally for rendering the components. Do not call it directly.
+
+    Args:
+        fn (Callable[[], Any]): Function to be called.
+
+    Returns:
+        Tuple[Any, Dict[Tuple[int, int], Tuple[Bindable, Any, Any]]]: The result of `fn` and the
+            `(bindable, instance, value)` of each property it read.
+    """
+    dependencies = {}
+    token = _tracked_dependencies.set(dependencies)
+    try:
+        return fn(), dependencies
+    finally:
+        _tracked_dependencies.reset(token)
+
+
+class EmitTimer:
+    """
+    Accumulates the time spent delivering signals, i.e. updating bindings and native views.
+    It is used internally by the action metrics. Do not create it directly.
+    """
+
+    def __init__(self) -> None:
+        self.elapsed = 0.
+        self._depth = 0
+
+
+# timer of the action running in the current context
+_emit_timer: 'ContextVar[Optional[EmitTimer]]' = ContextVar('applepy_emit_timer', default=None)
+
+
+def measure_emits(fn: Callable[[], Any]) -> Tuple[Any, EmitTimer]:
+    """
+    Call `fn` while measuring the time spent in the signals it emits.
+    It is used internally by the action metrics. Do not call it directly.
+
+    Args:
+        fn (Callable[[], Any]): Function to be called.
+
+    Returns:
+        Tuple[Any, EmitTimer]: The result of `fn` and the timer.
+    """
+    timer = EmitTimer()
+    token = _emit_timer.set(timer)
+    try:
+        return fn(), timer
+    finally:
+        _emit_timer.reset(token)
+
+
 class Signal: 
     def __init__(self) -> None:
         self._id = uuid4().hex
 
     def emit(self, event=None) -> None:
-        dispatcher.send(self._id, dispatcher.Anonymous, event=event)
+        if threading.current_thread() is not threading.main_thread():
+            from .app import get_current_app
+
+            # views can only be updated from the main thread
+            app = get_current_app()
+            if app:
+                app.call_on_ui_thread(self.emit, event)
+                return
+
+        timer = _emit_timer.get()
+        if timer is None or timer._depth:
+            # signals emitted by handlers are part of the outermost emit
+            dispatcher.send(self._id, dispatcher.Anonymous, event=event)
+            return
+
+        timer._depth += 1
+        started = perf_counter()
+        try:
+            dispatcher.send(self._id, dispatcher.Anonymous, event=event)
+        finally:
+            timer.elapsed += perf_counter() - started
+            timer._depth -= 1
 
     def connect(self, callback) -> None:
         dispatcher.connect(callback, sender=dispatcher.Anonymous, signal=self._id, weak=False)
 
+    def disconnect(self, callback) -> None:
+        try:
+            dispatcher.disconnect(callback, sender=dispatcher.Anonymous, signal=self._id, weak=False)
+        except KeyError:
+            # not connected
+            pass
+
 
 class BindableMixin:
     bindable = None
@@ -47,7 +138,7 @@ class Bindable(property):
         type_ = kwargs.get('type_')
         if not args and (not type_ or not isinstance(type_, type)
                          or not (issubclass(type_, BindableMixin)
-                             or type_ in [int, float, str, bool])):
+                             or type_ in [int, float, str, bool, list])):
             raise Exception('Invalid bindable type')
 
         if type_:
@@ -60,12 +151,20 @@ class Bindable(property):
     def __get__(self, *args, **kwargs) -> Any:
         res = super().__get__(*args, **kwargs)
 
+        dependencies = _tracked_dependencies.get()
+        if dependencies is not None and args and args[0] is not None and not isinstance(res, Bindable):
+            dependencies[(id(self), id(args[0]))] = (self, args[0], res)
+
         if res is None:
             return None
 
         if isinstance(res, Bindable):
             return res
 
+        if self.type_ == list:
+            # lists are returned as they are, so they cannot know their bindable
+            return res
+
         if self.type_ == int:
             res = wrapped_int(res)
         elif self.type_ == float:
@@ -0,0 +1,67 @@
+import asyncio
+
+from time import perf_counter
+from typing import AsyncIterator, Callable, Iterable, Optional, Sized, TypeVar, Union
+
+from .binding import AbstractBinding
+
+
+T = TypeVar('T')
+
+
+async def chunked(iterable: Iterable[T],
+                  per_tick_ms: float=8.,
+                  progress: Optional[Union[AbstractBinding, Callable[[float], None]]]=None,
+                  total: Optional[int]=None) -> AsyncIterator[T]:
+    """
+    Iterate over `iterable` in slices of at most `per_tick_ms`, giving the event loop back
+    between slices, so that populating or updating thousands of views from an async action
+    keeps the App responsive. Requires the App to be started with `run_async`.
+    Example:
+    >>>async def load(self):
+           async for row in chunked(rows, progress=Binding(Model.progress, self)):
+               self.items.append(row)
+
+    Args:
+        iterable (Iterable[T]): The items to be iterated over.
+        per_tick_ms (float, optional): How long each slice may keep the main thread busy, in milliseconds.
+            Defaults to 8.
+        progress (Optional[Union[AbstractBinding, Callable[[float], None]]], optional): Binding assigned,
+            or function called, after each slice with the percentage of items processed, or with the number
+            of items processed when the total is unknown. Defaults to None.
+        total (Optional[int], optional): Number of items, when `iterable` has no length. Defaults to None.
+
+    Yields:
+        T: The items of `iterable`.
+    """
+    if total is None and isinstance(iterable, Sized):
+        total = len(iterable)
+
+    done = reported = 0
+    deadline = perf_counter() + per_tick_ms / 1000.
+
+    for item in iterable:
+        yield item
+        done += 1
+
+        if perf_counter() >= deadline:
+            _report(progress, done, total)
+            reported = done
+            await asyncio.sleep(0)
+            deadline = perf_counter() + per_tick_ms / 1000.
+
+    if done != reported or not done:
+        _report(progress, done, total)
+
+
+def _report(progress: Optional[Union[AbstractBinding, Callable[[float], None]]],
+            done: int,
+            total: Optional[int]) -> None:
+    if progress is None:
+        return
+
+    value = done * 100. / total if total else float(done)
+    if isinstance(progress, AbstractBinding):
+        progress.value = value
+    else:
+        progress(value)
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+
+
+# native delegate address -> the view or scene that owns it. Delegate classes are shared by
+# every instance of a control, so their methods use this map to find the Python object to call.
+# The owner is kept alive until it is disposed, as its native object still calls the delegate:
+# a window nobody else refers to must keep answering its callbacks while it is open.
+_owners: Dict[int, Any] = {}
+
+
+def create_delegate(delegate_class: Any, owner: Any) -> Any:
+    """
+    Instantiate a shared delegate class on behalf of `owner`, which is kept alive
+    until the delegate is released.
+    It is used internally for rendering the components. Do not call it directly.
+
+    Args:
+        delegate_class (Any): The `NSObject` subclass shared by every instance of the control.
+        owner (Any): The view or scene that receives the delegate's callbacks.
+
+    Returns:
+        Any: The new delegate.
+    """
+    delegate = delegate_class.alloc().init()
+    _owners[delegate.ptr.value] = owner
+    return delegate
+
+
+def get_owner(delegate: Any) -> Optional[Any]:
+    """
+    Return the view or scene that owns a delegate.
+    It is used internally for rendering the components. Do not call it directly.
+
+    Args:
+        delegate (Any): A delegate created with `create_delegate`.
+
+    Returns:
+        Optional[Any]: The owner, or None if it was released.
+    """
+    return _owners.get(delegate.ptr.value)
+
+
+def release_delegate(delegate: Any) -> None:
+    """
+    Forget the owner of a delegate, so its callbacks are ignored from now on.
+    It is used internally for rendering the components. Do not call it directly.
+
+    Args:
+        delegate (Any): A delegate created with `create_delegate`.
+    """
+    _owners.pop(delegate.ptr.value, None)
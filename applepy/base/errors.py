@@ -33,3 +33,13 @@ class InvalidBindingTransformError(ViewParsingError):
 class InvalidBindingExpressionError(ViewParsingError):
     def __init__(self, message: str) -> None:
         super().__init__(message)
+
+
+class DuplicateKeyError(ViewParsingError):
+    def __init__(self, key) -> None:
+        super().__init__(f'Duplicate key in ForEach items: {key!r}')
+
+
+class InvalidRunInError(ApplepyException):
+    def __init__(self, run_in) -> None:
+        super().__init__(f'Invalid run_in value: {run_in!r}.')
@@ -0,0 +1,163 @@
+import heapq
+import logging
+
+from inspect import isgenerator
+from itertools import count
+from time import perf_counter
+from typing import Callable, Generator, List, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+class IdleTask:
+    """
+    IdleTask
+    A function, or a generator resumed step by step, queued with `App.run_when_idle`.
+    """
+
+    def __init__(self, fn: Union[Callable, Generator], budget_ms: float, priority: int) -> None:
+        """
+        Initialize a new `IdleTask`.
+        It is used internally by `IdleQueue`. Do not create it directly.
+
+        Args:
+            fn (Union[Callable, Generator]): The function or generator to be run.
+            budget_ms (float): How long the task may keep the main thread busy in each tick, in milliseconds.
+            priority (int): Tasks with higher priority run first.
+        """
+        self.fn = fn
+        self.budget_ms = budget_ms
+        self.priority = priority
+        self.cancelled = False
+        self.done = False
+
+    def cancel(self) -> None:
+        """
+        Remove the task from the queue. A generator is closed before its next step.
+        """
+        self.cancelled = True
+
+    def step(self) -> None:
+        """
+        Run the task's next step: the whole function, or the generator until its next `yield`.
+        It is used internally by `IdleQueue`. Do not call it directly.
+        """
+        if isgenerator(self.fn):
+            try:
+                next(self.fn)
+            except StopIteration:
+                self.done = True
+            return
+
+        res = self.fn()
+        if isgenerator(res):
+            # a generator function, resumed in the following steps
+            self.fn = res
+        else:
+            self.done = True
+
+    def close(self) -> None:
+        if isgenerator(self.fn):
+            self.fn.close()
+
+
+class IdleQueue:
+    """
+    IdleQueue
+    A priority queue of tasks that only runs while the main thread has no pending events.
+    """
+
+    def __init__(self, has_pending_events: Callable[[], bool],
+                       request_tick: Callable[[float], None]) -> None:
+        """
+        Initialize a new `IdleQueue`.
+        It is used internally by `App`. Do not create it directly.
+
+        Args:
+            has_pending_events (Callable[[], bool]): Whether the main thread has user input or other events to process.
+            request_tick (Callable[[float], None]): Schedules a call to `tick` in the main thread after a delay in seconds.
+        """
+        self._has_pending_events = has_pending_events
+        self._request_tick = request_tick
+        self._heap: List[Tuple[int, int, IdleTask]] = []
+        self._sequence = count()
+        self._tick_requested = False
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, task in self._heap if not task.cancelled)
+
+    def add(self, fn: Union[Callable, Generator], budget_ms: float, priority: int) -> IdleTask:
+        """
+        Queue a task to run the next time the main thread is idle.
+
+        Args:
+            fn (Union[Callable, Generator]): The function, generator function or generator to be run.
+            budget_ms (float): How long the task may keep the main thread busy in each tick, in milliseconds.
+            priority (int): Tasks with higher priority run first.
+
+        Returns:
+            IdleTask: Handle that can cancel the task.
+        """
+        task = IdleTask(fn, budget_ms, priority)
+        self._push(task)
+        self._schedule(0.)
+        return task
+
+    def _push(self, task: IdleTask) -> None:
+        heapq.heappush(self._heap, (-task.priority, next(self._sequence), task))
+
+    def _peek(self) -> Optional[IdleTask]:
+        while self._heap:
+            task = self._heap[0][2]
+            if not task.cancelled:
+                return task
+
+            heapq.heappop(self._heap)
+            task.close()
+
+        return None
+
+    def _schedule(self, delay: float) -> None:
+        if not self._tick_requested:
+            self._tick_requested = True
+            self._request_tick(delay)
+
+    def tick(self) -> None:
+        """
+        Run queued tasks until their budget is spent or events are waiting, and schedule the next tick.
+        It is used internally by `App`. Do not call it directly.
+        """
+        self._tick_requested = False
+
+        task = self._peek()
+        if not task:
+            return
+
+        if self._has_pending_events():
+            # let the run loop handle the events first
+            self._schedule(.01)
+            return
+
+        # the task at the head of the queue sets the budget of the whole tick
+        deadline = perf_counter() + task.budget_ms / 1000.
+        while task:
+            # taken out of the heap while it runs, since it may queue other tasks
+            heapq.heappop(self._heap)
+            try:
+                task.step()
+            except Exception:
+                logger.exception('Idle task %r failed.', task.fn)
+                task.done = True
+
+            if not task.done:
+                # tasks with the same priority take turns, one step each
+                self._push(task)
+
+            if perf_counter() >= deadline or self._has_pending_events():
+                break
+
+            task = self._peek()
+
+        if self._peek():
+            self._schedule(0.)
@@ -0,0 +1,43 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(package: str,
+                 namespace: Dict[str, Any],
+                 exports: Iterable[Tuple[str, Iterable[str]]]) -> Tuple[Callable[[str], Any],
+                                                                        Callable[[], List[str]],
+                                                                        List[str]]:
+    """
+    Build the PEP 562 `__getattr__` and `__dir__` of a package whose public names are only
+    imported the first time they are used, so an App only pays for the components it touches:
+
+    >>> __getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), [
+            ('.text', ('Label', 'TextField')),
+        ])
+
+    Args:
+        package (str): The package's `__name__`.
+        namespace (Dict[str, Any]): The package's `globals()`, where resolved names are cached.
+        exports (Iterable[Tuple[str, Iterable[str]]]): Pairs of a module, relative to the package,
+            and the names it provides.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]: The package's `__getattr__`,
+            `__dir__` and `__all__`.
+    """
+    origins = {name: module for module, names in exports for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+        value = getattr(import_module(module, package), name)
+        # cached as a regular global, so the import only runs once per name
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__, list(origins)
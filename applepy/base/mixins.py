@@ -1,24 +1,255 @@
-from typing import Optional, Tuple, List, Callable
-from inspect import getmembers
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Callable
 
+from ..backend import _MACOS, _IOS
+from ..backend.bridge import forget
 from .errors import UnsuportedParentError
-from .app import get_current_app, StackMixin
-from .utils import Attachable
+from .scope import current_scope
+from .binding import AbstractBinding
+from .delegates import release_delegate
+from .utils import get_attachable
+
+if _MACOS:
+    from ..backend.app_kit import ObjCInstance
+
+if _IOS:
+    from ..backend.ui_kit import ObjCInstance
+
+
+class StackMixin:
+    """
+    StackMixin
+    Mixin that adds a `list` variable to the target class and methods to handle
+    it as a Stack data structure.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the `StackMixin`.
+        """    
+        self._stack: list = []
+        # elements already popped and parsed, kept for disposal
+        self._children: list = []
+
+    def stack(self, child: Any) -> None:
+        """
+        Add a child element to the top of the stack.
+
+        Args:
+            child (Any): Child element to be added to stack.
+        """        
+        self._stack.append(child)
+
+    def pop(self) -> Any:
+        """
+        Remove and return the last element in the stack.
+
+        Returns:
+            Any: Item removed from the stack.
+        """        
+        return self._stack.pop()
+
+    def pop_first(self) -> Any:
+        """
+        Remove and return the first element in the stack.
+
+        Returns:
+            Any: Item removed from the stack.
+        """        
+        return self._stack.pop(0)
+
+    def get(self) -> Any:
+        """
+        Return the last element in the stack without removing it.
+
+        Returns:
+            Any: Last item in the stack.
+        """        
+        return self._stack[-1] if len(self._stack) > 0 else None
+
+    def is_stacked(self, ptr: Any) -> bool:
+        """
+        Checks whether the provided object has been stacked already.
+
+        Args:
+            ptr (Any): Pointer to be object to be checked.
+
+        Returns:
+            bool: True is pointer has alsready been stacked. False otherwise.
+        """        
+        return ptr in self._stack
+
+
+class Disposable:
+    """
+    Disposable
+    Mixin that releases the resources held by a parsed view tree.
+    """
+
+    _disposed = False
+
+    def dispose(self) -> None:
+        """
+        Release the resources held by this element and its whole subtree: registered
+        actions are forgotten, bindings are disconnected, constraints are deactivated,
+        delegates are detached and native objects are dropped. The elements cannot be
+        used anymore after being disposed.
+        """
+        from .app import get_current_app
+
+        nodes = self._subtree()
+        for node in nodes:
+            node._disposed = True
+
+        native_objects = []
+        for node in nodes:
+            native_objects.extend(node._release())
+
+        app = get_current_app()
+        if app:
+            app.unregister_actions(native_objects)
+
+    def cancel_actions(self) -> None:
+        """
+        Cancel the running and queued actions of this element and its whole subtree.
+        """
+        from .app import get_current_app
+
+        app = get_current_app()
+        if app:
+            app.cancel_actions(value for node in self._subtree()
+                                     for value in vars(node).values() if isinstance(value, ObjCInstance))
+
+    def _subtree(self) -> List[Any]:
+        nodes = []
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            if not node._disposed:
+                nodes.append(node)
+                pending.extend(node._disposable_children())
+
+        return nodes
+
+    def _disposable_children(self) -> Iterable[Any]:
+        # views built but never parsed are still waiting in the stack
+        return (*getattr(self, '_children', ()), *getattr(self, '_stack', ()))
+
+    def _constraints(self) -> Iterable[Any]:
+        return (getattr(self, '_width_constraint', None),
+                getattr(self, '_height_constraint', None),
+                getattr(self, '_grab_constraint', None),
+                *(getattr(self, '_activated_constraints', None) or ()))
+
+    def _release(self) -> List[Any]:
+        state = vars(self)
+
+        for name, value in list(state.items()):
+            if name.startswith('bound_') and isinstance(value, AbstractBinding):
+                handler = getattr(self, f'_on_{name[len("bound_"):]}_changed', None)
+                if handler:
+                    value.on_changed.disconnect(handler)
+                del state[name]
+
+        for constraint in self._constraints():
+            if constraint:
+                constraint.active = False
+
+        if state.get('_controller'):
+            release_delegate(state['_controller'])
+            if self.ns_object:
+                self.ns_object.delegate = None
+
+        native_objects = []
+        for name, value in state.items():
+            if isinstance(value, ObjCInstance):
+                forget(value)
+                native_objects.append(value)
+                state[name] = None
+
+        if '_activated_constraints' in state:
+            state['_activated_constraints'] = None
+        state.pop('_modifiers', None)
+        if '_stack' in state:
+            state['_stack'] = []
+            state['_children'] = []
+
+        return native_objects
+
+
+class Modifier(NamedTuple):
+    """
+    A pending write of a value or a binding to a property of a view,
+    applied when the view is parsed.
+    """
+    target: str
+    value: Any
+    apply: Optional[Callable[[Any, Any], None]] = None
 
 
 class Modifiable:
+    # most views have no modifiers, so the dictionary is only allocated by the first `modify` call
+    _modifiers: Mapping[str, Modifier] = MappingProxyType({})
+
     def __init__(self) -> None:
-        self._modifiers: List[Callable] = []
+        pass
+
+    @property
+    def modifiers(self) -> Tuple[Modifier]:
+        """
+        The modifiers registered on this view, in the order they will be applied.
+        """
+        return tuple(self._modifiers.values())
+
+    def modify(self, target: str, value: Any, apply: Optional[Callable[[Any, Any], None]]=None):
+        """
+        Register a modifier for the `target` property. A later write to the same
+        target supersedes the previous one and moves it to the end of the pipeline.
+        It is used internally by the `set_*` methods.
+
+        Args:
+            target (str): Name of the property to modify.
+            value (Any): Value or binding to assign.
+            apply (Optional[Callable[[Any, Any], None]], optional): Custom function called
+                with the view and the value instead of the default property assignment.
+                Defaults to None.
+        """
+        modifiers: Dict[str, Modifier] = self.__dict__.setdefault('_modifiers', {})
+        modifiers.pop(target, None)
+        modifiers[target] = Modifier(target, value, apply)
+
+        return self
+
+    def reapply(self, *targets: str) -> None:
+        """
+        Apply again the modifiers of the given targets, or all of them if none is given.
+
+        Args:
+            *targets (str): Names of the properties to reapply.
+        """
+        for modifier in self._modifiers.values():
+            if not targets or modifier.target in targets:
+                self._apply_modifier(modifier)
+
+    def _apply_modifier(self, modifier: Modifier) -> None:
+        if modifier.apply:
+            modifier.apply(self, modifier.value)
+        elif isinstance(modifier.value, AbstractBinding):
+            setattr(self, f'bound_{modifier.target}', modifier.value)
+            modifier.value.on_changed.connect(getattr(self, f'_on_{modifier.target}_changed'))
+            setattr(self, modifier.target, modifier.value.value)
+        else:
+            setattr(self, modifier.target, modifier.value)
 
     def parse(self):
-        for modifier in self._modifiers:
-            modifier()
+        for modifier in self._modifiers.values():
+            self._apply_modifier(modifier)
 
 
 class ChildMixin:
     def __init__(self, valid_parent_types: Optional[Tuple[type]]=None) -> None:
-        self.parent = get_current_app().get()
-        
+        self.parent = current_scope()
+
         if valid_parent_types:
             if not isinstance(self.parent, valid_parent_types):
                 raise UnsuportedParentError(type(self), type(self.parent))
@@ -26,13 +257,8 @@ class ChildMixin:
 
 class AttachableMixin(ChildMixin):
     def parse(self):
-        attachable = getmembers(type(self.parent), lambda x: isinstance(x, Attachable) and isinstance(self, x.type_))
-        if any(attachable):
-            if len(attachable) > 1:
-                raise Exception('More than one attachable found for a single attachment type.')
-
-            name, _ = attachable[0]
-
+        name = get_attachable(type(self.parent), type(self))
+        if name:
             attached = getattr(self.parent, name)
 
             if attached is not None and type(attached) != list:
@@ -2,11 +2,11 @@ from abc import ABC, abstractmethod
 from typing import Optional, Union, Tuple
 
 from .view import View
-from .mixins import StackMixin, ChildMixin
-from .app import get_current_app
+from .mixins import StackMixin, ChildMixin, Disposable
+from .scope import push_scope, pop_scope
 
 
-class Scene(ABC, StackMixin, ChildMixin):
+class Scene(ABC, StackMixin, ChildMixin, Disposable):
     def __init__(self, valid_parent_types: Optional[Tuple[type]]=None) -> None:
         StackMixin.__init__(self)
         ChildMixin.__init__(self, valid_parent_types)
@@ -21,18 +21,21 @@ class Scene(ABC, StackMixin, ChildMixin):
 
     @abstractmethod
     def parse(self):
+        # views stack their body when they are built, so the elements are parsed as they are
         while self._stack:
             el: Union[Scene, View] = self.pop_first()
-            el.body().parse()
+            el.parse()
+            self._children.append(el)
 
     @property
     def ns_object(self):
         return self.get_ns_object()
 
     def __enter__(self):
-        # register itself in the App's stack
-        get_current_app().stack(self)
+        # open a builder scope for its children
+        push_scope(self)
         return self
 
     def __exit__(self, type, value, traceback):
-        pass
\ No newline at end of file
+        # close its builder scope
+        pop_scope()
\ No newline at end of file
@@ -0,0 +1,201 @@
+import heapq
+import logging
+import threading
+
+from collections import deque
+from itertools import count
+from time import monotonic
+from typing import Callable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class TimerHandle:
+    """
+    TimerHandle
+    A callback scheduled in a `TimerScheduler`.
+    """
+
+    def __init__(self, scheduler: 'TimerScheduler',
+                       deadline: float,
+                       callback: Callable,
+                       tolerance: float=0.) -> None:
+        """
+        Initialize a new `TimerHandle`.
+        It is used internally by `TimerScheduler`. Do not create it directly.
+
+        Args:
+            scheduler (TimerScheduler): The scheduler that owns the handle.
+            deadline (float): `time.monotonic` value at which the callback is due.
+            callback (Callable): Function to be delivered when the deadline is reached.
+            tolerance (float, optional): How many seconds after `deadline` the callback may be delivered. Defaults to 0.
+        """
+        self.deadline = deadline
+        self.tolerance = tolerance
+        self.callback = callback
+        self.cancelled = False
+        self._scheduler = scheduler
+
+    @property
+    def latest(self) -> float:
+        """
+        The last moment at which the callback may be delivered.
+
+        Returns:
+            float: `time.monotonic` value of the end of the handle's window.
+        """
+        return self.deadline + self.tolerance
+
+    def cancel(self) -> None:
+        """
+        Prevent the callback from being delivered, if it was not yet.
+        """
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._cancelled()
+
+
+class TimerScheduler:
+    """
+    TimerScheduler
+    Keeps every timer of the App in a single heap, watched by a single thread.
+    Due callbacks are handed to a delivery function, usually `App.call_on_ui_thread`.
+
+    Each timer may be delivered anywhere between its deadline and the end of its tolerance.
+    The thread only wakes up when the earliest window closes, and then delivers every timer
+    whose window has already opened, so timers with overlapping windows share a single wakeup.
+    """
+
+    def __init__(self, deliver: Callable[..., None]) -> None:
+        """
+        Initialize a new `TimerScheduler`. Its thread is started with the first timer.
+
+        Args:
+            deliver (Callable[..., None]): Called from the scheduler thread with a function and its arguments,
+                once per wakeup, to run the due callbacks.
+        """
+        self._deliver = deliver
+        # the same handles, ordered by deadline and by the end of their window
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._latest: List[Tuple[float, int, TimerHandle]] = []
+        self._sequence = count()
+        self._live = 0
+        self._wakeups = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return self._live
+
+    @property
+    def wakeups_per_minute(self) -> int:
+        """
+        How many times the scheduler woke up to deliver timers in the last minute.
+
+        Returns:
+            int: Number of wakeups in the last 60 seconds.
+        """
+        with self._condition:
+            self._forget_wakeups(monotonic())
+            return len(self._wakeups)
+
+    def call_later(self, delay: float, callback: Callable, tolerance: float=0.) -> TimerHandle:
+        """
+        Schedule `callback` to be delivered after `delay` seconds.
+
+        Args:
+            delay (float): Delay in seconds.
+            callback (Callable): Function to be delivered.
+            tolerance (float, optional): How many seconds late the callback may be delivered,
+                so it can share a wakeup with other timers. Defaults to 0.
+
+        Returns:
+            TimerHandle: Handle that can cancel the callback.
+        """
+        return self.call_at(monotonic() + delay, callback, tolerance)
+
+    def call_at(self, deadline: float, callback: Callable, tolerance: float=0.) -> TimerHandle:
+        """
+        Schedule `callback` to be delivered at a `time.monotonic` deadline.
+
+        Args:
+            deadline (float): Deadline, as a `time.monotonic` value.
+            callback (Callable): Function to be delivered.
+            tolerance (float, optional): How many seconds late the callback may be delivered,
+                so it can share a wakeup with other timers. Defaults to 0.
+
+        Returns:
+            TimerHandle: Handle that can cancel the callback.
+        """
+        handle = TimerHandle(self, deadline, callback, max(tolerance, 0.))
+
+        with self._condition:
+            sequence = next(self._sequence)
+            heapq.heappush(self._heap, (handle.deadline, sequence, handle))
+            heapq.heappush(self._latest, (handle.latest, sequence, handle))
+            self._live += 1
+
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name='applepy-timers', daemon=True)
+                self._thread.start()
+            elif self._latest[0][2] is handle:
+                # the new timer closes first, the thread must wake up sooner
+                self._condition.notify()
+
+        return handle
+
+    def _cancelled(self) -> None:
+        with self._condition:
+            self._live -= 1
+
+            # drop cancelled entries once they are the majority of the heaps
+            if len(self._latest) > 2 * self._live:
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                self._latest = [entry for entry in self._latest if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                heapq.heapify(self._latest)
+
+    def _forget_wakeups(self, now: float) -> None:
+        while self._wakeups and self._wakeups[0] <= now - 60.:
+            self._wakeups.popleft()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    while self._latest and self._latest[0][2].cancelled:
+                        heapq.heappop(self._latest)
+
+                    if not self._latest:
+                        self._condition.wait()
+                        continue
+
+                    timeout = self._latest[0][0] - monotonic()
+                    if timeout <= 0:
+                        break
+
+                    self._condition.wait(timeout)
+
+                now = monotonic()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, handle = heapq.heappop(self._heap)
+                    if not handle.cancelled:
+                        # keeps the handle from being counted as a pending cancellation
+                        handle.cancelled = True
+                        self._live -= 1
+                        due.append(handle.callback)
+
+                self._wakeups.append(now)
+                self._forget_wakeups(now)
+
+            self._deliver(_deliver_all, due)
+
+
+def _deliver_all(callbacks: List[Callable]) -> None:
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception('Timer callback %r failed.', callback)
@@ -0,0 +1,51 @@
+from contextvars import ContextVar
+from typing import Any, Tuple
+
+
+# containers currently being built, innermost last. A tuple is used so that
+# every thread and every asyncio task works on its own copy of the scope.
+_builder_scope: 'ContextVar[Tuple[Any, ...]]' = ContextVar('applepy_builder_scope', default=())
+
+
+def push_scope(container: Any) -> None:
+    """
+    Open a builder scope, making `container` the parent of the views created next
+    in the current context.
+    It is used internally for rendering the components. Do not call it directly.
+
+    Args:
+        container (Any): The `Scene` or `StackedView` being built.
+    """
+    _builder_scope.set(_builder_scope.get() + (container,))
+
+
+def pop_scope() -> Any:
+    """
+    Close the innermost builder scope of the current context.
+    It is used internally for rendering the components. Do not call it directly.
+
+    Returns:
+        Any: The container whose scope was closed.
+    """
+    scope = _builder_scope.get()
+    _builder_scope.set(scope[:-1])
+    return scope[-1]
+
+
+def current_scope() -> Any:
+    """
+    Return the container that receives the views created in the current context.
+
+    Returns:
+        Any: The innermost `Scene` or `StackedView` being built, or None.
+    """
+    scope = _builder_scope.get()
+    return scope[-1] if scope else None
+
+
+def reset_scope() -> None:
+    """
+    Start an empty builder scope in the current context.
+    It is used internally for rendering the components. Do not call it directly.
+    """
+    _builder_scope.set(())
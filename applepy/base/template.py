@@ -0,0 +1,309 @@
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .errors import UnsuportedParentError
+from .scope import current_scope
+from .binding import AbstractBinding, Binding, BindingExpression
+from .scene import Scene
+from .view import View, PartialView
+
+
+class ViewTemplate:
+    """
+    A cached view tree that can be stamped out several times.
+    """
+
+    def __init__(self, body: Callable[..., Any]) -> None:
+        """
+        Wrap a function that builds a `Scene` or a `View` so that its full construction
+        only runs once. The first call evaluates `body` normally and keeps a pristine copy
+        of the resulting tree. Further calls copy that tree instead of evaluating `body`
+        again, re-targeting every binding whose instance is one of the call arguments.
+        Calls whose plain arguments, such as strings or numbers, differ from the recorded
+        ones evaluate `body` again and keep a copy of the new tree instead, as the copied
+        tree holds the recorded values.
+        Prefer the `@template` decorator over instantiating it directly.
+
+        Args:
+            body (Callable[..., Any]): Function that builds and returns a `Scene` or a `View`.
+        """
+        self._body = body
+        self._prototype = None
+        self._args = None
+        self._kwargs = None
+        self._nodes = None
+        self._plans = {}
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if self._prototype is None:
+            res = self._body(*args, **kwargs)
+            self._args = args
+            self._kwargs = kwargs
+            self._prototype = _TreeCloner(res, {}).clone(res)
+            self._nodes = _TreeCloner(self._prototype, {}).nodes
+            return res
+
+        return self._stamp(args, kwargs)
+
+    def clear(self) -> None:
+        """
+        Drop the cached tree, so the next call evaluates the template's body again.
+        """
+        self._prototype = None
+        self._args = None
+        self._kwargs = None
+        self._nodes = None
+        self._plans = {}
+
+    def _stamp(self, args: tuple, kwargs: dict) -> Any:
+        if len(args) != len(self._args) or kwargs.keys() != self._kwargs.keys():
+            raise TypeError('A template must always be called with the same arguments.')
+
+        if not (all(_same_value(old, new) for old, new in zip(self._args, args)) and
+                all(_same_value(self._kwargs[k], v) for k, v in kwargs.items())):
+            # plain values are copied as they are, only objects can be re-targeted
+            self.clear()
+            return self(*args, **kwargs)
+
+        memo = {id(old): new for old, new in zip(self._args, args)}
+        memo.update({id(self._kwargs[k]): v for k, v in kwargs.items()})
+
+        cloner = _TreeCloner(self._prototype, memo, self._nodes, self._plans)
+        res = cloner.clone(self._prototype)
+        cloner.connect()
+
+        # attach the new tree exactly as its construction would have done
+        res.parent = current_scope()
+        if isinstance(res, View):
+            if res.parent is None:
+                raise UnsuportedParentError(type(res), type(None))
+            res.parent.stack(res)
+
+        return res
+
+
+# most attributes of a view are plain values, returned as they are without further checks
+_IMMUTABLE = frozenset((str, int, float, bool, type(None), bytes, complex))
+
+# type -> the kind of copy its values need, or None when they are shared as they are
+_kinds: Dict[type, Optional[type]] = {}
+
+
+def _kind_of(value_type: type) -> Optional[type]:
+    try:
+        return _kinds[value_type]
+    except KeyError:
+        pass
+
+    if issubclass(value_type, Binding):
+        kind = Binding
+    elif issubclass(value_type, BindingExpression):
+        kind = BindingExpression
+    elif issubclass(value_type, MethodType):
+        kind = MethodType
+    elif issubclass(value_type, FunctionType):
+        kind = FunctionType
+    elif value_type in (list, tuple, set) or (issubclass(value_type, tuple) and hasattr(value_type, '_fields')):
+        kind = list
+    elif value_type is dict:
+        kind = dict
+    else:
+        kind = None
+
+    _kinds[value_type] = kind
+    return kind
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    # arguments that are values rather than objects must be equal to the recorded ones
+    if type(old) in _IMMUTABLE or type(new) in _IMMUTABLE:
+        return type(old) is type(new) and old == new
+
+    if type(old) is tuple and type(new) is tuple:
+        return len(old) == len(new) and all(_same_value(o, n) for o, n in zip(old, new))
+
+    return True
+
+
+def _make_cell(value: Any) -> Any:
+    # types.CellType can only be instantiated from Python 3.8 on
+    return (lambda: value).__closure__[0]
+
+
+class _TreeCloner:
+    def __init__(self, root: Any,
+                       memo: Dict[int, Any],
+                       nodes: Optional[Dict[int, Any]]=None,
+                       plans: Optional[Dict[int, Tuple[str, ...]]]=None) -> None:
+        self._memo = dict(memo)
+        self._clones = []
+        # prototype node id -> names of the attributes that have to be copied, the others are shared
+        self._plans = {} if plans is None else plans
+
+        if nodes is None:
+            self._nodes: Dict[int, Any] = {}
+            self._collect(root)
+        else:
+            self._nodes = nodes
+
+    @property
+    def nodes(self) -> Dict[int, Any]:
+        return self._nodes
+
+    def _collect(self, node: Any) -> None:
+        self._nodes[id(node)] = node
+        for child in getattr(node, '_stack', []):
+            if isinstance(child, (View, Scene)) and id(child) not in self._nodes:
+                self._collect(child)
+
+    def _is_shared(self, value: Any) -> bool:
+        return type(value) in _IMMUTABLE or (_kind_of(type(value)) is None and
+                                             id(value) not in self._memo and
+                                             id(value) not in self._nodes)
+
+    def _plan(self, key: int, state: Dict[str, Any]) -> Tuple[str, ...]:
+        try:
+            return self._plans[key]
+        except KeyError:
+            plan = self._plans[key] = tuple(k for k, v in state.items() if not self._is_shared(v))
+            return plan
+
+    def clone(self, value: Any, fresh: bool=False) -> Any:
+        if type(value) in _IMMUTABLE:
+            return value
+
+        key = id(value)
+        if key in self._memo:
+            return self._memo[key]
+
+        if key in self._nodes:
+            res = object.__new__(type(value))
+            self._memo[key] = res
+            state = value.__dict__.copy()
+            plan = self._plan(key, state)
+            self._clones.append((res, plan))
+            for name in plan:
+                state[name] = self.clone(state[name], True)
+            res.__dict__ = state
+            return res
+
+        kind = _kind_of(type(value))
+        if kind is None:
+            return value
+
+        if kind is Binding:
+            instance = self.clone(value.instance)
+            transforms = [self.clone(t) for t in value.transforms]
+            if instance is value.instance and all(n is o for n, o in zip(transforms, value.transforms)):
+                return value
+
+            res = Binding(value.bindable, instance)
+            res.transforms = transforms
+            self._memo[key] = res
+            return res
+
+        if kind is BindingExpression:
+            expression = self.clone(value.expression)
+            bindables = [(b, self.clone(i)) for b, i in value.bindables]
+            if expression is value.expression and all(n is o for (_, n), (_, o) in zip(bindables, value.bindables)):
+                return value
+
+            res = BindingExpression(expression, *bindables)
+            self._memo[key] = res
+            return res
+
+        if kind is MethodType:
+            instance = self.clone(value.__self__)
+            return value if instance is value.__self__ else MethodType(value.__func__, instance)
+
+        if kind is FunctionType:
+            if not value.__closure__:
+                return value
+
+            cells = tuple(self._clone_cell(c) for c in value.__closure__)
+            if all(n is o for n, o in zip(cells, value.__closure__)):
+                return value
+
+            res = FunctionType(value.__code__,
+                               value.__globals__,
+                               value.__name__,
+                               value.__defaults__,
+                               cells)
+            res.__kwdefaults__ = value.__kwdefaults__
+            self._memo[key] = res
+            return res
+
+        # containers that belong to a view are always copied, other containers only when
+        # they hold something that had to be cloned
+        if kind is list:
+            items = [self.clone(i) for i in value]
+            if not fresh and all(n is o for n, o in zip(items, value)):
+                return value
+            return type(value)._make(items) if hasattr(value, '_fields') else type(value)(items)
+
+        items = {k: self.clone(v) for k, v in value.items()}
+        if not fresh and all(items[k] is v for k, v in value.items()):
+            return value
+        return items
+
+    def _clone_cell(self, cell: Any) -> Any:
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # empty cell
+            return cell
+
+        res = self.clone(contents)
+        return cell if res is contents else _make_cell(res)
+
+    def connect(self) -> None:
+        # bindings passed to initializers are connected during construction
+        for clone, plan in self._clones:
+            for name in plan:
+                value = clone.__dict__[name]
+                if name.startswith('bound_') and isinstance(value, AbstractBinding):
+                    handler = getattr(clone, f'_on_{name[len("bound_"):]}_changed', None)
+                    if handler:
+                        value.on_changed.connect(handler)
+
+            if isinstance(clone, PartialView):
+                # the copied dependencies point to the new instances, keyed like `track_dependencies` does
+                clone._dependencies = {(id(b), id(i)): (b, i, v) for b, i, v in clone._dependencies.values()}
+                clone._connected_signals = {}
+
+                if any(b.fget(i) != v for b, i, v in clone._dependencies.values()):
+                    # the copied body was built from other values
+                    clone._stack.clear()
+                    clone._evaluate()
+                else:
+                    clone._connect_dependencies()
+
+
+def template(body: Callable[..., Any]) -> ViewTemplate:
+    """
+    Cache the view tree built by a function, so it can be stamped out cheaply
+    many times, such as document windows or inspectors:
+
+    >>> @template
+        def document_window(document: Document) -> Window:
+            with Window(title=Binding(Document.name, document), size=Size(640, 480)) as w:
+                with VerticalStack():
+                    TextField(text=Binding(Document.content, document))
+                return w
+
+    >>> document_window(Document('a.txt')).parse()
+    >>> document_window(Document('b.txt')).parse()
+
+    Bindings are re-targeted by identity, so every instance that differs between windows
+    must be received as an argument of the decorated function. Values read from those
+    instances while building, rather than through a `Binding`, keep the first call's values.
+    Plain arguments, such as strings or numbers, cannot be re-targeted: a call that passes
+    different ones evaluates the function again and caches the new tree instead.
+
+    Args:
+        body (Callable[..., Any]): Function that builds and returns a `Scene` or a `View`.
+
+    Returns:
+        ViewTemplate: The cached template.
+    """
+    return ViewTemplate(body)
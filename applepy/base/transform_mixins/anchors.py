@@ -1,9 +1,15 @@
 from typing import Union
 
 from ..binding import AbstractBinding, bindable
+from ...backend.bridge import send
 
 
 class Width:
+    # class level defaults, only overridden in the instances that change them
+    _width = -1
+    _width_constraint = None
+    bound_width = None
+
     @bindable(int)
     def width(self) -> int:
         return self._width
@@ -14,8 +20,7 @@ class Width:
         self._set_width_constraint(val)
 
     def __init__(self) -> None:
-        self._width = -1
-        self._width_constraint = None
+        pass
 
     def _set_width_constraint(self, val: int) -> None:
         if val > 0:
@@ -23,29 +28,26 @@ class Width:
                 self._width_constraint.active = False
 
             self.ns_object.translatesAutoresizingMaskIntoConstraints = False
-            self._width_constraint = self.ns_object.widthAnchor.constraintEqualToConstant(val)
+            self._width_constraint = send(send(self.ns_object, 'widthAnchor'), 'constraintEqualToConstant:', val)
             self._width_constraint.active = True
-        else:
+        elif self._width_constraint:
             self._width_constraint.active = False
 
     def _on_width_changed(self, signal, sender, event):
         self.width = self.bound_width.value
 
     def fixed_width(self, width: Union[int, AbstractBinding]):
-        def __modifier():
-            if isinstance(width, AbstractBinding):
-                self.bound_width = width
-                self.bound_width.on_changed.connect(self._on_width_changed)
-                self.width = width.value
-            else:
-                self.width = width
-
-        self._modifiers.append(__modifier)
+        self.modify('width', width)
 
         return self
 
 
 class Height:
+    # class level defaults, only overridden in the instances that change them
+    _height = -1
+    _height_constraint = None
+    bound_height = None
+
     @bindable(int)
     def height(self) -> int:
         return self._height
@@ -56,8 +58,7 @@ class Height:
         self._set_height_constraint(val)
 
     def __init__(self) -> None:
-        self._height = -1
-        self._height_constraint = None
+        pass
 
     def _set_height_constraint(self, val: int) -> None:
         if val > 0:
@@ -65,23 +66,15 @@ class Height:
                 self._height_constraint.active = False
 
             self.ns_object.translatesAutoresizingMaskIntoConstraints = False
-            self._height_constraint = self.ns_object.heightAnchor.constraintEqualToConstant(val)
+            self._height_constraint = send(send(self.ns_object, 'heightAnchor'), 'constraintEqualToConstant:', val)
             self._height_constraint.active = True
-        else:
+        elif self._height_constraint:
             self._height_constraint.active = False
 
     def _on_height_changed(self, signal, sender, event):
         self.height = self.bound_height.value
 
     def fixed_height(self, height: Union[int, AbstractBinding]):
-        def __modifier():
-            if isinstance(height, AbstractBinding):
-                self.bound_height = height
-                self.bound_height.on_changed.connect(self._on_height_changed)
-                self.height = height.value
-            else:
-                self.height = height
-
-        self._modifiers.append(__modifier)
+        self.modify('height', height)
 
         return self
\ No newline at end of file
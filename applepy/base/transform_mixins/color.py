@@ -3,6 +3,7 @@ from typing import Union
 from ..types import Color
 from ..binding import AbstractBinding
 from ...backend import _MACOS, _IOS
+from ...backend.bridge import set_property
 
 
 class BackgroundColor:
@@ -13,7 +14,7 @@ class BackgroundColor:
     @background_color.setter
     def background_color(self, val: Color) -> None:
         self._background_color = val
-        self.ns_object.backgroundColor = val.value
+        set_property(self.ns_object, 'backgroundColor', val.value)
 
     def __init__(self) -> None:
         if _MACOS:
@@ -26,20 +27,14 @@ class BackgroundColor:
         self._background_color = self.bound_background_color.value
 
     def set_background_color(self, background_color: Union[Color, AbstractBinding]):
-        def __modifier():
-            if isinstance(background_color, AbstractBinding):
-                self.bound_background_color = background_color
-                self.bound_background_color.on_changed.connect(self._on_background_color_changed)
-                self.background_color = background_color.value
-            else:
-                self.background_color = background_color
-
-        self._modifiers.append(__modifier)
+        self.modify('background_color', background_color)
 
         return self
 
 
 class AlphaValue:
+    _alpha_value = 1.
+
     @property
     def alpha_value(self) -> float:
         return self._alpha_value
@@ -47,24 +42,16 @@ class AlphaValue:
     @alpha_value.setter
     def alpha_value(self, val: float) -> None:
         self._alpha_value = val
-        self.ns_object.alphaValue = val
+        set_property(self.ns_object, 'alphaValue', val)
 
     def __init__(self) -> None:
-        self._alpha_value = 1.
+        pass
 
-    def _on_alpha_value_color_changed(self, signal, sender, event):
+    def _on_alpha_value_changed(self, signal, sender, event):
         self._alpha_value = self.bound_alpha_value.value
 
     def set_alpha_value(self, alpha_value: Union[float, AbstractBinding]):
-        def __modifier():
-            if isinstance(alpha_value, AbstractBinding):
-                self.bound_alpha_value = alpha_value
-                self.bound_alpha_value.on_changed.connect(self._on_alpha_value_changed)
-                self.alpha_value = alpha_value.value
-            else:
-                self.alpha_value = alpha_value
-
-        self._modifiers.append(__modifier)
+        self.modify('alpha_value', alpha_value)
 
         return self
 
@@ -77,23 +64,15 @@ class HasShadow:
     @has_shadow.setter
     def has_shadow(self, val: bool) -> None:
         self._has_shadow = val
-        self.ns_object.hasShadow = val
+        set_property(self.ns_object, 'hasShadow', val)
 
     def __init__(self) -> None:
         self._has_shadow = 1.
 
-    def _on_has_shadow_color_changed(self, signal, sender, event):
+    def _on_has_shadow_changed(self, signal, sender, event):
         self._has_shadow = self.bound_has_shadow.value
 
     def set_has_shadow(self, has_shadow: Union[bool, AbstractBinding]):
-        def __modifier():
-            if isinstance(has_shadow, AbstractBinding):
-                self.bound_has_shadow = has_shadow
-                self.bound_has_shadow.on_changed.connect(self._on_has_shadow_changed)
-                self.has_shadow = has_shadow.value
-            else:
-                self.has_shadow = has_shadow
-
-        self._modifiers.append(__modifier)
+        self.modify('has_shadow', has_shadow)
 
         return self
@@ -1,6 +1,7 @@
 from typing import Union, Optional, Tuple, Callable
 
 from ...backend import _MACOS, _IOS
+from ...backend.bridge import set_property
 from ...base.types import Color, Image, ImagePosition
 from ...base.utils import try_call
 from ...base.errors import NotSupportedError
@@ -12,6 +13,8 @@ if _IOS:
 
 
 class TitledControl(TransformMixin):
+    bound_title = None
+
     @bindable(str)
     def title(self) -> str:
         return self._title
@@ -35,25 +38,19 @@ class TitledControl(TransformMixin):
     def _set(self) -> None:
         if self.ns_object:
             if _MACOS:
-                self.ns_object.title = self._title
+                set_property(self.ns_object, 'title', self._title)
 
             if _IOS:
                 self.ns_object.setTitle_forState_(self._title, UIControlState.UIControlStateNormal)
 
     def set_title(self, title: Union[str, AbstractBinding]):
-        def __modifier():
-            if isinstance(title, AbstractBinding):
-                self.bound_title = title
-                self.bound_title.on_changed.connect(self._on_title_changed)
-                self.title = title.value
-            else:
-                self.title = title
-
-        self._modifiers.append(__modifier)
+        self.modify('title', title)
 
         return self
     
 class SubtitledControl(TransformMixin):
+    bound_subtitle = None
+
     @bindable(str)
     def subtitle(self) -> str:
         return self._subtitle
@@ -77,26 +74,20 @@ class SubtitledControl(TransformMixin):
     def _set(self) -> None:
         if self.ns_object:
             if _MACOS:
-                self.ns_object.subtitle = self.subtitle
+                set_property(self.ns_object, 'subtitle', self.subtitle)
 
             if _IOS:
                 raise NotSupportedError()
 
     def set_subtitle(self, subtitle: Union[str, AbstractBinding]):
-        def __modifier():
-            if isinstance(subtitle, AbstractBinding):
-                self.bound_subtitle = subtitle
-                self.bound_subtitle.on_changed.connect(self._on_subtitle_changed)
-                self.subtitle = subtitle.value
-            else:
-                self.subtitle = subtitle
-
-        self._modifiers.append(__modifier)
+        self.modify('subtitle', subtitle)
 
         return self
     
 
 class ControlWithLabel(TransformMixin):
+    bound_label = None
+
     @bindable(str)
     def label(self) -> str:
         return self._label
@@ -123,26 +114,21 @@ class ControlWithLabel(TransformMixin):
     def _set(self) -> None:
         if self.ns_object:
             if _MACOS:
-                self.ns_object.label = self.label
+                set_property(self.ns_object, 'label', self.label)
 
             if _IOS:
                 raise NotSupportedError()
 
     def set_label(self, label: Union[str, AbstractBinding]):
-        def __modifier():
-            if isinstance(label, AbstractBinding):
-                self.bound_label = label
-                self.bound_label.on_changed.connect(self._on_label_changed)
-                self.label = label.value
-            else:
-                self.label = label
-
-        self._modifiers.append(__modifier)
+        self.modify('label', label)
 
         return self
 
 
 class Placeholder(TransformMixin):
+    _placeholder = None
+    bound_placeholder = None
+
     @bindable(str)
     def placeholder(self) -> Optional[str]:
         return self._placeholder
@@ -153,29 +139,23 @@ class Placeholder(TransformMixin):
         Placeholder._set(self)
 
     def __init__(self) -> None:
-        self._placeholder = None
+        pass
 
     def _on_placeholder_changed(self, signal, sender, event):
         self.placeholder = self.bound_placeholder.value
 
     def _set(self) -> None:
-        self.ns_object.placeholderString = self.placeholder
+        set_property(self.ns_object, 'placeholderString', self.placeholder)
 
     def set_placeholder(self, placeholder: Union[Optional[str], AbstractBinding]):
-        def __modifier():
-            if isinstance(placeholder, AbstractBinding):
-                self.bound_placeholder = placeholder
-                self.bound_placeholder.on_changed.connect(self._on_placeholder_changed)
-                self.placeholder = placeholder.value
-            else:
-                self.placeholder = placeholder
-
-        self._modifiers.append(__modifier)
+        self.modify('placeholder', placeholder)
 
         return self
 
 
 class ControlWithState(TransformMixin):
+    bound_state = None
+
     @bindable(int)
     def state(self) -> int:
         return self._state
@@ -192,23 +172,17 @@ class ControlWithState(TransformMixin):
         self.state = self.bound_state.value
 
     def _set(self) -> None:
-        self.ns_object.state = self._state
+        set_property(self.ns_object, 'state', self._state)
 
     def set_state(self, state: Union[int, AbstractBinding]):
-        def __modifier():
-            if isinstance(state, AbstractBinding):
-                self.bound_state = state
-                self.bound_state.on_changed.connect(self._on_state_changed)
-                self.state = state.value
-            else:
-                self.state = state
-
-        self._modifiers.append(__modifier)
+        self.modify('state', state)
 
         return self
 
 
 class BezelColor(TransformMixin):
+    bound_bezel_color = None
+
     @bindable(Color)
     def bezel_color(self) -> Color:
         return self._bezel_color
@@ -227,26 +201,20 @@ class BezelColor(TransformMixin):
 
     def _set(self) -> None:
         if _MACOS:
-            self.ns_object.bezelColor = self.bezel_color.value
+            set_property(self.ns_object, 'bezelColor', self.bezel_color.value)
 
     def set_bezel_color(self, bezel_color: Union[Color, AbstractBinding]):
         if _IOS:
             raise NotSupportedError()
 
-        def __modifier():
-            if isinstance(bezel_color, AbstractBinding):
-                self.bound_bezel_color = bezel_color
-                self.bound_bezel_color.on_changed.connect(self._on_bezel_color_changed)
-                self.bezel_color = bezel_color.value
-            else:
-                self.bezel_color = bezel_color
-
-        self._modifiers.append(__modifier)
+        self.modify('bezel_color', bezel_color)
 
         return self
     
 
 class TintColor(TransformMixin):
+    bound_tint_color = None
+
     @bindable(Color)
     def tint_color(self) -> Color:
         return self._tint_color
@@ -265,26 +233,20 @@ class TintColor(TransformMixin):
 
     def _set(self) -> None:
         if _IOS:
-            self.ns_object.tintColor = self.tint_color.value
+            set_property(self.ns_object, 'tintColor', self.tint_color.value)
 
     def set_tint_color(self, tint_color: Union[Color, AbstractBinding]):
         if _MACOS:
             raise NotSupportedError()
 
-        def __modifier():
-            if isinstance(tint_color, AbstractBinding):
-                self.bound_tint_color = tint_color
-                self.bound_tint_color.on_changed.connect(self._on_tint_color_changed)
-                self.tint_color = tint_color.value
-            else:
-                self.tint_color = tint_color
-
-        self._modifiers.append(__modifier)
+        self.modify('tint_color', tint_color)
 
         return self
 
 
 class KeyBindable(TransformMixin):
+    bound_key_equivalent = None
+
     @bindable(str)
     def key_equivalent(self) -> str:
         return self._key_equivalent
@@ -301,23 +263,17 @@ class KeyBindable(TransformMixin):
         self.key_equivalent = self.bound_key_equivalent.value
 
     def _set(self) -> None:
-        self.ns_object.keyEquivalent = self.key_equivalent or ''
+        set_property(self.ns_object, 'keyEquivalent', self.key_equivalent or '')
 
     def set_key_equivalent(self, key_equivalent: Union[str, AbstractBinding]):
-        def __modifier():
-            if isinstance(key_equivalent, AbstractBinding):
-                self.bound_key_equivalent = key_equivalent
-                self.bound_key_equivalent.on_changed.connect(self._on_key_equivalent_changed)
-                self.key_equivalent = key_equivalent.value
-            else:
-                self.key_equivalent = key_equivalent
-
-        self._modifiers.append(__modifier)
+        self.modify('key_equivalent', key_equivalent)
 
         return self
 
 
 class TextColor(TransformMixin):
+    bound_text_color = None
+
     @bindable(Color)
     def text_color(self) -> Color:
         return self._text_color
@@ -334,24 +290,17 @@ class TextColor(TransformMixin):
         self.text_color = self.bound_text_color.value
 
     def _set(self) -> None:
-        print(self.text_color.value)
-        self.ns_object.textColor = self.text_color.value
+        set_property(self.ns_object, 'textColor', self.text_color.value)
 
     def set_text_color(self, text_color: Union[Color, AbstractBinding]):
-        def __modifier():
-            if isinstance(text_color, AbstractBinding):
-                self.bound_text_color = text_color
-                self.bound_text_color.on_changed.connect(self._on_text_color_changed)
-                self.text_color = text_color.value
-            else:
-                self.text_color = text_color
-
-        self._modifiers.append(__modifier)
+        self.modify('text_color', text_color)
 
         return self
 
 
 class TextControl(TransformMixin):
+    bound_text = None
+
     @bindable(str)
     def text(self) -> str:
         return self._text
@@ -374,23 +323,18 @@ class TextControl(TransformMixin):
 
     def _set(self) -> None:
         if self.ns_object:
-            self.ns_object.stringValue = self.text
+            set_property(self.ns_object, 'stringValue', self.text)
 
     def set_text(self, text: Union[str, AbstractBinding]):
-        def __modifier():
-            if isinstance(text, AbstractBinding):
-                self.bound_text = text
-                self.bound_text.on_changed.connect(self._on_text_changed)
-                self.text = text.value
-            else:
-                self.text = text
-
-        self._modifiers.append(__modifier)
+        self.modify('text', text)
 
         return self
 
 
 class ImageControl(TransformMixin):
+    bound_image = None
+    bound_image_position = None
+
     @bindable(Image)
     def image(self) -> Image:
         return self._image
@@ -455,28 +399,28 @@ class ImageControl(TransformMixin):
     def _set(self) -> None:
         if self.ns_object and self._image:
             try_call(self._before_set, self._image)
-            self.ns_object.image = self._image.value
-            self.ns_object.imagePosition = self._image_position.value
+            set_property(self.ns_object, 'image', self._image.value)
+            set_property(self.ns_object, 'imagePosition', self._image_position.value)
+
+    def _apply_image(self, value: Tuple[Union[Image, AbstractBinding], Union[ImagePosition, AbstractBinding]]) -> None:
+        image, image_position = self.__compute_image_and_position(*value)
+
+        if isinstance(image, AbstractBinding):
+            self.bound_image = image
+            self.bound_image.on_changed.connect(self._on_image_changed)
+            self.image = image.value
+        else:
+            self.image = image
+    
+        if isinstance(image_position, AbstractBinding):
+            self.bound_image_position = image_position
+            self.bound_image_position.on_changed.connect(self._on_image_position_changed)
+            self.image_position = image_position.value
+        else:
+            self.image_position = image_position
 
     def set_image(self, image: Union[Image, AbstractBinding]='',
                         image_position: Union[ImagePosition, AbstractBinding]=ImagePosition.no_image):
-        def __modifier():
-            image, image_position = self.__compute_image_and_position(image, image_position)
-
-            if isinstance(image, AbstractBinding):
-                self.bound_image = image
-                self.bound_image.on_changed.connect(self._on_image_changed)
-                self.image = image.value
-            else:
-                self.image = image
-        
-            if isinstance(image_position, AbstractBinding):
-                self.bound_image_position = image_position
-                self.bound_image_position.on_changed.connect(self._on_image_position_changed)
-                self.image_position = image_position.value
-            else:
-                self.image_position = image_position
-
-        self._modifiers.append(__modifier)
+        self.modify('image', (image, image_position), ImageControl._apply_image)
 
         return self
@@ -2,12 +2,15 @@ from typing import Union, Optional
 from rubicon.objc.types import NSEdgeInsets
 
 from ...backend import _MACOS, _IOS
+from ...backend.bridge import set_property
 from ..types import Padding, Alignment
 from ..binding import AbstractBinding, bindable
 from .base import TransformMixin
 
 
 class LayoutSpacing(TransformMixin):
+    bound_spacing = None
+
     @bindable(float)
     def spacing(self) -> float:
         return self._spacing
@@ -24,23 +27,17 @@ class LayoutSpacing(TransformMixin):
         self._spacing = self.bound_spacing.value
 
     def _set(self) -> None:
-        self.ns_object.spacing = self.spacing
+        set_property(self.ns_object, 'spacing', self.spacing)
 
     def set_spacing(self, spacing: Union[float, AbstractBinding]):
-        def __modifier():
-            if isinstance(spacing, AbstractBinding):
-                self.bound_spacing = spacing
-                self.bound_spacing.on_changed.connect(self._on_spacing_changed)
-                self.spacing = spacing.value
-            else:
-                self.spacing = spacing
-
-        self._modifiers.append(__modifier)
+        self.modify('spacing', spacing)
 
         return self
 
 
 class LayoutPadding(TransformMixin):
+    bound_padding = None
+
     @bindable(Padding)
     def padding(self) -> Padding:
         return self._padding
@@ -63,20 +60,14 @@ class LayoutPadding(TransformMixin):
                                                  self.padding.top)
 
     def set_padding(self, padding: Optional[Union[Padding, AbstractBinding]]=Padding(10., 10., 10., 10.)):
-        def __modifier():
-            if isinstance(padding, AbstractBinding):
-                self.bound_padding = padding
-                self.bound_padding.on_changed.connect(self._on_padding_changed)
-                self.padding = padding.value
-            else:
-                self.padding = padding
-
-        self._modifiers.append(__modifier)
+        self.modify('padding', padding)
 
         return self
 
 
 class LayoutAlignment(TransformMixin):
+    bound_alignment = None
+
     @bindable(Alignment)
     def alignment(self) -> Alignment:
         return self._alignment
@@ -100,17 +91,9 @@ class LayoutAlignment(TransformMixin):
         self._alignment = self.bound_alignment.value
 
     def _set(self) -> None:
-        self.ns_object.alignment = self.alignment
+        set_property(self.ns_object, 'alignment', self.alignment)
 
     def set_alignment(self, alignment: Union[Alignment, AbstractBinding]):
-        def __modifier():
-            if isinstance(alignment, AbstractBinding):
-                self.bound_alignment = alignment
-                self.bound_alignment.on_changed.connect(self._on_alignment_changed)
-                self.alignment = alignment.value
-            else:
-                self.alignment = alignment
-
-        self._modifiers.append(__modifier)
+        self.modify('alignment', alignment)
 
         return self
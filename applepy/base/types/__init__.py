@@ -7,3 +7,5 @@ from .date import Date
 from .progress import ProgressStyle
 from .button import ButtonStyle
 from .toolbar import ToolbarDisplayMode, ToolbarStyle, ToolbarItemSystemIdentifier
+from .action import Concurrency, ActionPolicy
+from .timer import TimerOverrun
@@ -0,0 +1,22 @@
+from typing import NamedTuple, Optional
+from enum import Enum
+
+
+class Concurrency(Enum):
+    # Every click starts a new run, up to `max_concurrency` runs at the same time.
+    parallel = 0
+
+    # Clicks are ignored while the action is running.
+    drop = 1
+
+    # Clicks wait for the running action to finish, up to `max_queue` pending clicks.
+    queue = 2
+
+    # A click cancels the running action and starts it again.
+    restart = 3
+
+
+class ActionPolicy(NamedTuple):
+    concurrency: Concurrency = Concurrency.parallel
+    max_concurrency: Optional[int] = None
+    max_queue: Optional[int] = None
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class TimerOverrun(Enum):
+    # Missed ticks are dropped, the timer waits for its next tick.
+    skip = 0
+
+    # Missed ticks are merged into a single tick, run as soon as possible.
+    coalesce = 1
+
+    # Every missed tick is run, one after another, until the timer is back on schedule.
+    catch_up = 2
@@ -1,4 +1,5 @@
-from typing import Optional, Callable, Any
+from functools import lru_cache
+from typing import Dict, Optional, Callable, Any
 
 
 def try_call(fn: Optional[Callable], *args, **kwargs) -> Any:
@@ -39,3 +40,46 @@ def attachable(type_: type):
         return Attachable(target, *args, **kwargs)
 
     return decorator
+
+
+@lru_cache(maxsize=None)
+def get_attachables(parent_type: type) -> Dict[str, Attachable]:
+    """
+    Index the attachable properties of a class, following its MRO so that an
+    attribute redefined in a subclass hides the one of its bases.
+
+    Args:
+        parent_type (type): Class of the parent view.
+
+    Returns:
+        Dict[str, Attachable]: Attachable properties by attribute name.
+    """
+    res = {}
+    for cls in parent_type.__mro__:
+        for name, value in vars(cls).items():
+            if name not in res:
+                res[name] = value
+
+    return {name: value for name, value in res.items() if isinstance(value, Attachable)}
+
+
+@lru_cache(maxsize=None)
+def get_attachable(parent_type: type, child_type: type) -> Optional[str]:
+    """
+    Return the name of the attachable property of `parent_type` that accepts
+    instances of `child_type`. The lookup is computed once per pair of classes.
+
+    Args:
+        parent_type (type): Class of the parent view.
+        child_type (type): Class of the attached view.
+
+    Returns:
+        Optional[str]: Name of the attachable property, or None if there is none.
+    """
+    attachables = [name for name, value in get_attachables(parent_type).items()
+                   if issubclass(child_type, value.type_)]
+
+    if len(attachables) > 1:
+        raise Exception('More than one attachable found for a single attachment type.')
+
+    return attachables[0] if attachables else None
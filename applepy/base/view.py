@@ -1,24 +1,33 @@
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, Union, Tuple
+from typing import Optional, Union, Tuple
 
-from .app import get_current_app
-from .mixins import StackMixin, Modifiable, ChildMixin
-from ..base.binding import AbstractBinding, bindable
+from .scope import current_scope, push_scope, pop_scope
+from .mixins import StackMixin, Modifiable, ChildMixin, Disposable
+from ..base.binding import AbstractBinding, bindable, track_dependencies
+from ..base.types import Orientation, StackDistribution
 from ..base.transform_mixins import Width, Height
 from ..backend import _MACOS, _IOS
+from ..backend.bridge import send, set_property
 
 if _MACOS:
-    from ..backend.app_kit import NSView, UIView
+    from ..backend.app_kit import NSView, UIView, NSStackView, UIStackView
 
 if _IOS:
-    from ..backend.ui_kit import NSView, UIView
+    from ..backend.ui_kit import NSView, UIView, NSStackView, UIStackView
 
 
 class View(ABC,
            Modifiable,
            ChildMixin,
+           Disposable,
            Width,
            Height):
+    # state that most views never change is kept at class level
+    _tooltip = None
+    _grab_constraint = None
+    _activated_constraints = None
+    bound_tooltip = None
+
     @bindable(str)
     def tooltip(self) -> Optional[str]:
         # does iOS have tooltip?
@@ -27,15 +36,10 @@ class View(ABC,
     @tooltip.setter
     def tooltip(self, val: Optional[str]) -> None:
         self._tooltip = val
-        self.ns_object.toolTip = val
+        set_property(self.ns_object, 'toolTip', val)
 
     def __init__(self, valid_parent_types: Optional[Tuple[type]]=None) -> None:
-        self.parent = get_current_app().get()
-        self._modifiers: List[Callable] = []
-
-        self._tooltip = None
-        self._grab_constraint = None
-        self._activated_constraints = None
+        self.parent = current_scope()
 
         if not valid_parent_types:
             from ..base.scene import Scene
@@ -46,10 +50,15 @@ class View(ABC,
         Width.__init__(self)
         Height.__init__(self)
 
+        self._stack_in_parent()
+
+    def _stack_in_parent(self) -> None:
         # register itself in parent's stack
         # TODO: is there a better way to not stack a view with a custom body?
         content = self.body()
-        if not self.parent.is_stacked(content):
+        # a view that is its own body was just created, so it cannot be stacked yet, and
+        # searching a stack of many views would make building it quadratic
+        if content is self or not self.parent.is_stacked(content):
             self.parent.stack(content)
 
     def _add_constraints_to_superview(self):
@@ -74,15 +83,7 @@ class View(ABC,
         self.tooltip = self.bound_tooltip.value
 
     def set_tooltip(self, tooltip: Union[Optional[str], AbstractBinding]=None):
-        def __modifier():
-            if isinstance(tooltip, AbstractBinding):
-                self.bound_tooltip = tooltip
-                self.bound_tooltip.on_changed.connect(self._on_tooltip_changed)
-                self.tooltip = tooltip.value
-            else:
-                self.tooltip = tooltip
-
-        self._modifiers.append(__modifier)
+        self.modify('tooltip', tooltip)
 
         return self
 
@@ -98,23 +99,162 @@ class StackedView(View, StackMixin):
         while self._stack:
             el = self.pop_first()
             el.parse()
+            self._children.append(el)
 
     def __enter__(self):
-        # register itself in the App's stack
-        get_current_app().stack(self)
+        # open a builder scope for its children
+        push_scope(self)
         return self
 
     def __exit__(self, type, value, traceback):
-        # unregister itself in the App's stack
-        get_current_app().pop()
+        # close its builder scope
+        pop_scope()
+
 
+class PartialView(StackedView):
+    """ A component with its own body, rendered again alone when the values it reads change. """
 
-class PartialView(View):
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, valid_parent_types: Optional[Tuple[type]]=None) -> None:
+        """
+        Create a new `PartialView`. Subclasses build their content in the `body` method,
+        which is evaluated when the view is created and again whenever one of the
+        `@bindable` properties read by it changes. Only the partial view's own subtree is
+        rebuilt, the rest of the window is left untouched:
 
-    def get_ns_object(self):
-        return super().get_ns_object()
+        >>> class Counter(PartialView):
+                def __init__(self, vm: ViewModel) -> None:
+                    self.vm = vm
+                    super().__init__()
 
-    def parse(self):
-        return super().parse()
+                def body(self):
+                    for i in range(self.vm.count):
+                        Label(text=f'item {i}')
+
+        Properties passed through a `Binding` are not tracked, as the bound views already
+        update themselves.
+
+        Args:
+            valid_parent_types (Optional[Tuple[type]], optional): Types accepted as parent. Defaults to None.
+        """
+        StackedView.__init__(self, valid_parent_types)
+
+        self._stack_view = None
+        self._dependencies = {}
+        self._connected_signals = {}
+
+        self._evaluate()
+
+    def _stack_in_parent(self) -> None:
+        # the body is evaluated in its own scope, after the stack is initialized
+        self.parent.stack(self)
+
+    def body(self):
+        return self
+
+    def _evaluate(self) -> None:
+        push_scope(self)
+        try:
+            _, self._dependencies = track_dependencies(self.body)
+        finally:
+            pop_scope()
+
+        self._connect_dependencies()
+
+    def _connect_dependencies(self) -> None:
+        for bindable, _, _ in self._dependencies.values():
+            if id(bindable.on_changed) not in self._connected_signals:
+                self._connected_signals[id(bindable.on_changed)] = bindable.on_changed
+                bindable.on_changed.connect(self._on_dependency_changed)
+
+    def _on_dependency_changed(self, signal, sender, event):
+        # signals are shared by all instances, so only values read by this view matter
+        if any(bindable.fget(instance) != value for bindable, instance, value in self._dependencies.values()):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Evaluate the body again and replace the partial view's native subviews with the new ones.
+        Does nothing until the view is parsed.
+        """
+        if not self._stack_view:
+            return
+
+        for subview in list(self._stack_view.arrangedSubviews):
+            self._stack_view.removeArrangedSubview_(subview)
+            subview.removeFromSuperview()
+
+        for child in self._children:
+            child.dispose()
+
+        self._children.clear()
+        self._stack.clear()
+        self._evaluate()
+
+        while self._stack:
+            el = self.pop_first()
+            el.parse()
+            self._children.append(el)
+
+    def _release(self) -> list:
+        for signal in self._connected_signals.values():
+            signal.disconnect(self._on_dependency_changed)
+
+        self._connected_signals = {}
+        self._dependencies = {}
+        return StackedView._release(self)
+
+    def get_ns_object(self) -> Union[NSStackView, UIStackView]:
+        """
+        The partial view's NSStackView instance.
+        Do not call it directly, use the ns_object property instead.
+
+        Returns:
+            NSStackView: the partial view's NSStackView instance.
+        """
+        return self._stack_view
+
+    def set_content_view(self, content_view: Union[NSView, UIView]) -> None:
+        send(self._stack_view, 'addArrangedSubview:', content_view)
+
+    def parse(self) -> View:
+        """
+        View's parse method.
+        It is used internally for rendering the components. Do not call it directly.
+
+        Returns:
+            PartialView: self
+        """
+        from ..views.layout import StackView
+        from ..base.scene import Scene
+
+        if _MACOS:
+            self._stack_view = NSStackView.alloc().init()
+            self._stack_view.orientation = Orientation.vertical.value
+            self._stack_view.distribution = StackDistribution.fill.value
+
+        if _IOS:
+            self._stack_view = UIStackView.alloc().init()
+            self._stack_view.axis = Orientation.vertical.value
+            self._stack_view.distribution = StackDistribution.fill.value
+
+        if isinstance(self.parent, StackView):
+            send(self.parent.ns_object, 'addArrangedSubview:', self.ns_object)
+        else:
+            self.parent.set_content_view(self.ns_object)
+
+        if isinstance(self.parent, Scene):
+            # grab parent
+            superview = self._stack_view.superview
+            self._activated_constraints = [
+                self._stack_view.topAnchor.constraintEqualToAnchor(superview.topAnchor),
+                self._stack_view.bottomAnchor.constraintEqualToAnchor(superview.bottomAnchor),
+                self._stack_view.leftAnchor.constraintEqualToAnchor(superview.leftAnchor),
+                self._stack_view.rightAnchor.constraintEqualToAnchor(superview.rightAnchor)
+            ]
+            for constraint in self._activated_constraints:
+                constraint.active = True
+        else:
+            self._add_constraints_to_superview()
+
+        StackedView.parse(self)
+        return self
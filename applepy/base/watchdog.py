@@ -0,0 +1,197 @@
+import logging
+import sys
+import threading
+import traceback
+
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# (filename, line number, function name) of every frame, outermost first
+StackSignature = Tuple[Tuple[str, int, str], ...]
+
+
+class Stall:
+    """
+    Stall
+    The stalls of the main thread that were caught in the same place.
+    """
+
+    def __init__(self, signature: StackSignature, stack: List[str]) -> None:
+        """
+        Initialize a new `Stall`.
+        It is used internally by `StallDetector`. Do not create it directly.
+
+        Args:
+            signature (StackSignature): The frames the main thread was running when it stalled.
+            stack (List[str]): The formatted frames.
+        """
+        self.signature = signature
+        self.stack = stack
+        self.count = 0
+        self.total_ms = 0.
+        self.max_ms = 0.
+
+    @property
+    def mean_ms(self) -> float:
+        """
+        The mean duration of these stalls.
+
+        Returns:
+            float: Mean duration in milliseconds.
+        """
+        return self.total_ms / self.count if self.count else 0.
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def extend(self, reported_ms: float, duration_ms: float) -> None:
+        # a stall is added when caught and extended once it ends
+        self.total_ms += duration_ms - reported_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def __repr__(self) -> str:
+        where = self.signature[-1] if self.signature else ('?', 0, '?')
+        return f'<Stall {where[2]} ({where[0]}:{where[1]}) count={self.count} max={self.max_ms:.0f}ms>'
+
+
+class StallDetector:
+    """
+    StallDetector
+    A watchdog thread that sends heartbeats to the main thread and, when one is not answered
+    within the threshold, captures the Python stack the main thread is running.
+    Stalls are aggregated by stack, so the handlers and bindings that block the UI the most
+    can be found without attaching a profiler.
+    """
+
+    def __init__(self, call_on_ui_thread: Callable[..., None],
+                       threshold_ms: float=250.,
+                       interval_ms: float=100.,
+                       on_stall: Optional[Callable[[Stall, float], None]]=None) -> None:
+        """
+        Initialize a new `StallDetector`. Prefer `App.enable_stall_detector` over creating it directly.
+
+        Args:
+            call_on_ui_thread (Callable[..., None]): Schedules a function to run in the main thread.
+            threshold_ms (float, optional): How long the main thread may take to answer a heartbeat,
+                in milliseconds. Defaults to 250.
+            interval_ms (float, optional): Time between heartbeats, in milliseconds. Defaults to 100.
+            on_stall (Optional[Callable[[Stall, float], None]], optional): Called from the watchdog thread
+                as soon as a stall is caught, with the aggregated stall and how long the main thread
+                has been blocked so far, in milliseconds. The stall's durations are updated when the
+                main thread answers. Defaults to logging a warning.
+        """
+        self.threshold_ms = threshold_ms
+        self.interval_ms = interval_ms
+        self.on_stall = on_stall or _log_stall
+        self._call_on_ui_thread = call_on_ui_thread
+        self._stalls: Dict[StackSignature, Stall] = {}
+        self._lock = threading.Lock()
+        self._answered = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def stalls(self) -> List[Stall]:
+        """
+        The stalls caught so far, the ones that blocked the main thread the longest first.
+
+        Returns:
+            List[Stall]: The aggregated stalls.
+        """
+        with self._lock:
+            return sorted(self._stalls.values(), key=lambda s: s.total_ms, reverse=True)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._thread) and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Start watching the main thread.
+        """
+        if self.running:
+            return
+
+        # every run gets its own event, so a stopped thread never resumes
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run,
+                                        args=(self._stopped,),
+                                        name='applepy-watchdog',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching the main thread.
+        """
+        self._stopped.set()
+        self._answered.set()
+        self._thread = None
+
+    def reset(self) -> None:
+        """
+        Forget the stalls caught so far.
+        """
+        with self._lock:
+            self._stalls.clear()
+
+    def _beat(self) -> None:
+        self._answered.set()
+
+    def _run(self, stopped: threading.Event) -> None:
+        main = threading.main_thread()
+
+        while not stopped.wait(self.interval_ms / 1000.):
+            self._answered.clear()
+            sent = monotonic()
+            self._call_on_ui_thread(self._beat)
+
+            if self._answered.wait(self.threshold_ms / 1000.):
+                continue
+
+            frame = sys._current_frames().get(main.ident)
+            if frame is None:
+                continue
+
+            summary = traceback.extract_stack(frame)
+            del frame
+
+            # reported right away, so a main thread that never answers is reported too
+            reported_ms = (monotonic() - sent) * 1000.
+            stall = self._record(summary, reported_ms)
+
+            # the stall lasts until the heartbeat is finally answered
+            self._answered.wait()
+            if stopped.is_set():
+                return
+
+            duration_ms = (monotonic() - sent) * 1000.
+            with self._lock:
+                stall.extend(reported_ms, duration_ms)
+
+            logger.info('Main thread answered after %.0f ms.', duration_ms)
+
+    def _record(self, summary: traceback.StackSummary, duration_ms: float) -> Stall:
+        signature = tuple((f.filename, f.lineno, f.name) for f in summary)
+
+        with self._lock:
+            stall = self._stalls.get(signature)
+            if not stall:
+                stall = self._stalls[signature] = Stall(signature, summary.format())
+
+            stall.add(duration_ms)
+
+        self.on_stall(stall, duration_ms)
+        return stall
+
+
+def _log_stall(stall: Stall, duration_ms: float) -> None:
+    if stall.count == 1:
+        logger.warning('Main thread stalled for %.0f ms so far in:\n%s', duration_ms, ''.join(stall.stack))
+    else:
+        logger.warning('Main thread stalled for %.0f ms so far in %r', duration_ms, stall)
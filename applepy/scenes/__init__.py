@@ -1,9 +1,12 @@
 from ..backend import _MACOS, _IOS
+from ..base.lazy import lazy_exports
+
+_exports = [('.empty', ('EmptyScene',))]
 
 if _MACOS:
-    from .window import Window
+    _exports.append(('.window', ('Window',)))
 
 if _IOS:
-    from .simple_screen import SimpleScreen
+    _exports.append(('.simple_screen', ('SimpleScreen',)))
 
-from .empty import EmptyScene
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), _exports)
@@ -1,10 +1,9 @@
-from uuid import uuid4
-
 from ..backend import _MACOS, _IOS
 from .. import Scene
 from ..base.errors import AddingMultipleChildrenToNonStackableViewError
 from ..base.mixins import Modifiable
 from ..base.errors import NotSupportedError
+from ..base.delegates import create_delegate, get_owner
 
 if _IOS:
     from ..backend.ui_kit import UIViewController, NSObject, objc_method
@@ -12,6 +11,15 @@ if _MACOS:
     from ..backend.app_kit import UIViewController, NSObject, objc_method
 
 
+if _IOS:
+    class _ViewController(UIViewController):
+        @objc_method
+        def viewDidLoad(self):
+            owner = get_owner(self)
+            if owner:
+                self.view = owner.content_view
+
+
 class SimpleScreen(Scene,
                    Modifiable):
     def __init__(self) -> None:
@@ -31,15 +39,7 @@ class SimpleScreen(Scene,
         return self.view_controller
 
     def parse(self) -> Scene:
-        @objc_method
-        def viewDidLoad(_self):
-            _self.view = self.content_view
-
-        _ViewController = type(f'_ViewController_{uuid4().hex[:8]}', (UIViewController,), {
-            'viewDidLoad': viewDidLoad
-        })
-
-        self.view_controller = _ViewController.alloc().init()
+        self.view_controller = create_delegate(_ViewController, self)
 
         Scene.parse(self)
         Modifiable.parse(self)
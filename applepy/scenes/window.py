@@ -1,7 +1,7 @@
 from typing import Callable, Optional, Union
-from uuid import uuid4
 
 from ..backend import _IOS
+from ..backend.bridge import set_property
 from ..base.errors import (
     AddingMultipleChildrenToNonStackableViewError,
     NotSupportedError
@@ -16,6 +16,7 @@ from ..views.containers import Toolbar
 from ..base.binding import AbstractBinding, bindable
 from ..base.mixins import Modifiable
 from ..base.utils import attachable, try_call
+from ..base.delegates import create_delegate, get_owner
 from ..base.view import View
 from ..base.transform_mixins import (
     BackgroundColor,
@@ -37,6 +38,44 @@ from ..backend.app_kit import (
 )
 
 
+class _WindowDelegate(NSObject):
+    @objc_method
+    def windowWillClose_(self, sender):
+        owner = get_owner(self)
+        if owner:
+            owner._window_will_close()
+
+    @objc_method
+    def windowDidEndLiveResize_(self, notification):
+        owner = get_owner(self)
+        if owner:
+            owner._window_did_resize()
+
+    @objc_method
+    def windowDidMove_(self, notification):
+        owner = get_owner(self)
+        if owner:
+            owner._window_did_move()
+
+    @objc_method
+    def windowWillEnterFullScreen_(self, notification):
+        owner = get_owner(self)
+        if owner:
+            owner._window_full_screen_will_change(True)
+
+    @objc_method
+    def windowWillExitFullScreen_(self, notification):
+        owner = get_owner(self)
+        if owner:
+            owner._window_full_screen_will_change(False)
+
+    @objc_method
+    def windowDidMiniaturize_(self, notification):
+        owner = get_owner(self)
+        if owner:
+            try_call(owner._on_minimized)
+
+
 class Window(Scene,
              Modifiable,
              BackgroundColor,
@@ -100,8 +139,10 @@ class Window(Scene,
     def show_title(self, val: bool) -> None:
         self._show_title = val
         if self.ns_object:
-            self.ns_object.titleVisibility = NSWindowTitleVisibility.NSWindowTitleVisible.value \
-                  if val else NSWindowTitleVisibility.NSWindowTitleHidden.value
+            set_property(self.ns_object,
+                         'titleVisibility',
+                         NSWindowTitleVisibility.NSWindowTitleVisible.value if val
+                         else NSWindowTitleVisibility.NSWindowTitleHidden.value)
             
     @bindable(bool)
     def title_bar_transparent(self) -> bool:
@@ -111,7 +152,7 @@ class Window(Scene,
     def title_bar_transparent(self, val: bool) -> None:
         self._title_bar_transparent = val
         if self.ns_object:
-            self.ns_object.titlebarAppearsTransparent = val
+            set_property(self.ns_object, 'titlebarAppearsTransparent', val)
     
     @bindable(bool)
     def show_toolbar(self) -> bool:
@@ -178,7 +219,8 @@ class Window(Scene,
                  on_resized: Optional[Callable] = None,
                  on_moved: Optional[Callable] = None,
                  on_full_screen_changed: Optional[Callable] = None,
-                 on_minimized: Optional[Callable] = None) -> None:
+                 on_minimized: Optional[Callable] = None,
+                 dispose_on_close: bool = True) -> None:
 
         """
         Add a new `Window` scene, which generates a native MacOS window.
@@ -226,6 +268,9 @@ class Window(Scene,
             on_moved (Optional[Callable], optional): Action to be executed when the window is moved. Defaults to None.
             on_full_screen_changed (Optional[Callable], optional): Action to be executed when the window enters or exits full-screen mode. Defaults to None.
             on_minimized (Optional[Callable], optional): Action to be executed when the window is minimized. Defaults to None.
+            dispose_on_close (bool, optional): Whether the window and all of its views should be disposed after the window closes,
+                releasing their actions, bindings and delegates. Pass False for a window that is shown again after being closed.
+                Defaults to True.
         """
         if _IOS:
             raise NotSupportedError()
@@ -236,48 +281,16 @@ class Window(Scene,
         TitledControl.__init__(self, title)
         SubtitledControl.__init__(self, subtitle)
 
-        @objc_method
-        def windowWillClose_(_self, sender):
-            try_call(on_close)
-
-        @objc_method
-        def windowDidEndLiveResize_(_self, notification):
-            w_rect = self.window.contentRectForFrameRect_(self.window.frame)
-            self.size = Size(int(w_rect.size.width), int(w_rect.size.height))
-            self.position = Point(int(w_rect.origin.x), int(w_rect.origin.y))
-            try_call(on_resized)
-
-        @objc_method
-        def windowDidMove_(_self, notification):
-            w_rect = self.window.contentRectForFrameRect_(self.window.frame)
-            self.position = Point(int(w_rect.origin.x), int(w_rect.origin.y))
-            try_call(on_moved)
-
-        @objc_method
-        def windowWillEnterFullScreen_(_self, notification):
-            self.full_screen = True
-            try_call(on_full_screen_changed)
-
-        @objc_method
-        def windowWillExitFullScreen_(_self, notification):
-            self.full_screen = False
-            try_call(on_full_screen_changed)
-
-        @objc_method
-        def windowDidMiniaturize_(self, notification):
-            try_call(on_minimized)
-
-        _WindowDelegate = type(f'_WindowDelegate_{uuid4().hex[:8]}', (NSObject,), {
-            'windowWillClose_': windowWillClose_,
-            'windowDidEndLiveResize_': windowDidEndLiveResize_,
-            'windowDidMove_': windowDidMove_,
-            'windowWillEnterFullScreen_': windowWillEnterFullScreen_,
-            'windowWillExitFullScreen_': windowWillExitFullScreen_,
-            'windowDidMiniaturize_': windowDidMiniaturize_
-        })
-
         self.window = None
-        self._controller = _WindowDelegate.alloc().init()
+        self._controller = None
+
+        # events
+        self._on_close = on_close
+        self._on_resized = on_resized
+        self._on_moved = on_moved
+        self._on_full_screen_changed = on_full_screen_changed
+        self._on_minimized = on_minimized
+        self._dispose_on_close = dispose_on_close
 
         # bindables
         self._size = size
@@ -329,6 +342,31 @@ class Window(Scene,
         # inferred properties
         self.is_main = False
 
+    def _create_controller(self) -> NSObject:
+        return create_delegate(_WindowDelegate, self)
+
+    def _window_will_close(self) -> None:
+        try_call(self._on_close)
+        if self._dispose_on_close:
+            self.dispose()
+        else:
+            self.cancel_actions()
+
+    def _window_did_resize(self) -> None:
+        w_rect = self.window.contentRectForFrameRect_(self.window.frame)
+        self.size = Size(int(w_rect.size.width), int(w_rect.size.height))
+        self.position = Point(int(w_rect.origin.x), int(w_rect.origin.y))
+        try_call(self._on_resized)
+
+    def _window_did_move(self) -> None:
+        w_rect = self.window.contentRectForFrameRect_(self.window.frame)
+        self.position = Point(int(w_rect.origin.x), int(w_rect.origin.y))
+        try_call(self._on_moved)
+
+    def _window_full_screen_will_change(self, full_screen: bool) -> None:
+        self.full_screen = full_screen
+        try_call(self._on_full_screen_changed)
+
     def _on_show_toolbar_changed(self):
         self.show_toolbar = self.bound_show_toolbar.value
 
@@ -407,6 +445,7 @@ class Window(Scene,
             False
         )
 
+        self._controller = self._create_controller()
         self.window.delegate = self._controller
         self.window.orderFrontRegardless()
         self.window.title = self.title
@@ -443,12 +482,12 @@ class Window(Scene,
         self.content_view = content_view
         self.window.contentView = content_view
 
+    def _apply_center(self, _) -> None:
+        self.window.center()
+
     def center(self) -> None:
         """
         Center the window in the screen.
         """        
-        def __modifier():
-            self.window.center()
-
-        self._modifiers.append(__modifier)
+        self.modify('center', None, Window._apply_center)
         return self
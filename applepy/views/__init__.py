@@ -1,20 +1,26 @@
 from ..backend import _MACOS, _IOS
+from ..base.lazy import lazy_exports
 
-if _MACOS:
-    from .menu import (
-        Menu,
-        MainMenu,
-        Submenu,
-        MenuItem,
-        StatusIcon
-    )
+_exports = []
 
-    from .feedback import (
-        Alert,
-        FileDialog,
-        OpenDialog,
-        SaveDialog
-    )
+if _MACOS:
+    _exports += [
+        ('.menu', (
+            'Menu',
+            'MainMenu',
+            'Submenu',
+            'MenuItem',
+            'StatusIcon'
+        )),
+        ('.feedback', (
+            'Alert',
+            'FileDialog',
+            'OpenDialog',
+            'SaveDialog'
+        ))
+    ]
 
 if _IOS:
-    from .feedback import Alert
+    _exports.append(('.feedback', ('Alert',)))
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), _exports)
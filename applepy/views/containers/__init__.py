@@ -1,10 +1,15 @@
 from ...backend import _MACOS
+from ...base.lazy import lazy_exports
+
+_exports = []
 
 if _MACOS:
-    from .toolbar import (
-        Toolbar,
-        ToolbarItem,
-        ToolbarItemGroup,
-        ToolbarSpace,
-        ToolbarFlexibleSpace
-    )
+    _exports.append(('.toolbar', (
+        'Toolbar',
+        'ToolbarItem',
+        'ToolbarItemGroup',
+        'ToolbarSpace',
+        'ToolbarFlexibleSpace'
+    )))
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), _exports)
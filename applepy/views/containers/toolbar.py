@@ -3,13 +3,16 @@ from typing import Union, Optional, Callable, Coroutine, List, Tuple
 from inspect import iscoroutinefunction
 
 from ...backend import _IOS
+from ...backend.bridge import set_property
 from ...base.utils import attachable
+from ...base.delegates import create_delegate, get_owner
 from ...base.app import get_current_app
 from ...base.types import (
     Image,
     ToolbarDisplayMode,
     ToolbarStyle,
-    ToolbarItemSystemIdentifier
+    ToolbarItemSystemIdentifier,
+    ActionPolicy
 )
 from ...base.view import StackedView, View
 from ...base.transform_mixins import (
@@ -36,6 +39,23 @@ from ...backend.app_kit import (
 )
 
 
+class _ToolbarDelegate(NSObject):
+    @objc_method
+    def toolbarAllowedItemIdentifiers_(self, toolbar):
+        return []
+
+    @objc_method
+    def toolbarDefaultItemIdentifiers_(self, toolbar):
+        owner = get_owner(self)
+        return [i.identifier for i in owner._items] if owner else []
+
+    @objc_method
+    def toolbar_itemForItemIdentifier_willBeInsertedIntoToolbar_(self, toolbar, identifier, flag):
+        owner = get_owner(self)
+        if owner:
+            return owner._item_for_identifier(identifier)
+
+
 class ToolbarItemBase(View,
                       AttachableMixin):
     """ Base class for Toolbar items (MacOS only). """
@@ -136,26 +156,14 @@ class Toolbar(StackedView, AttachableMixin):
         else:
             self._style = style
 
-        @objc_method
-        def toolbarAllowedItemIdentifiers_(_self, toolbar):
-            return []
+        self._controller = None
 
-        @objc_method
-        def toolbarDefaultItemIdentifiers_(_self, toolbar):
-            return [i.identifier for i in self._items]
-        
-        @objc_method
-        def toolbar_itemForItemIdentifier_willBeInsertedIntoToolbar_(_self, toolbar, identifier, flag):
-            item = next(filter(lambda i: i.identifier == identifier, self._items))
-            return item.ns_object
-
-        _ToolbarDelegate = type(f'_ToolbarDelegate{uuid4().hex[:8]}', (NSObject,), {
-            'toolbar_itemForItemIdentifier_willBeInsertedIntoToolbar_': toolbar_itemForItemIdentifier_willBeInsertedIntoToolbar_,
-            'toolbarDefaultItemIdentifiers_': toolbarDefaultItemIdentifiers_,
-            'toolbarAllowedItemIdentifiers_': toolbarAllowedItemIdentifiers_
-        })
+    def _create_controller(self) -> NSObject:
+        return create_delegate(_ToolbarDelegate, self)
 
-        self._controller = _ToolbarDelegate.alloc().init()
+    def _item_for_identifier(self, identifier: str) -> NSToolbarItem:
+        item = next(filter(lambda i: i.identifier == identifier, self._items))
+        return item.ns_object
 
     def get_ns_object(self) -> NSToolbar:
         """
@@ -185,6 +193,7 @@ class Toolbar(StackedView, AttachableMixin):
         self._toolbar = NSToolbar.alloc().init()
         self._toolbar.displayMode = self.display_mode.value
         self._toolbar.showsBaselineSeparator = self.show_separator
+        self._controller = self._create_controller()
         self._toolbar.delegate = self._controller
 
         self._set_style()
@@ -219,7 +228,7 @@ class ToolbarItem(ToolbarItemBase,
         self._navigational = val
 
         if self.ns_object:
-            self.ns_object.navigational = val
+            set_property(self.ns_object, 'navigational', val)
 
     def __init__(self, *,
                  label: Optional[Union[str, AbstractBinding]]=None,
@@ -227,7 +236,9 @@ class ToolbarItem(ToolbarItemBase,
                  action: Optional[Union[Callable, Coroutine]]=None,
                  system: Optional[ToolbarItemSystemIdentifier]=None,
                  navigational: Union[bool, AbstractBinding]=False,
-                 centered: bool=False) -> None:
+                 centered: bool=False,
+                 action_policy: Optional[ActionPolicy]=None,
+                 run_in: Optional[str]=None) -> None:
         """
         Add a new `ToolbarItem` view, which creates a MacOS native ToolbarItem (MacOS only).
         It must be attached to a `Toolbar`. Example:
@@ -243,6 +254,8 @@ class ToolbarItem(ToolbarItemBase,
             system (Optional[ToolbarItemSystemIdentifier], optional): The ID of the system-generated ToolbarItem. Defaults to None.
             navigational (Union[bool, AbstractBinding], optional): Whether the ToolbarItem is navigational. Defaults to False.
             centered (bool, optional): Whether the ToolbarItem is centered. Defaults to False.
+            action_policy (Optional[ActionPolicy], optional): How clicks are handled while an async action is running. Defaults to None.
+            run_in (Optional[str], optional): Use 'thread' to run a sync action in the App's thread pool, or 'process' to run a `ProcessAction` in the App's process pool, keeping the control disabled meanwhile. Defaults to None, which runs it in the main thread.
         """        
         ToolbarItemBase.__init__(self)
         ControlWithLabel.__init__(self, label)
@@ -253,6 +266,8 @@ class ToolbarItem(ToolbarItemBase,
         self._toolbar_item = None
         self._bordered = True
         self.centered = centered
+        self.action_policy = action_policy
+        self.run_in = run_in
 
         if system is not None:
             self._system = True
@@ -298,10 +313,10 @@ class ToolbarItem(ToolbarItemBase,
                 self._toolbar_item.target = get_current_app()._controller
                 if iscoroutinefunction(self.action):
                     self._toolbar_item.action = \
-                        get_current_app().register_async_action(self._toolbar_item, self.action)
+                        get_current_app().register_async_action(self._toolbar_item, self.action, self.action_policy)
                 else:
                     self._toolbar_item.action = \
-                        get_current_app().register_action(self._toolbar_item, self.action)
+                        get_current_app().register_action(self._toolbar_item, self.action, self.run_in, self)
         
         ToolbarItemBase.parse(self)
         ImageControl.parse(self, ImageControl)
@@ -334,7 +349,8 @@ class ToolbarItemGroup(ToolbarItem):
                  labels: List[str],
                  label: Optional[Union[str, AbstractBinding]]=None,
                  action: Optional[Union[Callable, Coroutine]]=None,
-                 centered: bool=True) -> None:
+                 centered: bool=True,
+                 action_policy: Optional[ActionPolicy]=None) -> None:
         """
         Add a new `ToolbarItemGroup` view which creates a native, text-based, single selection
         MacOS ToolbarItemGroup (MacOS only).
@@ -357,10 +373,12 @@ class ToolbarItemGroup(ToolbarItem):
             label (Optional[Union[str, AbstractBinding]], optional): Label of the group. Defaults to None.
             action (Optional[Union[Callable, Coroutine]], optional): Action executed when each of the items in the group is clicked. Defaults to None.
             centered (bool, optional): Whether the group should be centered. Defaults to True.
+            action_policy (Optional[ActionPolicy], optional): How clicks are handled while an async action is running. Defaults to None.
         """        
         super().__init__(label=label,
                          action=action,
-                         centered=centered)
+                         centered=centered,
+                         action_policy=action_policy)
 
         self._selected_index = -1
         self.bound_selected_index = None
@@ -401,7 +419,7 @@ class ToolbarItemGroup(ToolbarItem):
         
         if self.action and iscoroutinefunction(self.action):
             self._toolbar_item.setAction(
-                get_current_app().register_async_action(self._toolbar_item, action_async)
+                get_current_app().register_async_action(self._toolbar_item, action_async, self.action_policy)
             )
         else:
             self._toolbar_item.setAction(
@@ -424,15 +442,7 @@ class ToolbarItemGroup(ToolbarItem):
         Args:
             selected_index (Union[bool, AbstractBinding]): Value or bindable.
         """        
-        def __modifier():
-            if isinstance(selected_index, AbstractBinding):
-                self.bound_selected_index = selected_index
-                self.bound_selected_index.on_changed.connect(self._on_selected_index_changed)
-                self.selected_index = selected_index.value
-            else:
-                self.selected_index = selected_index
-
-        self._modifiers.append(__modifier)
+        self.modify('selected_index', selected_index)
 
         return self
 
@@ -1,11 +1,16 @@
 from ...backend import _MACOS, _IOS
+from ...base.lazy import lazy_exports
 
-from .text import Label, TextField
+_exports = [('.text', ('Label', 'TextField'))]
 
 if _MACOS:
-    from .button import Button, ImageButton, Checkbox, RadioButton
-    from .date import DatePicker
-    from .progress import ProgressIndicator, ProgressBar, Spinner
+    _exports += [
+        ('.button', ('Button', 'ImageButton', 'Checkbox', 'RadioButton')),
+        ('.date', ('DatePicker',)),
+        ('.progress', ('ProgressIndicator', 'ProgressBar', 'Spinner'))
+    ]
 
 if _IOS:
-    from .button import Button
+    _exports.append(('.button', ('Button',)))
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), _exports)
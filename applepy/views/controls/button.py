@@ -10,10 +10,11 @@ from ...base.transform_mixins import (
     ImageControl,
 )
 from ...backend import _MACOS, _IOS
+from ...backend.bridge import remember
 from ...base.binding import AbstractBinding
 from ...base.app import get_current_app
 from ...base.utils import try_call
-from ...base.types import Image, ImagePosition, ButtonStyle
+from ...base.types import Image, ImagePosition, ButtonStyle, ActionPolicy
 from .control import Control
 
 if _MACOS:
@@ -40,7 +41,9 @@ class Button(Control,
     def __init__(self, *, title: Union[str, AbstractBinding],
                           action: Optional[Union[Callable, Coroutine]]=None,
                           style: Optional[ButtonStyle]=None,
-                          key_equivalent: Optional[str]=None) -> None:
+                          key_equivalent: Optional[str]=None,
+                          action_policy: Optional[ActionPolicy]=None,
+                          run_in: Optional[str]=None) -> None:
         """
         Add a new `Button` view, which creates a MacOS standard, text based, Push Button.
 
@@ -56,6 +59,8 @@ class Button(Control,
             title (str): The button's title.
             action (Optional[Callable], optional): The action to be executed when the button is clicked. Defaults to None.
             key_equivalent (Optional[str], optional): The button's key shortcut. Defaults to None.
+            action_policy (Optional[ActionPolicy], optional): How clicks are handled while an async action is running. Defaults to None.
+            run_in (Optional[str], optional): Use 'thread' to run a sync action in the App's thread pool, or 'process' to run a `ProcessAction` in the App's process pool, keeping the control disabled meanwhile. Defaults to None, which runs it in the main thread.
         """
         Control.__init__(self)
         TitledControl.__init__(self, title)
@@ -65,6 +70,8 @@ class Button(Control,
 
         self.style = style
         self.action = action
+        self.action_policy = action_policy
+        self.run_in = run_in
 
     def get_ns_object(self) -> Union[NSButton, UIButton]:
         """
@@ -90,11 +97,11 @@ class Button(Control,
             if self.action:
                 if iscoroutinefunction(self.action):
                     self._button.setAction_(
-                        get_current_app().register_async_action(self._button, self.action)
+                        get_current_app().register_async_action(self._button, self.action, self.action_policy)
                     )
                 else:
                     self._button.setAction_(
-                        get_current_app().register_action(self._button, self.action)
+                        get_current_app().register_action(self._button, self.action, self.run_in, self)
                     )
 
         if _IOS:
@@ -122,13 +129,13 @@ class Button(Control,
                 if iscoroutinefunction(self.action):
                         self._button.addTarget_action_forControlEvents_(
                         get_current_app()._controller,
-                        get_current_app().register_async_action(self._button, self.action),
+                        get_current_app().register_async_action(self._button, self.action, self.action_policy),
                         UIControlEvents.UIControlEventPrimaryActionTriggered
                     )
                 else:
                     self._button.addTarget_action_forControlEvents_(
                         get_current_app()._controller,
-                        get_current_app().register_action(self._button, self.action),
+                        get_current_app().register_action(self._button, self.action, self.run_in, self),
                         UIControlEvents.UIControlEventPrimaryActionTriggered
                     )
         Control.parse(self)
@@ -179,6 +186,7 @@ class Checkbox(Button,
         self._button = NSButton.checkboxWithTitle_target_action_(self.title, None, None)
 
         def __button_state():
+            remember(self._button, 'state', self._button.state)
             self.state = self._button.state
             try_call(self.action)
 
@@ -201,7 +209,9 @@ class ImageButton(Button,
                           image: Union[Image, AbstractBinding],
                           image_position: Union[ImagePosition, AbstractBinding]=ImagePosition.image_left,
                           action: Optional[Callable]=None,
-                          key_equivalent: Optional[str]=None) -> None:
+                          key_equivalent: Optional[str]=None,
+                          action_policy: Optional[ActionPolicy]=None,
+                          run_in: Optional[str]=None) -> None:
         """
         Add a new `Button` view, which creates a MacOS native Push Button with an image.
         The following example will show a button with an icon on the left and the text 'Ok' on the right:
@@ -221,8 +231,11 @@ class ImageButton(Button,
             image_position (Union[ImagePosition, AbstractBinding], optional): The position of the button's image. Defaults to ImagePosition.image_left.
             action (Optional[Callable], optional): The action to be executed when the button is clicked. Defaults to None.
             key_equivalent (Optional[str], optional): The button's key shortcut. Defaults to None.
+            action_policy (Optional[ActionPolicy], optional): How clicks are handled while an async action is running. Defaults to None.
+            run_in (Optional[str], optional): Use 'thread' to run a sync action in the App's thread pool, or 'process' to run a `ProcessAction` in the App's process pool, keeping the control disabled meanwhile. Defaults to None, which runs it in the main thread.
         """    
-        Button.__init__(self, title=title, action=action, key_equivalent=key_equivalent)
+        Button.__init__(self, title=title, action=action, key_equivalent=key_equivalent,
+                        action_policy=action_policy, run_in=run_in)
         ImageControl.__init__(self, image=image, image_position=image_position)
 
     def parse(self) -> Button:
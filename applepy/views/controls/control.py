@@ -1,3 +1,4 @@
+from ...backend.bridge import send
 from ...base.view import View
 from ...base.transform_mixins import Enable
 from ..layout import StackView
@@ -23,7 +24,7 @@ class Control(View,
             Control: self
         """
         if isinstance(self.parent, StackView):
-            self.parent.ns_object.addArrangedSubview_(self.ns_object)
+            send(self.parent.ns_object, 'addArrangedSubview:', self.ns_object)
         else:
             self.parent.set_content_view(self.ns_object)
         self._add_constraints_to_superview()
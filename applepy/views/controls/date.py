@@ -1,5 +1,4 @@
 from typing import Union, Optional, Callable
-from uuid import uuid4
 from ctypes import POINTER, c_double
 
 from ... import View, Date
@@ -13,9 +12,21 @@ from ...backend.app_kit import (
 )
 from ...base.binding import AbstractBinding, bindable
 from ...base.utils import try_call
+from ...base.delegates import create_delegate, get_owner
 from .control import Control
 
 
+class _DatePickerDelegate(NSObject):
+    @objc_method
+    def datePickerCell_validateProposedDateValue_timeInterval_(self,
+                                                               datePickerCell,
+                                                               proposedDateValue: POINTER(objc_id),
+                                                               proposedTimeInterval: POINTER(c_double)):
+        owner = get_owner(self)
+        if owner:
+            owner._date_will_change(ObjCInstance(proposedDateValue.contents))
+
+
 class DatePicker(Control):
     """ Control that generates a native MacOS DatePicker. """
 
@@ -74,24 +85,19 @@ class DatePicker(Control):
             self.bound_date = None
             self._date = date
 
-        @objc_method
-        def datePickerCell_validateProposedDateValue_timeInterval_(_self, 
-                                                                   datePickerCell,
-                                                                   proposedDateValue: POINTER(objc_id),
-                                                                   proposedTimeInterval: POINTER(c_double)):
-            new_date_value = ObjCInstance(proposedDateValue.contents)
-            self.date = Date.from_value(new_date_value)
-            if self.bound_date:
-                self.bound_date.value = Date.from_value(new_date_value)
+        self._date_picker = None
+        self._controller = None
+        self._on_date_changed_action = on_date_changed
 
-            try_call(on_date_changed)
+    def _create_controller(self) -> NSObject:
+        return create_delegate(_DatePickerDelegate, self)
 
-        _DatePickerDelegate = type(f'_DatePickerDelegate{uuid4().hex[:8]}', (NSObject,), {
-            'datePickerCell_validateProposedDateValue_timeInterval_': datePickerCell_validateProposedDateValue_timeInterval_
-        })
+    def _date_will_change(self, new_date_value: ObjCInstance) -> None:
+        self.date = Date.from_value(new_date_value)
+        if self.bound_date:
+            self.bound_date.value = Date.from_value(new_date_value)
 
-        self._date_picker = None
-        self._controller = _DatePickerDelegate.alloc().init()
+        try_call(self._on_date_changed_action)
 
     def _on_date_changed(self, signal, sender, event):
         self.date = self.bound_date.value
@@ -130,6 +136,7 @@ class DatePicker(Control):
 
         self._date_picker.datePickerElements = mask
 
+        self._controller = self._create_controller()
         self._date_picker.delegate = self._controller
 
         Control.parse(self)
@@ -3,6 +3,7 @@ from typing import Union
 from ... import ProgressStyle
 from ...base.binding import AbstractBinding, bindable
 from ...backend.app_kit import NSProgressIndicator
+from ...backend.bridge import set_property
 from .control import Control
 
 
@@ -43,7 +44,7 @@ class ProgressIndicator(Control):
     def value(self, val: float) -> None:
         self._value = val
         if self.ns_object:
-            self.ns_object.doubleValue = val
+            set_property(self.ns_object, 'doubleValue', val)
 
     def __init__(self,
                  *,
@@ -126,15 +127,7 @@ class ProgressIndicator(Control):
         Returns:
             Control: self
         """
-        def __modifier():
-            if isinstance(running, AbstractBinding):
-                self.bound_animating = running
-                self.bound_animating.on_changed.connect(self._on_animating_changed)
-                self.animating = running.value
-            else:
-                self.animating = running
-
-        self._modifiers.append(__modifier)
+        self.modify('animating', running)
 
         return self
 
@@ -1,9 +1,10 @@
 from typing import Union, Optional, Callable
-from uuid import uuid4
 
 from ...backend import _MACOS, _IOS
 from .control import Control
 from ...base.utils import try_call
+from ...base.delegates import create_delegate, get_owner
+from ...backend.bridge import remember, send
 from ...base.types import Color
 from ...base.transform_mixins import (
     Placeholder,
@@ -32,6 +33,23 @@ if _IOS:
     )
 
 
+if _MACOS:
+    class _TextFieldDelegate(NSObject):
+        @objc_method
+        def controlTextDidChange_(self, notification):
+            owner = get_owner(self)
+            if owner:
+                owner._text_did_change()
+
+if _IOS:
+    class _TextFieldDelegate(NSObject):
+        @objc_method
+        def textField_shouldChangeCharactersIn_replacementString_(self, field, current, new):
+            owner = get_owner(self)
+            if owner:
+                try_call(owner._on_text_changed_action)
+
+
 class Label(Control,
             TextColor,
             TextControl):
@@ -123,30 +141,21 @@ class TextField(Control,
         TextControl.__init__(self, text)
         BackgroundColor.__init__(self)
 
-        @objc_method
-        def controlTextDidChange_(_self, notification):
-            self.text = str(self._text_field.stringValue)
-            if self.bound_text:
-                self.bound_text.value = self._text
-
-            try_call(on_text_changed)
-
-        @objc_method
-        def textField_shouldChangeCharactersIn_replacementString_(_self, field, current, new):
-            try_call(on_text_changed)
-
-        props = {}
+        self._text_field = None
+        self._controller = None
+        self._on_text_changed_action = on_text_changed
 
-        if _MACOS:
-            props['controlTextDidChange_'] = controlTextDidChange_
+    def _create_controller(self) -> NSObject:
+        return create_delegate(_TextFieldDelegate, self)
 
-        if _IOS:
-            props['textField_shouldChangeCharactersIn_replacementString_'] = textField_shouldChangeCharactersIn_replacementString_
-    
-        _TextFieldDelegate = type(f'_TextFieldDelegate_{uuid4().hex[:8]}', (NSObject,), props)
+    def _text_did_change(self) -> None:
+        text = str(send(self._text_field, 'stringValue'))
+        remember(self._text_field, 'stringValue', text)
+        self.text = text
+        if self.bound_text:
+            self.bound_text.value = self._text
 
-        self._text_field = None
-        self._controller = _TextFieldDelegate.alloc().init()
+        try_call(self._on_text_changed_action)
 
     def get_ns_object(self) -> NSTextField:
         """
@@ -180,6 +189,7 @@ class TextField(Control,
             self._text_field = UITextField.alloc().init()
             self._text_field.text = self.text
 
+        self._controller = self._create_controller()
         self._text_field.delegate = self._controller
         
         Control.parse(self),
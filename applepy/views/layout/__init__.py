@@ -1,6 +1,11 @@
-from .stack_view import (
-    StackView,
-    HorizontalStack,
-    VerticalStack,
-    Spacer
-)
+from ...base.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), [
+    ('.stack_view', (
+        'StackView',
+        'HorizontalStack',
+        'VerticalStack',
+        'Spacer'
+    )),
+    ('.for_each', ('ForEach',))
+])
@@ -0,0 +1,185 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from ...base.binding import AbstractBinding
+from ...base.errors import DuplicateKeyError
+from ...base.scope import current_scope, push_scope, pop_scope
+from ...base.types import Orientation
+from ...base.view import View
+from .stack_view import StackView
+
+
+class _Row:
+    def __init__(self, item: Any, views: List[View]) -> None:
+        self.item = item
+        self.views = views
+
+
+class ForEach(StackView):
+    """ Layout one set of views for each item of a list, keeping the views of unchanged items. """
+
+    bound_items = None
+
+    def __init__(self, items: Union[Iterable[Any], AbstractBinding],
+                       *,
+                       content: Callable[[Any], Any],
+                       key: Optional[Callable[[Any], Any]]=None) -> None:
+        """
+        Add a new `ForEach` view, which creates the views returned by `content` for each item.
+        It must be placed inside a `StackView`, whose orientation, spacing and alignment it follows:
+
+        >>> class TodoList:
+                @bindable(list)
+                def items(self) -> List[Todo]:
+                    return self._items
+
+                @items.setter
+                def items(self, val: List[Todo]) -> None:
+                    self._items = val
+
+        >>> with VerticalStack():
+                ForEach(Binding(TodoList.items, self.todos),
+                        key=lambda todo: todo.id,
+                        content=lambda todo: Label(text=todo.title))
+
+        When the items change, they are matched to the previous ones by key: views of removed
+        items are removed from the stack, views of new items are inserted in place and the views
+        of kept items are moved when needed, but never recreated, unless the item itself is no
+        longer equal to the previous one. A bound list is only noticed when a new list is assigned,
+        such as `self.todos.items = [*self.todos.items, todo]`. After changing it in place, call `update`.
+
+        Args:
+            items (Union[Iterable[Any], AbstractBinding]): The items, or a binding to them.
+            content (Callable[[Any], Any]): Function that creates the views of an item.
+            key (Optional[Callable[[Any], Any]], optional): Function that returns the unique and hashable
+                identity of an item. Defaults to the item itself.
+        """
+        parent = current_scope()
+        orientation = parent.orientation if isinstance(parent, StackView) else Orientation.vertical
+
+        StackView.__init__(self, orientation=orientation)
+
+        if isinstance(parent, StackView):
+            self._spacing = parent.spacing
+            self._alignment = parent.alignment
+
+        self._content = content
+        self._key = key or (lambda item: item)
+        self._rows: Dict[Any, _Row] = {}
+        self._order: List[Any] = []
+
+        if isinstance(items, AbstractBinding):
+            self.bound_items = items
+            self.bound_items.on_changed.connect(self._on_items_changed)
+            self._items = list(items.value or [])
+        else:
+            self._items = list(items)
+
+    @property
+    def items(self) -> List[Any]:
+        """
+        The items currently displayed.
+
+        Returns:
+            List[Any]: the displayed items.
+        """
+        return self._items
+
+    def _on_items_changed(self, signal, sender, event):
+        self.update(self.bound_items.value or [])
+
+    def update(self, items: Optional[Iterable[Any]]=None) -> None:
+        """
+        Match the views to a new list of items. When no items are given, the bound items are
+        read again, or the `items` list is used, e.g. after it was changed in place.
+
+        Args:
+            items (Optional[Iterable[Any]], optional): The new items. Defaults to None.
+        """
+        if items is None and self.bound_items is not None:
+            items = self.bound_items.value or []
+
+        if items is not None:
+            self._items = list(items)
+
+        if self._stack_view:
+            self._reconcile()
+
+    def _create_row(self, item: Any) -> _Row:
+        push_scope(self)
+        try:
+            self._content(item)
+        finally:
+            pop_scope()
+
+        views = list(self._stack)
+        self._stack.clear()
+
+        for view in views:
+            view.parse()
+
+        return _Row(item, views)
+
+    def _remove_row(self, row: _Row) -> None:
+        for view in row.views:
+            self._stack_view.removeArrangedSubview_(view.ns_object)
+            view.ns_object.removeFromSuperview()
+            view.dispose()
+
+    def _disposable_children(self) -> Iterable[Any]:
+        return [view for row in self._rows.values() for view in row.views]
+
+    def _release(self) -> list:
+        self._rows = {}
+        self._order = []
+        return StackView._release(self)
+
+    def _reconcile(self) -> None:
+        keys = [self._key(item) for item in self._items]
+        if len(set(keys)) != len(keys):
+            seen = set()
+            for key in keys:
+                if key in seen:
+                    raise DuplicateKeyError(key)
+                seen.add(key)
+
+        # removed items, and kept keys whose item is no longer equal, lose their views
+        new_items = dict(zip(keys, self._items))
+        for key in self._order:
+            row = self._rows[key]
+            if key not in new_items or new_items[key] != row.item:
+                self._remove_row(row)
+                del self._rows[key]
+
+        arranged = [view for key in self._order if key in self._rows for view in self._rows[key].views]
+
+        for key, item in new_items.items():
+            if key not in self._rows:
+                self._rows[key] = self._create_row(item)
+                # new views are appended by their own parse
+                arranged.extend(self._rows[key].views)
+
+        # move the views into place, touching only the ones that are out of order
+        index = 0
+        for key in keys:
+            for view in self._rows[key].views:
+                if arranged[index] is not view:
+                    arranged.remove(view)
+                    arranged.insert(index, view)
+                    self._stack_view.removeArrangedSubview_(view.ns_object)
+                    self._stack_view.insertArrangedSubview_atIndex_(view.ns_object, index)
+                index += 1
+
+        self._order = keys
+
+    def parse(self) -> View:
+        """
+        View's parse method.
+        It is used internally for rendering the components. Do not call it directly.
+
+        Returns:
+            ForEach: self
+        """
+        StackView.parse(self)
+        self._reconcile()
+
+        return self
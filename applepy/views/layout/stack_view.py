@@ -2,6 +2,7 @@ from typing import Optional, Union
 
 from ... import StackedView, Alignment, Orientation, StackDistribution
 from ...backend import _MACOS, _IOS
+from ...backend.bridge import send
 from ...base.binding import bindable
 from ...base.mixins import Modifiable
 from ...base.scene import Scene
@@ -143,7 +144,7 @@ class StackView(StackedView,
             self._stack_view.distribution = self.distribution.value
 
         if isinstance(self.parent, StackView):
-            self.parent.ns_object.addArrangedSubview_(self.ns_object)
+            send(self.parent.ns_object, 'addArrangedSubview:', self.ns_object)
         else:
             self.parent.set_content_view(self.ns_object)
 
@@ -157,6 +158,7 @@ class StackView(StackedView,
             left_contraint.active = True
             right_contraint = self._stack_view.rightAnchor.constraintEqualToAnchor(self._stack_view.superview.rightAnchor)
             right_contraint.active = True
+            self._activated_constraints = [top_contraint, bottom_contraint, left_contraint, right_contraint]
         else:
             self._add_constraints_to_superview()
 
@@ -284,7 +286,7 @@ class Spacer(View, BackgroundColor):
             self._stack_view.axis = Orientation.vertical
             self._stack_view.distribution = StackDistribution.fill
 
-        self.parent.ns_object.addArrangedSubview_(self.ns_object)
+        send(self.parent.ns_object, 'addArrangedSubview:', self.ns_object)
         return super().parse()
 
     def get_ns_object(self) -> Union[NSStackView, UIStackView]:
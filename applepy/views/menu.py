@@ -7,6 +7,7 @@ from ..base.mixins import AttachableMixin
 from ..base.app import get_current_app, StatusBarApp
 from ..base.utils import attachable
 from ..base.errors import NotStatusBarAppError
+from ..base.types import ActionPolicy
 from ..base.binding import AbstractBinding, bindable
 from ..base.transform_mixins import Enable, TitledControl, KeyBindable, ImageControl
 
@@ -124,7 +125,9 @@ class Submenu(StackedView,
 
     def __init__(self, *, title: str,
                           action: Optional[Union[Callable, Coroutine]] = None,
-                          key_equivalent: str = '') -> None:
+                          key_equivalent: str = '',
+                          action_policy: Optional[ActionPolicy] = None,
+                          run_in: Optional[str] = None) -> None:
         """
         Add a new `Submenu` view, which creates a native MacOS submenu that can be attached
         to a `Menu` or `MainMenu` and have nested `MenuItem`s.
@@ -138,6 +141,10 @@ class Submenu(StackedView,
                     with Submenu(title='File'):
                         MenuItem(title='New')
                         MenuItem(title='Open...')
+
+        Blocking actions can be kept off the main thread with `run_in`: 'thread' runs a sync action
+        in the App's thread pool and 'process' runs a `ProcessAction` in the App's process pool,
+        keeping the submenu disabled meanwhile.
         """
         StackedView.__init__(self, (Menu, MainMenu))
         TitledControl.__init__(self, title)
@@ -145,6 +152,8 @@ class Submenu(StackedView,
 
         self._main_menu_item = None
         self.action = action
+        self.action_policy = action_policy
+        self.run_in = run_in
 
     def get_ns_object(self) -> NSMenuItem:
         """
@@ -173,11 +182,11 @@ class Submenu(StackedView,
         if self.action:
             if iscoroutinefunction(self.action):
                 self._main_menu_item.setAction_(
-                    get_current_app().register_async_action(self._main_menu_item, self.action) 
+                    get_current_app().register_async_action(self._main_menu_item, self.action, self.action_policy) 
                 )
             else:
                 self._main_menu_item.setAction_(
-                    get_current_app().register_action(self._main_menu_item, self.action) 
+                    get_current_app().register_action(self._main_menu_item, self.action, self.run_in, self) 
                 )
 
         self._main_menu_item_menu = NSMenu \
@@ -204,7 +213,9 @@ class MenuItem(View,
     """
     def __init__(self, *, title: Union[str, AbstractBinding],
                           action: Optional[Union[Callable, Coroutine]] = None,
-                          key_equivalent: str = '') -> None:
+                          key_equivalent: str = '',
+                          action_policy: Optional[ActionPolicy] = None,
+                          run_in: Optional[str] = None) -> None:
         """
         Add a new `MenuItem` view, which creates a native MacOS menu item that can be attached
         to a `Menu` or `Submenu`.
@@ -225,6 +236,11 @@ class MenuItem(View,
                         MenuItem(title='Quit',
                                  key_equivalent='q',
                                  action=self.quit)
+
+        Blocking actions can be kept off the main thread with `run_in`: 'thread' runs a sync action
+        in the App's thread pool and 'process' runs a `ProcessAction` in the App's process pool,
+        keeping the menu item disabled meanwhile:
+        >>> MenuItem(title='Export...', action=ProcessAction(export, self.vm.document), run_in='process')
         """
         View.__init__(self, (Submenu, MainMenu, Menu))
         TitledControl.__init__(self, title)
@@ -233,6 +249,8 @@ class MenuItem(View,
 
         self._menu_item = None
         self.action = action
+        self.action_policy = action_policy
+        self.run_in = run_in
         self.key_equivalent = key_equivalent
 
     def get_ns_object(self) -> NSMenuItem:
@@ -272,11 +290,11 @@ class MenuItem(View,
         if self.action:
             if iscoroutinefunction(self.action):
                 self._menu_item.setAction_(
-                    get_current_app().register_async_action(self._menu_item, self.action) 
+                    get_current_app().register_async_action(self._menu_item, self.action, self.action_policy) 
                 )
             else:
                 self._menu_item.setAction_(
-                    get_current_app().register_action(self._menu_item, self.action) 
+                    get_current_app().register_action(self._menu_item, self.action, self.run_in, self) 
                 )
 
         View.parse(self)
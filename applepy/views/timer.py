@@ -1,13 +1,21 @@
 from typing import Union, Optional, Callable, Coroutine
-from threading import Timer as TimerThread
 from inspect import iscoroutinefunction
+from math import floor
+from time import monotonic
 
 from .. import bindable, AbstractBinding
+from ..base.app import App, call_when_app_available
+from ..base.scheduler import TimerHandle
+from ..base.types import TimerOverrun
 from ..base.utils import try_call, try_call_async
 
 import asyncio
 
 
+# like NSTimer, non-positive intervals run every 0.1 milliseconds
+_MIN_INTERVAL = .0001
+
+
 class Timer:
     """
     A non-visual component that creates a Timer.
@@ -41,16 +49,10 @@ class Timer:
     def enabled(self, val: bool) -> None:
         # start / stop self._current_timer
         if self._enabled and not val:
-            self._current_timer.cancel()
-            self._current_timer = None
+            self._cancel()
         elif not self._enabled and val:
-            if self._is_async:
-                self._enabled = True
-                self._set_async_timer()
-            else:
-                if not self._current_timer:
-                    self._set_timer()
-                self._current_timer.start()
+            self._enabled = True
+            self._schedule()
 
         self._enabled = val
 
@@ -71,17 +73,26 @@ class Timer:
     def __init__(self, *, interval: Union[float, AbstractBinding],
                           repeat: Union[bool, AbstractBinding]=False,
                           enabled: Union[bool, AbstractBinding]=False,
-                          action: Optional[Union[Callable, Coroutine]]=None) -> None:
+                          action: Optional[Union[Callable, Coroutine]]=None,
+                          overrun: TimerOverrun=TimerOverrun.skip,
+                          tolerance: float=0.) -> None:
         """
         Create a `Timer` non-visual component.
+        A repeating Timer runs at a fixed rate: its ticks are scheduled `interval` seconds apart
+        from the moment it was enabled, no matter how long its action takes to run.
         Example:
         >>>Timer(interval=5., repeat=True, action=self.timer_timeout)
 
         Args:
-            interval (Union[float, AbstractBinding]): The Timer's interval.
+            interval (Union[float, AbstractBinding]): The Timer's interval. Intervals of zero or less
+                are treated as 0.1 milliseconds.
             repeat (Union[bool, AbstractBinding], optional): Whether or not the Timer should repeat after timeout. Defaults to False.
             enabled (Union[bool, AbstractBinding], optional): Whether or not the Timer should be running. Defaults to False.
             action (Optional[Callable], optional): The action to be run when the Timer times out. Defaults to None.
+            overrun (TimerOverrun, optional): What to do with the ticks missed while the action was running
+                longer than the interval. Defaults to TimerOverrun.skip.
+            tolerance (float, optional): How many seconds late each tick may run, allowing the App to run
+                timers with overlapping windows in a single wakeup. Defaults to 0.
         """        
         if isinstance(interval, AbstractBinding):
             self.bound_interval = interval
@@ -106,40 +117,114 @@ class Timer:
 
         self._action = action
         self._is_async = iscoroutinefunction(action)
-        self._set_timer()
+        self._overrun = overrun
+        self._tolerance = tolerance
+        self._deadline = 0.
+        self._current_timer: Optional[TimerHandle] = None
+        # a tick due before any App runs waits for one
+        self._waiting_for_app = False
+        self._running: Optional[asyncio.Future] = None
+        self._schedule()
+
+    @property
+    def overrun(self) -> TimerOverrun:
+        """
+        What the Timer does with the ticks missed while its action was running.
+
+        Returns:
+            TimerOverrun: The Timer's overrun policy.
+        """
+        return self._overrun
+
+    @overrun.setter
+    def overrun(self, val: TimerOverrun) -> None:
+        self._overrun = val
+
+    @property
+    def tolerance(self) -> float:
+        """
+        How many seconds late each tick may run, so it can share a wakeup with other timers.
+
+        Returns:
+            float: The Timer's tolerance in seconds.
+        """
+        return self._tolerance
 
-    def _set_async_timer(self) -> None:
-        if self.enabled:
-            async def __timeout_async():
-                await try_call_async(self._action)
-                if self.repeat and self.enabled:
-                    await __task_async()
+    @tolerance.setter
+    def tolerance(self, val: float) -> None:
+        self._tolerance = val
 
+    @property
+    def _period(self) -> float:
+        return max(self.interval, _MIN_INTERVAL)
 
-            async def __task_async():
-                await asyncio.sleep(self.interval)
-                await __timeout_async()
+    def _schedule(self) -> None:
+        if self.enabled and not self._current_timer and not self._waiting_for_app:
+            self._schedule_at(monotonic() + self._period)
 
-            self._current_timer = asyncio.create_task(__task_async())
+    def _schedule_at(self, deadline: float) -> None:
+        self._deadline = deadline
+        self._waiting_for_app = True
+        call_when_app_available(self._schedule_in)
 
+    def _schedule_in(self, app: App) -> None:
+        if self._waiting_for_app:
+            self._waiting_for_app = False
+            self._current_timer = app.scheduler.call_at(self._deadline, self._timeout, self._tolerance)
+
+    def _cancel(self) -> None:
+        self._waiting_for_app = False
+
+        if self._current_timer:
+            self._current_timer.cancel()
+            self._current_timer = None
+
+        if self._running:
+            self._running.cancel()
+            self._running = None
+
+    def _timeout(self) -> None:
+        # runs in the main thread, delivered by the App's scheduler
+        self._current_timer = None
+
+        if not self.enabled:
+            return
 
-    def _set_timer(self) -> None:
         if self._is_async:
-            self._set_async_timer()
+            self._running = asyncio.ensure_future(self._timeout_async())
         else:
-            def __timeout():
-                try_call(self._action)
-                if self.repeat and self.enabled:
-                    self._set_timer()
-                else:
-                    self._current_timer = None
-
-            self._current_timer = TimerThread(self.interval, __timeout)
-            if self.enabled:
-                self._current_timer.start()
-
-    def _on_repeat_changed(self) -> None:
+            try_call(self._action)
+            self._reschedule()
+
+    async def _timeout_async(self) -> None:
+        await try_call_async(self._action)
+        self._running = None
+        self._reschedule()
+
+    def _reschedule(self) -> None:
+        if not self.repeat or not self.enabled or self._current_timer:
+            return
+
+        # the next tick is due one interval after the previous deadline, not after the action
+        # finished, so the action's run time never accumulates as drift
+        period = self._period
+        deadline = self._deadline + period
+        now = monotonic()
+
+        if deadline <= now:
+            missed = floor((now - deadline) / period) + 1
+            if self._overrun == TimerOverrun.skip:
+                deadline += missed * period
+            elif self._overrun == TimerOverrun.coalesce:
+                deadline += (missed - 1) * period
+
+        self._schedule_at(deadline)
+
+    def _on_interval_changed(self, signal, sender, event) -> None:
+        self.interval = self.bound_interval.value
+
+    def _on_repeat_changed(self, signal, sender, event) -> None:
         self.repeat = self.bound_repeat.value
 
-    def _on_enabled_changed(self) -> None:
+    def _on_enabled_changed(self, signal, sender, event) -> None:
         self.enabled = self.bound_enabled.value
@@ -0,0 +1,29 @@
+"""
+Shared setup of the benchmarks: applepy runs on rubicon when it is installed, i.e. on macOS,
+and on the Objective-C stub of the test suite anywhere else.
+"""
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup() -> str:
+    """
+    Make applepy importable from the source tree and pick the Objective-C bridge.
+
+    Returns:
+        str: `'rubicon'` or `'stub'`, to be printed with the results.
+    """
+    sys.path.insert(0, ROOT)
+
+    try:
+        import rubicon.objc
+    except ImportError:
+        sys.path.insert(0, os.path.join(ROOT, 'tests'))
+        from objc_stub import install
+        install()
+        return 'stub'
+
+    return 'rubicon'
@@ -0,0 +1,64 @@
+"""
+Per-call overhead of the hot native calls, sent through rubicon's dynamic attribute lookup
+or through the cached methods of `applepy.backend.bridge`.
+
+    python benchmarks/bench_bridge.py [calls]
+"""
+import sys
+
+from time import perf_counter
+
+from _env import setup
+
+
+def best_of(fn, count: int, repeat: int=5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(count):
+            fn()
+        best = min(best, perf_counter() - start)
+
+    return best / count
+
+
+def main(count: int) -> None:
+    backend = setup()
+
+    from applepy.backend.app_kit import NSStackView, NSTextField, NSView
+    from applepy.backend.bridge import send, set_property
+
+    text_field = NSTextField.alloc().init()
+    stack_view = NSStackView.alloc().init()
+    view = NSView.alloc().init()
+
+    cases = [
+        ('stringValue',
+         lambda: text_field.stringValue,
+         lambda: send(text_field, 'stringValue')),
+        ('setStringValue: (same value)',
+         lambda: setattr(text_field, 'stringValue', 'text'),
+         lambda: set_property(text_field, 'stringValue', 'text')),
+        ('widthAnchor',
+         lambda: view.widthAnchor,
+         lambda: send(view, 'widthAnchor')),
+        ('addArrangedSubview: + removeArrangedSubview:',
+         lambda: (stack_view.addArrangedSubview_(view), stack_view.removeArrangedSubview_(view)),
+         lambda: (send(stack_view, 'addArrangedSubview:', view), send(stack_view, 'removeArrangedSubview:', view))),
+    ]
+
+    print(f'bridge: {backend}, calls: {count}')
+    print(f'{"call":46} {"dynamic":>10} {"cached":>10}')
+    for name, dynamic, cached in cases:
+        before = best_of(dynamic, count)
+        after = best_of(cached, count)
+        print(f'{name:46} {before * 1e9:7.0f} ns {after * 1e9:7.0f} ns ({before / after:.1f}x)')
+
+    if backend == 'stub':
+        # the stub answers attribute lookups like any Python object, without rubicon's lookup
+        print('The stub has no dynamic lookup to save: only the cached column, the overhead added '
+              'by the bridge itself, is meaningful. Run on macOS for the comparison.')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
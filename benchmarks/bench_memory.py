@@ -0,0 +1,53 @@
+"""
+Bytes of Python memory held by each `Label`, `Button` and `StackView`, measured with
+`tracemalloc` over many instances. Only the construction phase is measured, no native view
+is created.
+
+    python benchmarks/bench_memory.py [instances]
+"""
+import gc
+import sys
+import tracemalloc
+
+from _env import setup
+
+
+def main(count: int) -> None:
+    backend = setup()
+
+    from applepy import Size
+    from applepy.scenes import Window
+    from applepy.views.controls import Button, Label
+    from applepy.views.layout import VerticalStack
+
+    cases = [
+        ('Label', lambda: Label(text='label')),
+        ('Button', lambda: Button(title='button')),
+        ('StackView', lambda: VerticalStack()),
+    ]
+
+    print(f'bridge: {backend}, instances: {count}')
+    for name, build in cases:
+        with Window(title='memory', size=Size(640, 480)) as window:
+            with VerticalStack() as stack:
+                build()
+                gc.collect()
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+                for _ in range(count):
+                    build()
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+
+        stats = after.compare_to(before, 'filename')
+        size = sum(stat.size_diff for stat in stats)
+        # the parent's stack keeps every instance alive, its own growth is included
+        print(f'{name:10} {size / count:8.0f} bytes per instance')
+
+        window.dispose()
+        del window, stack
+        gc.collect()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
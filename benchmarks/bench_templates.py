@@ -0,0 +1,91 @@
+"""
+Construction time of a document window, built by its function every time or stamped out
+from a `@template`. Only the construction phase is measured, no native view is created.
+
+    python benchmarks/bench_templates.py [windows]
+"""
+import sys
+
+from time import perf_counter
+
+from _env import setup
+
+
+def main(count: int, repeat: int=5) -> None:
+    backend = setup()
+
+    from applepy import Binding, Size, bindable, template
+    from applepy.scenes import Window
+    from applepy.views.controls import Button, Label, TextField
+    from applepy.views.layout import HorizontalStack, VerticalStack
+
+    class Document:
+        def __init__(self, name: str) -> None:
+            self._name = name
+            self._content = ''
+
+        @bindable(str)
+        def name(self) -> str:
+            return self._name
+
+        @name.setter
+        def name(self, val: str) -> None:
+            self._name = val
+
+        @bindable(str)
+        def content(self) -> str:
+            return self._content
+
+        @content.setter
+        def content(self, val: str) -> None:
+            self._content = val
+
+        def save(self) -> None:
+            pass
+
+    def document_window(document: Document) -> Window:
+        with Window(title=Binding(Document.name, document), size=Size(640, 480)) as w:
+            with VerticalStack():
+                with HorizontalStack():
+                    Label(text='Name')
+                    TextField(text=Binding(Document.name, document))
+                for field in ('Author', 'Subject', 'Keywords', 'Comments'):
+                    with HorizontalStack():
+                        Label(text=field)
+                        TextField(text='')
+                TextField(text=Binding(Document.content, document))
+                with HorizontalStack():
+                    Button(title='Save', action=document.save)
+                    Button(title='Close')
+            return w
+
+    documents = [Document(f'document {i}') for i in range(count)]
+
+    def run(build) -> float:
+        elapsed = 0.
+        for i in range(0, count, 50):
+            start = perf_counter()
+            windows = [build(document) for document in documents[i:i + 50]]
+            elapsed += perf_counter() - start
+
+            # like an App, only a few windows are open at the same time: signals get slower
+            # to connect as their receivers pile up
+            for window in windows:
+                window.dispose()
+
+        return elapsed
+
+    def measure(build) -> float:
+        # the best of a few runs, the others being slowed down by the rest of the machine
+        return min(run(build) for _ in range(repeat))
+
+    plain = measure(document_window)
+    stamped = measure(template(document_window))
+
+    print(f'bridge: {backend}, windows: {count}')
+    print(f'body():   {plain / count * 1e6:8.1f} us per window')
+    print(f'template: {stamped / count * 1e6:8.1f} us per window ({plain / stamped:.1f}x)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
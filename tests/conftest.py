@@ -0,0 +1,4 @@
+from objc_stub import install
+
+
+install()
@@ -0,0 +1,218 @@
+"""
+A minimal, pure Python stand-in for rubicon-objc, so applepy can be imported and its view trees
+built and parsed on machines without the Objective-C runtime, such as CI runners.
+
+Native objects accept any message: unknown attributes are created on first access, `init*`
+messages return the receiver and `set<Name>:` selectors write the matching attribute. Stack
+views keep their arranged subviews, so tests can inspect the native tree that was produced.
+"""
+import ctypes
+import sys
+import types
+
+from itertools import count
+from typing import Any, Dict
+
+
+_addresses = count(0x1000, 0x10)
+
+# native properties read before being written, with the value AppKit starts them with
+_DEFAULTS = {'tag': 0}
+
+
+class ObjCInstance:
+    def __init__(self, objc_class: Any=None) -> None:
+        state = self.__dict__
+        state['ptr'] = ctypes.c_void_p(next(_addresses))
+        state['objc_class'] = objc_class if objc_class is not None else _ANONYMOUS
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+
+        if name.startswith('init'):
+            return lambda *args: self
+
+        if name == 'arrangedSubviews':
+            value = []
+        elif name in _DEFAULTS:
+            value = _DEFAULTS[name]
+        else:
+            value = ObjCInstance()
+
+        self.__dict__[name] = value
+        return value
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return ObjCInstance()
+
+    def addArrangedSubview_(self, view: 'ObjCInstance') -> None:
+        self.arrangedSubviews.append(view)
+        view.superview = self
+
+    def insertArrangedSubview_atIndex_(self, view: 'ObjCInstance', index: int) -> None:
+        self.arrangedSubviews.insert(index, view)
+        view.superview = self
+
+    def removeArrangedSubview_(self, view: 'ObjCInstance') -> None:
+        self.arrangedSubviews.remove(view)
+
+    def removeFromSuperview(self) -> None:
+        self.__dict__.pop('superview', None)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.objc_class.name} {self.ptr.value:#x}>'
+
+
+class ObjCClass(ObjCInstance):
+    _classes: Dict[str, 'ObjCClass'] = {}
+
+    def __new__(cls, name: str) -> 'ObjCClass':
+        try:
+            return cls._classes[name]
+        except KeyError:
+            res = cls._classes[name] = object.__new__(cls)
+            return res
+
+    def __init__(self, name: str) -> None:
+        if 'ptr' not in self.__dict__:
+            ObjCInstance.__init__(self, self)
+            self.__dict__['name'] = name
+
+    def alloc(self) -> ObjCInstance:
+        return ObjCInstance(self)
+
+
+_ANONYMOUS = ObjCClass('NSObject')
+
+
+class NSObject(ObjCInstance):
+    """ Base of the delegate classes declared in Python. """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        cls.objc_class = ObjCClass(cls.__name__)
+
+    def __init__(self) -> None:
+        ObjCInstance.__init__(self, type(self).objc_class)
+
+    @classmethod
+    def alloc(cls) -> 'NSObject':
+        return cls()
+
+
+class SEL:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class ObjCMethod:
+    """ Answers a selector like rubicon's dynamic attribute lookup does. """
+
+    def __init__(self, pointer: SEL) -> None:
+        self.selector = pointer.name
+
+    def __call__(self, receiver: ObjCInstance, *args) -> Any:
+        selector = self.selector
+        if selector.startswith('set') and selector.endswith(':') and selector.count(':') == 1:
+            name = selector[3:-1]
+            setattr(receiver, name[0].lower() + name[1:], args[0])
+            return None
+
+        if ':' not in selector:
+            return getattr(receiver, selector)
+
+        return getattr(receiver, selector.replace(':', '_'))(*args)
+
+
+class _Runtime:
+    @staticmethod
+    def class_getInstanceMethod(objc_class: ObjCInstance, selector: SEL) -> SEL:
+        # every class responds to every selector
+        return selector
+
+
+class _Struct:
+    def __init__(self, *args) -> None:
+        self.args = args
+
+
+class NSPoint(_Struct):
+    def __init__(self, x: float=0., y: float=0.) -> None:
+        super().__init__(x, y)
+        self.x = x
+        self.y = y
+
+
+class NSSize(_Struct):
+    def __init__(self, width: float=0., height: float=0.) -> None:
+        super().__init__(width, height)
+        self.width = width
+        self.height = height
+
+
+class NSRect(_Struct):
+    def __init__(self, origin: NSPoint=None, size: NSSize=None) -> None:
+        super().__init__(origin, size)
+        self.origin = origin or NSPoint()
+        self.size = size or NSSize()
+
+
+class NSEdgeInsets(_Struct):
+    pass
+
+
+def _module(name: str, **attributes) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__path__ = []
+    module.__dict__.update(attributes)
+
+    def __getattr__(attribute: str) -> Any:
+        if attribute.startswith('__'):
+            raise AttributeError(attribute)
+        # anything else the package imports is an opaque native object
+        value = ObjCInstance()
+        setattr(module, attribute, value)
+        return value
+
+    module.__getattr__ = __getattr__
+    return module
+
+
+def install() -> None:
+    """
+    Register the stub as the `rubicon` package and import applepy as on macOS.
+    Does nothing if applepy was already imported.
+    """
+    if 'applepy' in sys.modules:
+        return
+
+    api = dict(ObjCInstance=ObjCInstance,
+               ObjCClass=ObjCClass,
+               ObjCMethod=ObjCMethod,
+               NSObject=NSObject,
+               objc_method=lambda fn: fn,
+               objc_classmethod=lambda fn: fn,
+               objc_property=lambda *args, **kwargs: None)
+    runtime = dict(SEL=SEL,
+                   libobjc=_Runtime,
+                   objc_id=ctypes.c_void_p,
+                   objc_const=lambda library, name: name,
+                   load_library=lambda name: ObjCInstance(),
+                   send_super=lambda *args, **kwargs: None,
+                   Foundation=ObjCInstance())
+    structs = dict(NSRect=NSRect, NSPoint=NSPoint, NSSize=NSSize, NSEdgeInsets=NSEdgeInsets)
+
+    sys.modules['rubicon'] = _module('rubicon')
+    sys.modules['rubicon.objc'] = _module('rubicon.objc', **api, **runtime, **structs)
+    sys.modules['rubicon.objc.api'] = _module('rubicon.objc.api', **api)
+    sys.modules['rubicon.objc.runtime'] = _module('rubicon.objc.runtime', **runtime)
+    sys.modules['rubicon.objc.types'] = _module('rubicon.objc.types', **structs)
+    sys.modules['rubicon.objc.eventloop'] = _module('rubicon.objc.eventloop')
+
+    # the backend is chosen once, when applepy is imported
+    platform = sys.platform
+    sys.platform = 'darwin'
+    try:
+        import applepy
+    finally:
+        sys.platform = platform
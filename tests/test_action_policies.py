@@ -0,0 +1,126 @@
+import asyncio
+
+from applepy import ActionPolicy, Concurrency
+from applepy.base.actions import AsyncActionRunner
+
+
+class Action:
+    """ A coroutine function whose runs wait until they are released. """
+
+    def __init__(self) -> None:
+        self.started = 0
+        self.finished = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> None:
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self.finished += 1
+
+
+async def settle() -> None:
+    # let the started tasks and their done callbacks run
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def run(scenario) -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(scenario())
+    finally:
+        loop.close()
+
+
+def click_twice(policy: ActionPolicy):
+    async def scenario():
+        action = Action()
+        runner = AsyncActionRunner(action, policy)
+        runner.trigger()
+        await settle()
+        runner.trigger()
+        await settle()
+        return action, runner
+
+    return scenario
+
+
+def test_parallel():
+    async def scenario():
+        action, runner = await click_twice(ActionPolicy(max_concurrency=2))()
+        assert runner.running == 2 and action.started == 2
+
+        # the limit is reached, the third click is ignored
+        runner.trigger()
+        await settle()
+        assert action.started == 2
+
+        action.release.set()
+        await settle()
+        assert action.finished == 2 and runner.running == 0
+
+    run(scenario)
+
+
+def test_drop():
+    async def scenario():
+        action, runner = await click_twice(ActionPolicy(Concurrency.drop))()
+        assert runner.running == 1 and runner.pending == 0
+
+        action.release.set()
+        await settle()
+        assert action.started == 1 and action.finished == 1
+
+    run(scenario)
+
+
+def test_queue():
+    async def scenario():
+        action, runner = await click_twice(ActionPolicy(Concurrency.queue, max_queue=1))()
+        assert runner.running == 1 and runner.pending == 1
+
+        # the queue is full, the third click is ignored
+        runner.trigger()
+        assert runner.pending == 1
+
+        action.release.set()
+        await settle()
+        assert action.started == 2 and action.finished == 2
+        assert runner.running == 0 and runner.pending == 0
+
+    run(scenario)
+
+
+def test_restart():
+    async def scenario():
+        action, runner = await click_twice(ActionPolicy(Concurrency.restart))()
+        assert action.started == 2 and action.cancelled == 1
+        assert runner.running == 1
+
+        action.release.set()
+        await settle()
+        assert action.finished == 1 and runner.running == 0
+
+    run(scenario)
+
+
+def test_cancel_stops_running_and_queued_runs():
+    async def scenario():
+        action, runner = await click_twice(ActionPolicy(Concurrency.queue))()
+        runner.cancel()
+        await settle()
+
+        assert action.cancelled == 1
+        assert runner.running == 0 and runner.pending == 0
+
+        action.release.set()
+        await settle()
+        # the queued click never ran
+        assert action.started == 1 and action.finished == 0
+
+    run(scenario)
@@ -0,0 +1,90 @@
+from applepy import App
+from applepy.base.actions import ActionTable
+
+from objc_stub import ObjCInstance
+
+
+class EmptyApp(App):
+    def body(self):
+        pass
+
+
+def test_tags_start_at_one():
+    table = ActionTable()
+
+    assert table.add(print) == 1
+    assert table.add(repr) == 2
+    assert table.get(0) is None
+    assert table.get(3) is None
+    assert len(table) == 2
+
+
+def test_freed_slot_is_reused():
+    table = ActionTable()
+    first = table.add(print)
+    table.add(repr)
+
+    table.remove(first)
+    # removing twice must not free the slot twice
+    table.remove(first)
+
+    assert not table.owns(first)
+    assert len(table) == 1
+    assert table.add(str) == first
+    assert table.add(len) == 3
+
+
+def test_unregistered_slot_is_reused():
+    app = EmptyApp()
+    first, second = ObjCInstance(), ObjCInstance()
+    app.register_action(first, print)
+    tag = first.tag
+
+    app.unregister_action(first)
+
+    assert first.tag == 0
+    assert len(app._actions) == 0
+
+    app.register_action(second, repr)
+
+    assert second.tag == tag
+
+
+def test_stale_control_does_not_dispatch_the_new_action():
+    calls = []
+    app = EmptyApp()
+    old, new = ObjCInstance(), ObjCInstance()
+    app.register_action(old, lambda: calls.append('old'))
+    app.unregister_action(old)
+    app.register_action(new, lambda: calls.append('new'))
+
+    # the old control lost its tag, so it cannot reach the slot now used by the new one
+    app.invoke_action(old)
+    app.invoke_action(new)
+
+    assert calls == ['new']
+
+
+def test_unknown_tag_dispatches_nothing():
+    app = EmptyApp()
+    control = ObjCInstance()
+    control.tag = 42
+
+    app.invoke_action(control)
+
+    assert len(app.action_metrics.stats) == 0
+
+
+def test_registering_again_replaces_the_action():
+    calls = []
+    app = EmptyApp()
+    control = ObjCInstance()
+    app.register_action(control, lambda: calls.append('first'))
+    tag = control.tag
+
+    app.register_action(control, lambda: calls.append('second'))
+    app.invoke_action(control)
+
+    assert control.tag == tag
+    assert len(app._actions) == 1
+    assert calls == ['second']
@@ -0,0 +1,155 @@
+import queue
+
+from concurrent.futures import Future
+
+import pytest
+
+from applepy import Binding, ProcessAction, bindable
+from applepy.base import app as app_module
+from applepy.base.actions import ProcessActionRunner, ThreadActionRunner
+from applepy.base.transform_mixins import Enable
+
+from objc_stub import ObjCInstance
+
+
+class ViewModel:
+    def __init__(self) -> None:
+        self._progress = 0.
+
+    @bindable(float)
+    def progress(self) -> float:
+        return self._progress
+
+    @progress.setter
+    def progress(self, val: float) -> None:
+        self._progress = val
+
+
+class BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise RuntimeError('cannot schedule new futures after shutdown')
+
+
+class Manager:
+    def Queue(self) -> queue.Queue:
+        return queue.Queue()
+
+
+class App:
+    def __init__(self) -> None:
+        self.process_executor = BrokenPool()
+        self.process_manager = Manager()
+        self.pumps = []
+        self.executor = self
+
+    def submit(self, fn, *args):
+        self.pumps.append(fn)
+
+
+def test_failed_submit_starts_no_progress_pump(monkeypatch):
+    app = App()
+    monkeypatch.setattr(app_module, '_current_app', app)
+    caller = ObjCInstance()
+    caller.isEnabled = lambda: True
+    caller.setEnabled_ = lambda enabled: setattr(caller, 'enabled', enabled)
+    runner = ProcessActionRunner(ProcessAction(print, progress=Binding(ViewModel.progress, ViewModel())), caller)
+
+    with pytest.raises(RuntimeError):
+        runner()
+
+    assert not app.pumps
+    assert caller.enabled
+    assert not runner.running
+
+
+class ThreadApp:
+    """ Runs the submitted actions when told to, and UI calls right away. """
+
+    def __init__(self) -> None:
+        self.executor = self
+        self.submitted = []
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        self.submitted.append((future, fn, args))
+        return future
+
+    def finish(self) -> None:
+        future, fn, args = self.submitted.pop(0)
+        if future.set_running_or_notify_cancel():
+            future.set_result(fn(*args))
+
+    def call_on_ui_thread(self, fn, *args) -> None:
+        fn(*args)
+
+
+class Control(Enable):
+    def __init__(self) -> None:
+        self.ns_object = ObjCInstance()
+        self.ns_object.isEnabled = lambda: self.ns_object.enabled
+        self.enabled = True
+
+
+@pytest.fixture
+def thread_app(monkeypatch):
+    app = ThreadApp()
+    monkeypatch.setattr(app_module, '_current_app', app)
+    return app
+
+
+def test_thread_action_keeps_the_state_set_by_the_action(thread_app):
+    control = Control()
+
+    def disable():
+        control.enabled = False
+
+    runner = ThreadActionRunner(disable, control.ns_object, control)
+    runner()
+
+    assert control.ns_object.enabled is False
+
+    thread_app.finish()
+
+    assert not runner.running
+    assert control.enabled is False and control.ns_object.enabled is False
+
+    # the bridge's record of the native value is still right
+    control.enabled = True
+
+    assert control.ns_object.enabled is True
+
+
+def test_cancelled_thread_action_keeps_its_control_disabled_until_it_finishes(thread_app):
+    control = Control()
+    runner = ThreadActionRunner(lambda: None, control.ns_object, control)
+    runner()
+    thread_app.submitted[0][0].set_running_or_notify_cancel()
+
+    runner.cancel()
+    runner()
+
+    assert runner.running
+    assert control.ns_object.enabled is False
+    assert len(thread_app.submitted) == 1
+
+    future, fn, args = thread_app.submitted.pop()
+    future.set_result(fn(*args))
+
+    assert not runner.running
+    assert control.ns_object.enabled is True
+
+
+def test_cancelled_process_action_ignores_its_result(thread_app):
+    results = []
+    control = Control()
+    thread_app.process_executor = thread_app
+    runner = ProcessActionRunner(ProcessAction(abs, -1, on_result=results.append), control.ns_object, control)
+    runner()
+    thread_app.submitted[0][0].set_running_or_notify_cancel()
+
+    runner.cancel()
+    future, fn, args = thread_app.submitted.pop()
+    future.set_result(fn(*args))
+
+    assert not results
+    assert control.ns_object.enabled is True
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import threading
+
+from applepy import App, Size
+from applepy.base import app as app_module
+from applepy.scenes import Window
+from applepy.views.controls import Label
+
+
+class FailingApp(App):
+    def body(self):
+        raise ValueError('broken body')
+
+
+def test_background_scene_setup_errors_are_logged(caplog):
+    app = FailingApp(background_construction=True)
+    app.loop = asyncio.new_event_loop()
+
+    async def launch():
+        app.setup_scene()
+        # let the worker thread evaluate the body and the task finish
+        for _ in range(100):
+            if caplog.records:
+                break
+            await asyncio.sleep(.01)
+
+    try:
+        with caplog.at_level(logging.ERROR, logger='applepy.base.app'):
+            app.loop.run_until_complete(launch())
+    finally:
+        app.loop.close()
+        app.executor.shutdown()
+
+    assert [r.getMessage() for r in caplog.records] == ['Scene setup failed.']
+    assert isinstance(caplog.records[0].exc_info[1], ValueError)
+
+
+# thread that ran each phase of the construction
+threads = {}
+
+
+class RecordingWindow(Window):
+    def parse(self):
+        threads['parse'] = threading.current_thread()
+        return super().parse()
+
+
+class BackgroundApp(App):
+    def body(self):
+        threads['body'] = threading.current_thread()
+        with RecordingWindow(title='background', size=Size(100, 100)) as window:
+            Label(text='built in a worker thread')
+        return window
+
+
+def test_background_construction_parses_in_the_main_thread(monkeypatch):
+    app = BackgroundApp(background_construction=True)
+    monkeypatch.setattr(app_module, '_current_app', app)
+    app.loop = asyncio.new_event_loop()
+
+    async def launch():
+        app.setup_scene()
+        for _ in range(100):
+            if getattr(app, '_scene', None):
+                break
+            await asyncio.sleep(.01)
+
+    try:
+        app.loop.run_until_complete(launch())
+    finally:
+        app.loop.close()
+        app.executor.shutdown()
+
+    assert threads['body'] is not threading.main_thread()
+    assert threads['parse'] is threading.main_thread()
+    assert app._scene.window
@@ -0,0 +1,95 @@
+import pytest
+
+from applepy.base.utils import attachable, get_attachable, get_attachables
+from applepy.base.view import View
+from applepy.scenes import Window
+from applepy.views.containers import Toolbar
+from applepy.views.controls import Label
+from applepy.views.menu import MainMenu, Menu, StatusIcon
+
+
+class Panel(View):
+    def parse(self):
+        pass
+
+    def get_ns_object(self):
+        pass
+
+
+class SidePanel(Panel):
+    pass
+
+
+class Footer(View):
+    def parse(self):
+        pass
+
+    def get_ns_object(self):
+        pass
+
+
+class Host:
+    @attachable(Panel)
+    def panel(self) -> Panel:
+        pass
+
+    @attachable(Footer)
+    def footer(self) -> Footer:
+        pass
+
+
+class SideHost(Host):
+    # hides the `panel` attachable of its base
+    @attachable(SidePanel)
+    def panel(self) -> SidePanel:
+        pass
+
+
+def test_attachables_of_a_class():
+    assert get_attachables(Host) == {'panel': vars(Host)['panel'], 'footer': vars(Host)['footer']}
+    assert get_attachables(Window).keys() == {'menu', 'toolbar'}
+
+
+def test_attachables_follow_the_mro():
+    attachables = get_attachables(SideHost)
+
+    assert attachables['panel'] is vars(SideHost)['panel']
+    assert attachables['footer'] is vars(Host)['footer']
+
+
+def test_attachable_of_a_child_class():
+    assert get_attachable(Window, MainMenu) == 'menu'
+    assert get_attachable(Window, Toolbar) == 'toolbar'
+    assert get_attachable(StatusIcon, Menu) == 'menu'
+    # subclasses of the attachable type are accepted
+    assert get_attachable(Host, SidePanel) == 'panel'
+    assert get_attachable(SideHost, SidePanel) == 'panel'
+    assert get_attachable(SideHost, Footer) == 'footer'
+
+
+def test_missing_attachable():
+    assert get_attachable(Window, Label) is None
+    # hidden by the subclass, which only accepts side panels
+    assert get_attachable(SideHost, Panel) is None
+
+
+def test_attachable_lookup_is_cached():
+    get_attachable(Host, Footer)
+    hits = get_attachable.cache_info().hits
+
+    assert get_attachable(Host, Footer) == 'footer'
+    assert get_attachable.cache_info().hits == hits + 1
+
+
+def test_ambiguous_attachable():
+    class Ambiguous:
+        @attachable(Panel)
+        def left(self) -> Panel:
+            pass
+
+        @attachable(Panel)
+        def right(self) -> Panel:
+            pass
+
+    with pytest.raises(Exception, match='More than one attachable'):
+        get_attachable(Ambiguous, Panel)
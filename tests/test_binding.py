@@ -0,0 +1,43 @@
+from applepy import Binding, Size, bindable
+from applepy.scenes import Window
+from applepy.views.controls import TextField
+
+
+class ViewModel:
+    def __init__(self) -> None:
+        self._text = ''
+
+    @bindable(str)
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, val: str) -> None:
+        self._text = val
+
+
+def test_bindable_leaves_its_class_untouched():
+    assert not hasattr(ViewModel, 'bound_text')
+
+
+def test_unbound_text_field_reads_no_binding():
+    with Window(title='test', size=Size(100, 100)) as window:
+        text_field = TextField(text='')
+
+    window.parse()
+    text_field.ns_object.stringValue = 'typed'
+    text_field._text_did_change()
+
+    assert text_field.text == 'typed'
+    assert 'bound_text' not in vars(text_field)
+
+
+def test_bound_text_field():
+    vm = ViewModel()
+    with Window(title='test', size=Size(100, 100)):
+        text_field = TextField(text=Binding(ViewModel.text, vm))
+
+    vm.text = 'hello'
+
+    assert text_field.text == 'hello'
+    text_field.dispose()
@@ -0,0 +1,68 @@
+import gc
+
+from applepy import bindable
+from applepy.backend import bridge
+from applepy.backend.bridge import forget, remember, set_property
+
+from objc_stub import ObjCInstance
+
+
+class ViewModel:
+    def __init__(self) -> None:
+        self._text = 'hello'
+        self._enabled = True
+
+    @bindable(str)
+    def text(self) -> str:
+        return self._text
+
+    @bindable(bool)
+    def enabled(self) -> bool:
+        return self._enabled
+
+
+def test_same_value_is_written_once():
+    ns_object = ObjCInstance()
+
+    assert set_property(ns_object, 'stringValue', 'hello')
+    assert not set_property(ns_object, 'stringValue', 'hello')
+    assert set_property(ns_object, 'stringValue', 'world')
+    assert ns_object.stringValue == 'world'
+
+
+def test_wrapped_values_are_compared_as_plain_values():
+    vm = ViewModel()
+    ns_object = ObjCInstance()
+
+    remember(ns_object, 'stringValue', 'hello')
+    assert not set_property(ns_object, 'stringValue', vm.text)
+
+    assert set_property(ns_object, 'enabled', vm.enabled)
+    assert not set_property(ns_object, 'enabled', True)
+    assert not set_property(ns_object, 'enabled', vm.enabled)
+
+
+def test_native_objects_are_compared_by_identity():
+    ns_object = ObjCInstance()
+    color = ObjCInstance()
+
+    assert set_property(ns_object, 'backgroundColor', color)
+    assert not set_property(ns_object, 'backgroundColor', color)
+    assert set_property(ns_object, 'backgroundColor', ObjCInstance())
+
+
+def test_written_values_are_dropped_with_the_object():
+    gc.collect()
+    before = len(bridge._shadow)
+    ns_object = ObjCInstance()
+    set_property(ns_object, 'stringValue', 'hello')
+    other = ObjCInstance()
+    set_property(other, 'stringValue', 'hello')
+    forget(other)
+
+    assert other not in bridge._shadow
+
+    del ns_object
+    gc.collect()
+
+    assert len(bridge._shadow) == before
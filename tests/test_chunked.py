@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+from applepy.base import chunked as chunked_module
+from applepy.base.binding import AbstractBinding
+from applepy.base.chunked import chunked
+
+
+class Clock:
+    """ Advances by `step_ms` every time it is read, so every item costs the same time. """
+
+    def __init__(self, step_ms: float) -> None:
+        self.now = 0.
+        self.step = step_ms / 1000.
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(1.)
+    monkeypatch.setattr(chunked_module, 'perf_counter', clock)
+    return clock
+
+
+class Progress(AbstractBinding):
+    def __init__(self) -> None:
+        self.values = []
+
+    @property
+    def value(self):
+        return self.values[-1] if self.values else None
+
+    @value.setter
+    def value(self, new_value):
+        self.values.append(new_value)
+
+    def on_changed(self):
+        pass
+
+
+def collect(iterable, **kwargs):
+    """ Runs `chunked` to completion; returns the items and the progress reported at each slice. """
+    reported = []
+
+    async def consume():
+        return [item async for item in chunked(iterable, progress=reported.append, **kwargs)]
+
+    return asyncio.run(consume()), reported
+
+
+def test_yields_every_item_in_order(clock):
+    items, _ = collect(range(25), per_tick_ms=4.)
+
+    assert items == list(range(25))
+
+
+def test_slices_end_at_the_time_budget(clock):
+    # Each read of the clock costs 1ms: the deadline read plus one read per item,
+    # so a 4ms budget fits 4 items per slice.
+    _, reported = collect([None] * 10, per_tick_ms=4.)
+
+    assert reported == [40., 80., 100.]
+
+
+def test_a_larger_budget_makes_fewer_slices(clock):
+    _, small = collect([None] * 40, per_tick_ms=4.)
+    _, large = collect([None] * 40, per_tick_ms=20.)
+
+    assert len(large) < len(small)
+    assert small[-1] == large[-1] == 100.
+
+
+def test_progress_counts_items_when_the_total_is_unknown(clock):
+    _, reported = collect(iter(range(6)), per_tick_ms=4.)
+
+    assert reported == [4., 6.]
+
+
+def test_an_explicit_total_turns_progress_into_a_percentage(clock):
+    _, reported = collect(iter(range(8)), per_tick_ms=4., total=8)
+
+    assert reported == [50., 100.]
+
+
+def test_an_empty_iterable_still_reports_progress(clock):
+    items, reported = collect([], per_tick_ms=4.)
+
+    assert items == []
+    assert reported == [0.]
+
+
+def test_progress_binding_is_assigned(clock):
+    progress = Progress()
+
+    async def consume():
+        async for _ in chunked(range(8), per_tick_ms=4., progress=progress):
+            pass
+
+    asyncio.run(consume())
+
+    assert progress.values == [50., 100.]
+
+
+def test_gives_the_event_loop_back_between_slices(clock):
+    log = []
+
+    async def other():
+        for _ in range(3):
+            log.append('other')
+            await asyncio.sleep(0)
+
+    async def consume():
+        async for item in chunked(range(8), per_tick_ms=4.):
+            log.append(item)
+
+    async def main():
+        await asyncio.gather(consume(), other())
+
+    asyncio.run(main())
+
+    assert log.index('other') < log.index(4)
+    assert [entry for entry in log if entry != 'other'] == list(range(8))
+
+
+def test_cancelling_midway_stops_the_iteration(clock):
+    seen = []
+    reported = []
+
+    async def consume():
+        async for item in chunked(range(100), per_tick_ms=4., progress=reported.append):
+            seen.append(item)
+
+    async def main():
+        task = asyncio.ensure_future(consume())
+        # Let the first two slices run, then cancel while the task waits between slices.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert 0 < len(seen) < 100
+    assert seen == list(range(len(seen)))
+    assert reported and reported[-1] < 100.
+
+
+def test_breaking_out_does_not_report_completion(clock):
+    reported = []
+
+    async def consume():
+        async for item in chunked(range(100), per_tick_ms=4., progress=reported.append):
+            if item == 9:
+                break
+
+    asyncio.run(consume())
+
+    assert reported == [4., 8.]
@@ -0,0 +1,31 @@
+import gc
+import weakref
+
+from applepy.base import delegates
+from applepy.backend.app_kit import NSObject
+
+
+class _Delegate(NSObject):
+    pass
+
+
+class _Owner:
+    pass
+
+
+def test_delegate_keeps_its_owner_alive_until_released():
+    owner = _Owner()
+    alive = weakref.ref(owner)
+    delegate = delegates.create_delegate(_Delegate, owner)
+
+    del owner
+    gc.collect()
+
+    assert alive() is not None
+    assert delegates.get_owner(delegate) is alive()
+
+    delegates.release_delegate(delegate)
+    gc.collect()
+
+    assert delegates.get_owner(delegate) is None
+    assert alive() is None
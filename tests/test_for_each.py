@@ -0,0 +1,120 @@
+from typing import List, NamedTuple
+
+import pytest
+
+from applepy import Binding, Size, bindable
+from applepy.base.errors import DuplicateKeyError
+from applepy.scenes import Window
+from applepy.views.controls import Label
+from applepy.views.layout import ForEach, VerticalStack
+
+
+class Todo(NamedTuple):
+    id: int
+    title: str
+
+
+class TodoList:
+    def __init__(self, *titles: str) -> None:
+        self._items = [Todo(i, title) for i, title in enumerate(titles)]
+
+    @bindable(list)
+    def items(self) -> List[Todo]:
+        return self._items
+
+    @items.setter
+    def items(self, val: List[Todo]) -> None:
+        self._items = val
+
+
+def build(todos: TodoList) -> ForEach:
+    with Window(title='todos', size=Size(100, 100)) as window:
+        with VerticalStack():
+            for_each = ForEach(Binding(TodoList.items, todos),
+                               key=lambda todo: todo.id,
+                               content=lambda todo: Label(text=todo.title))
+
+    window.parse()
+    return for_each
+
+
+def rows(for_each: ForEach) -> List[Label]:
+    views = {id(view.ns_object): view for row in for_each._rows.values() for view in row.views}
+    return [views[id(subview)] for subview in for_each.ns_object.arrangedSubviews]
+
+
+def titles(for_each: ForEach) -> List[str]:
+    return [label.text for label in rows(for_each)]
+
+
+def test_bound_list():
+    todos = TodoList('a', 'b')
+    for_each = build(todos)
+
+    assert TodoList.items.__get__(todos) is todos._items
+    assert titles(for_each) == ['a', 'b']
+
+
+def test_insert_keeps_the_views_of_other_items():
+    todos = TodoList('a', 'b')
+    for_each = build(todos)
+    a, b = rows(for_each)
+
+    todos.items = [todos.items[0], Todo(7, 'new'), todos.items[1]]
+
+    assert titles(for_each) == ['a', 'new', 'b']
+    assert rows(for_each)[0] is a and rows(for_each)[2] is b
+
+
+def test_remove_disposes_the_views_of_removed_items():
+    todos = TodoList('a', 'b', 'c')
+    for_each = build(todos)
+    a, b, c = rows(for_each)
+
+    todos.items = [todos.items[0], todos.items[2]]
+
+    assert titles(for_each) == ['a', 'c']
+    assert rows(for_each) == [a, c]
+    assert b._disposed
+
+
+def test_reorder_moves_the_views():
+    todos = TodoList('a', 'b', 'c')
+    for_each = build(todos)
+    a, b, c = rows(for_each)
+
+    todos.items = list(reversed(todos.items))
+
+    assert rows(for_each) == [c, b, a]
+
+
+def test_changed_item_gets_new_views():
+    todos = TodoList('a', 'b')
+    for_each = build(todos)
+    a, b = rows(for_each)
+
+    todos.items = [Todo(0, 'renamed'), todos.items[1]]
+
+    assert titles(for_each) == ['renamed', 'b']
+    assert rows(for_each)[0] is not a and rows(for_each)[1] is b
+    assert a._disposed
+
+
+def test_update_after_changing_the_list_in_place():
+    todos = TodoList('a')
+    for_each = build(todos)
+
+    todos.items.append(Todo(1, 'b'))
+    assert titles(for_each) == ['a']
+
+    for_each.update()
+
+    assert titles(for_each) == ['a', 'b']
+
+
+def test_duplicate_keys():
+    todos = TodoList('a')
+    for_each = build(todos)
+
+    with pytest.raises(DuplicateKeyError):
+        for_each.update([Todo(1, 'b'), Todo(1, 'c')])
@@ -0,0 +1,142 @@
+import logging
+
+import pytest
+
+from applepy.base import idle as idle_module
+from applepy.base.idle import IdleQueue
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, ms: float) -> None:
+        self.now += ms / 1000.
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(idle_module, 'perf_counter', clock)
+    return clock
+
+
+class RunLoop:
+    """ Stands in for the App: records tick requests and reports pending events. """
+
+    def __init__(self) -> None:
+        self.pending = False
+        self.requests = []
+        self.queue = IdleQueue(lambda: self.pending, self.requests.append)
+
+
+def steps(clock: Clock, log: list, name: str, count: int, ms: float):
+    for i in range(count):
+        clock.advance(ms)
+        log.append(f'{name}{i}')
+        yield
+
+
+def test_tick_stops_when_its_budget_is_spent(clock):
+    log = []
+    loop = RunLoop()
+    loop.queue.add(steps(clock, log, 'a', 10, ms=3.), budget_ms=8., priority=0)
+
+    assert loop.requests == [0.]
+
+    loop.queue.tick()
+
+    # 3 steps of 3 ms reach the 8 ms budget
+    assert log == ['a0', 'a1', 'a2']
+    assert loop.requests == [0., 0.]
+
+    loop.queue.tick()
+
+    assert log[3:] == ['a3', 'a4', 'a5']
+
+
+def test_idle_work_waits_for_pending_events(clock):
+    log = []
+    loop = RunLoop()
+    loop.queue.add(lambda: log.append('run'), budget_ms=8., priority=0)
+    loop.pending = True
+
+    loop.queue.tick()
+
+    assert log == []
+    # polled again a little later
+    assert loop.requests == [0., .01]
+
+    loop.pending = False
+    loop.queue.tick()
+
+    assert log == ['run']
+    assert len(loop.queue) == 0
+
+
+def test_events_arriving_during_a_tick_end_it(clock):
+    log = []
+    loop = RunLoop()
+
+    def work():
+        for i in range(10):
+            log.append(i)
+            loop.pending = i == 1
+            yield
+
+    loop.queue.add(work, budget_ms=100., priority=0)
+    loop.queue.tick()
+
+    assert log == [0, 1]
+
+
+def test_priorities_and_turns(clock):
+    log = []
+    loop = RunLoop()
+    loop.queue.add(steps(clock, log, 'low', 1, ms=0.), budget_ms=8., priority=0)
+    loop.queue.add(steps(clock, log, 'a', 2, ms=0.), budget_ms=8., priority=1)
+    loop.queue.add(steps(clock, log, 'b', 2, ms=0.), budget_ms=8., priority=1)
+
+    loop.queue.tick()
+
+    assert log == ['a0', 'b0', 'a1', 'b1', 'low0']
+
+
+def test_cancelled_task_is_closed(clock):
+    log = []
+    closed = []
+    loop = RunLoop()
+
+    def work():
+        try:
+            while True:
+                log.append('step')
+                yield
+        finally:
+            closed.append(True)
+
+    task = loop.queue.add(work(), budget_ms=0., priority=0)
+    loop.queue.tick()
+    task.cancel()
+    loop.queue.tick()
+
+    assert log == ['step']
+    assert closed == [True]
+    assert len(loop.queue) == 0
+
+
+def test_failing_task_is_logged_and_dropped(clock, caplog):
+    log = []
+    loop = RunLoop()
+    loop.queue.add(lambda: 1 / 0, budget_ms=8., priority=1)
+    loop.queue.add(lambda: log.append('next'), budget_ms=8., priority=0)
+
+    with caplog.at_level(logging.ERROR, logger='applepy.base.idle'):
+        loop.queue.tick()
+
+    assert 'failed' in caplog.text
+    assert log == ['next']
+    assert len(loop.queue) == 0
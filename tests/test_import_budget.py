@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TESTS)
+
+# `import applepy` only sets up the lazy namespace: the package, the backend switch and the lazy loader
+IMPORT_BUDGET = 6
+
+
+def run(code: str, *options: str) -> subprocess.CompletedProcess:
+    setup = f'import sys; sys.path[:0] = [{TESTS!r}, {ROOT!r}]; from objc_stub import install; install(); '
+    return subprocess.run([sys.executable, *options, '-c', setup + code],
+                          capture_output=True, text=True, check=True)
+
+
+def test_import_time_budget():
+    res = run('', '-X', 'importtime')
+
+    modules = [line.rsplit('|', 1)[1].strip() for line in res.stderr.splitlines()
+               if line.startswith('import time:') and 'applepy' in line]
+
+    assert 'applepy' in modules
+    assert len(modules) <= IMPORT_BUDGET, modules
+
+
+def test_import_resolves_no_native_class():
+    res = run('from objc_stub import ObjCClass; '
+              'import applepy.backend.app_kit as app_kit; '
+              'print(sorted(ObjCClass._classes), app_kit._libraries_loaded)')
+
+    assert res.stdout.split() == ["['NSObject']", 'False']
+
+
+def test_components_only_resolve_the_classes_they_use():
+    res = run('from objc_stub import ObjCClass; '
+              'from applepy.views.controls import Label; '
+              'print(" ".join(sorted(ObjCClass._classes)))')
+
+    classes = set(res.stdout.split())
+    assert 'NSTextField' in classes
+    assert not {'NSDatePicker', 'NSToolbar', 'NSAlert', 'NSProgressIndicator'} & classes, classes
+
+
+def test_public_names_are_only_imported_when_used():
+    res = run('import applepy; '
+              'before = sorted(m for m in sys.modules if m.startswith("applepy")); '
+              'applepy.Timer; '
+              'after = sorted(m for m in sys.modules if m.startswith("applepy")); '
+              'print(len(before), "applepy.views.timer" in before, "applepy.views.timer" in after, '
+              '"applepy.views.controls.date" in after)')
+
+    count, timer_before, timer_after, date_after = res.stdout.split()
+    assert int(count) <= IMPORT_BUDGET
+    assert (timer_before, timer_after, date_after) == ('False', 'True', 'False')
@@ -0,0 +1,107 @@
+import asyncio
+
+from concurrent.futures import Future
+
+import pytest
+
+from applepy import App
+from applepy.base.actions import ActionMetrics, ActionSample, ThreadActionRunner, action_label
+
+from objc_stub import ObjCInstance
+
+
+class EmptyApp(App):
+    def body(self):
+        pass
+
+
+def control() -> ObjCInstance:
+    caller = ObjCInstance()
+    caller.isEnabled = lambda: True
+    return caller
+
+
+def toggle() -> None:
+    pass
+
+
+def test_histograms_are_kept_per_registration():
+    app = EmptyApp()
+    first, second = control(), control()
+    app.register_action(first, lambda: None)
+    app.register_action(second, lambda: None)
+
+    app.invoke_action(first)
+    app.invoke_action(first)
+    app.invoke_action(second)
+
+    counts = {name: stats.total.count for name, stats in app.action_metrics.stats.items()}
+
+    assert counts == {action_label(lambda: None, first): 2, action_label(lambda: None, second): 1}
+
+
+def test_label_is_readable():
+    caller = control()
+    caller.tag = 3
+
+    assert action_label(toggle, caller) == f'{__name__}.toggle #3'
+    assert action_label(toggle) == f'{__name__}.toggle'
+
+
+def test_slow_runs_are_reported():
+    slow = []
+    metrics = ActionMetrics(threshold_ms=10., on_slow=slow.append)
+
+    metrics.record(ActionSample('fast', 0., .001, 0.))
+    metrics.record(ActionSample('slow', .005, .01, .001))
+
+    assert [s.action for s in slow] == ['slow']
+    assert metrics.stats['slow'].total.max == pytest.approx(.016)
+
+
+def test_async_invocations_are_recorded():
+    app = EmptyApp()
+    caller = control()
+
+    async def load():
+        pass
+
+    app.register_async_action(caller, load)
+    asyncio.new_event_loop().run_until_complete(app.invoke_action_async(caller))
+
+    assert app.action_metrics.stats[action_label(load, caller)].total.count == 1
+
+
+class ThreadApp:
+    def __init__(self) -> None:
+        self.executor = self
+        self.submitted = []
+
+    def submit(self, fn) -> Future:
+        future = Future()
+        self.submitted.append((future, fn))
+        return future
+
+    def call_on_ui_thread(self, fn, *args) -> None:
+        fn(*args)
+
+
+def test_thread_actions_are_recorded(monkeypatch):
+    from applepy.base import app as app_module
+
+    app = ThreadApp()
+    monkeypatch.setattr(app_module, '_current_app', app)
+    metrics = ActionMetrics(threshold_ms=None)
+    caller = control()
+    caller.tag = 1
+    runner = ThreadActionRunner(toggle, caller, metrics=metrics)
+
+    runner()
+    future, fn = app.submitted.pop()
+    future.set_running_or_notify_cancel()
+    future.set_result(fn())
+
+    stats = metrics.stats[action_label(toggle, caller)]
+
+    assert stats.total.count == 1
+    assert stats.queue.count == 1 and stats.emit.max == 0.
@@ -0,0 +1,93 @@
+from pydispatch import dispatcher
+
+from applepy import Binding, Size, bindable
+from applepy.scenes import Window
+from applepy.views.controls import Label
+
+
+class ViewModel:
+    def __init__(self) -> None:
+        self._hint = 'first'
+
+    @bindable(str)
+    def hint(self) -> str:
+        return self._hint
+
+    @hint.setter
+    def hint(self, val: str) -> None:
+        self._hint = val
+
+
+def receivers(bindable) -> list:
+    return list(dispatcher.getReceivers(sender=dispatcher.Anonymous, signal=bindable.on_changed._id))
+
+
+def label_in_window():
+    with Window(title='modifiers', size=Size(100, 100)) as window:
+        label = Label(text='label')
+
+    return window, label
+
+
+def test_repeated_modifier_replaces_the_previous_one():
+    _, label = label_in_window()
+    label.set_tooltip('a').set_tooltip('b')
+
+    assert [(m.target, m.value) for m in label.modifiers] == [('tooltip', 'b')]
+
+
+def test_modifiers_apply_in_order_of_their_last_write():
+    applied = []
+    window, label = label_in_window()
+    record = lambda view, value: applied.append(value)
+
+    label.modify('first', 1, record)
+    label.modify('second', 2, record)
+    label.modify('first', 3, record)
+
+    assert [m.target for m in label.modifiers] == ['second', 'first']
+
+    window.parse()
+
+    assert applied == [2, 3]
+    window.dispose()
+
+
+def test_bound_modifier_follows_its_binding():
+    vm = ViewModel()
+    window, label = label_in_window()
+    label.set_tooltip(Binding(ViewModel.hint, vm))
+    window.parse()
+
+    assert label.tooltip == 'first'
+    assert label.ns_object.toolTip == 'first'
+
+    vm.hint = 'second'
+
+    assert label.ns_object.toolTip == 'second'
+    window.dispose()
+
+
+def test_reapply_after_a_binding_changes():
+    vm = ViewModel()
+    window, label = label_in_window()
+    label.set_tooltip(Binding(ViewModel.hint, vm))
+    label.modify('text', 'label')
+    window.parse()
+
+    # overwritten by hand, then the bound value changes again
+    label.tooltip = 'manual'
+    label.text = 'manual'
+    vm._hint = 'second'
+
+    label.reapply('tooltip')
+
+    assert label.tooltip == 'second'
+    assert label.ns_object.toolTip == 'second'
+    assert label.text == 'manual'
+    assert len(receivers(ViewModel.hint)) == 1
+
+    label.reapply()
+
+    assert label.text == 'label'
+    window.dispose()
@@ -0,0 +1,94 @@
+from applepy import PartialView, Size, bindable, template
+from applepy.scenes import Window
+from applepy.views.controls import Label
+from applepy.views.layout import VerticalStack
+
+
+class ViewModel:
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    @bindable(int)
+    def count(self) -> int:
+        return self._count
+
+    @count.setter
+    def count(self, val: int) -> None:
+        self._count = val
+
+
+class Counter(PartialView):
+    def __init__(self, vm: ViewModel) -> None:
+        self.vm = vm
+        super().__init__()
+
+    def body(self):
+        for i in range(self.vm.count):
+            Label(text=f'item {i}')
+
+
+def test_partial_view_as_window_content():
+    vm = ViewModel(2)
+    with Window(title='test', size=Size(100, 100)) as window:
+        counter = Counter(vm)
+
+    window.parse()
+
+    assert window.window.contentView is counter.ns_object
+    assert len(counter.ns_object.arrangedSubviews) == 2
+
+
+def test_partial_view_in_stack():
+    vm = ViewModel(2)
+    with Window(title='test', size=Size(100, 100)) as window:
+        with VerticalStack() as stack:
+            counter = Counter(vm)
+
+    window.parse()
+
+    assert stack.ns_object.arrangedSubviews == [counter.ns_object]
+    assert len(counter.ns_object.arrangedSubviews) == 2
+
+
+def test_partial_view_renders_again_when_a_dependency_changes():
+    vm = ViewModel(2)
+    with Window(title='test', size=Size(100, 100)) as window:
+        counter = Counter(vm)
+
+    window.parse()
+    vm.count = 3
+
+    assert len(counter.ns_object.arrangedSubviews) == 3
+
+
+def test_partial_view_copied_by_a_template():
+    @template
+    def counter_window(vm: ViewModel) -> Window:
+        with Window(title='test', size=Size(100, 100)) as window:
+            Counter(vm)
+        return window
+
+    counter_window(ViewModel(2))
+    vm = ViewModel(3)
+    window = counter_window(vm)
+    window.parse()
+    counter = window.window.contentView
+
+    assert len(counter.arrangedSubviews) == 3
+
+    vm.count = 1
+
+    assert len(counter.arrangedSubviews) == 1
+
+
+def test_partial_view_disposed_before_parse():
+    vm = ViewModel(2)
+    with Window(title='test', size=Size(100, 100)) as window:
+        with VerticalStack():
+            counter = Counter(vm)
+
+    window.dispose()
+    vm.count = 3
+
+    assert counter._disposed
+    assert not counter._connected_signals
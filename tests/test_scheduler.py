@@ -0,0 +1,103 @@
+import threading
+
+from time import monotonic
+
+from applepy.base.scheduler import TimerScheduler
+
+
+class Deliveries:
+    """ Records the callbacks delivered by each wakeup of a scheduler. """
+
+    def __init__(self, expected: int) -> None:
+        self.wakeups = []
+        self._expected = expected
+        self._done = threading.Event()
+
+    def __call__(self, fn, callbacks) -> None:
+        self.wakeups.append([c.__name__ for c in callbacks])
+        fn(callbacks)
+        if sum(len(w) for w in self.wakeups) >= self._expected:
+            self._done.set()
+
+    def wait(self) -> None:
+        assert self._done.wait(5.)
+
+
+def tick(name: str):
+    def callback() -> None:
+        pass
+
+    callback.__name__ = name
+    return callback
+
+
+def test_overlapping_windows_share_a_wakeup():
+    deliveries = Deliveries(2)
+    scheduler = TimerScheduler(deliveries)
+    now = monotonic()
+
+    # a's window is still open when b is due
+    scheduler.call_at(now + .05, tick('a'), tolerance=.2)
+    scheduler.call_at(now + .1, tick('b'))
+    deliveries.wait()
+
+    assert deliveries.wakeups == [['a', 'b']]
+    assert scheduler.wakeups_per_minute == 1
+    assert len(scheduler) == 0
+
+
+def test_separate_windows_wake_up_separately():
+    deliveries = Deliveries(2)
+    scheduler = TimerScheduler(deliveries)
+    now = monotonic()
+
+    scheduler.call_at(now + .05, tick('a'))
+    scheduler.call_at(now + .3, tick('b'))
+    deliveries.wait()
+
+    assert deliveries.wakeups == [['a'], ['b']]
+
+
+def test_timer_due_later_is_not_delivered_early():
+    deliveries = Deliveries(2)
+    scheduler = TimerScheduler(deliveries)
+    now = monotonic()
+
+    # b's window only opens after a's closed
+    scheduler.call_at(now + .3, tick('b'), tolerance=.1)
+    scheduler.call_at(now + .05, tick('a'))
+    deliveries.wait()
+
+    assert deliveries.wakeups == [['a'], ['b']]
+
+
+def test_earlier_timer_wakes_the_thread_sooner():
+    deliveries = Deliveries(1)
+    scheduler = TimerScheduler(deliveries)
+    late = scheduler.call_later(60., tick('late'))
+
+    started = monotonic()
+    scheduler.call_later(.05, tick('soon'))
+    deliveries.wait()
+
+    assert deliveries.wakeups == [['soon']]
+    assert monotonic() - started < 5.
+    late.cancel()
+
+
+def test_cancelled_timers_are_dropped():
+    deliveries = Deliveries(1)
+    scheduler = TimerScheduler(deliveries)
+    handles = [scheduler.call_later(.05, tick(f'cancelled {i}')) for i in range(5)]
+    scheduler.call_later(.1, tick('kept'))
+
+    for handle in handles:
+        handle.cancel()
+
+    assert len(scheduler) == 1
+    # cancelled entries are compacted once they are the majority
+    assert len(scheduler._latest) <= 2 * len(scheduler)
+
+    deliveries.wait()
+
+    assert deliveries.wakeups == [['kept']]
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from applepy import App, Size
+from applepy.base.scope import current_scope, push_scope, pop_scope, reset_scope
+from applepy.scenes import Window
+from applepy.views.controls import Label
+from applepy.views.layout import VerticalStack
+
+
+class EmptyApp(App):
+    def body(self):
+        pass
+
+
+def test_nested_scopes_are_balanced():
+    with Window(title='scope', size=Size(100, 100)) as window:
+        assert current_scope() is window
+        with VerticalStack() as stack:
+            assert current_scope() is stack
+            label = Label(text='label')
+        assert current_scope() is window
+
+    assert current_scope() is None
+    assert label.parent is stack and stack.parent is window
+
+
+def test_scope_closed_by_an_exception():
+    with pytest.raises(ValueError):
+        with Window(title='scope', size=Size(100, 100)):
+            with VerticalStack():
+                raise ValueError()
+
+    assert current_scope() is None
+
+
+def test_reset_scope_after_an_exception():
+    window = Window(title='scope', size=Size(100, 100))
+    push_scope(window)
+    try:
+        raise ValueError()
+    except ValueError:
+        # a scope left open by code that does not use `with`
+        pass
+
+    assert current_scope() is window
+    # every build starts from an empty scope
+    assert EmptyApp().build(current_scope) is None
+
+    reset_scope()
+
+    assert current_scope() is None
+
+
+def test_failed_build_leaves_the_caller_scope_untouched():
+    def body():
+        push_scope(Window(title='scope', size=Size(100, 100)))
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        EmptyApp().build(body)
+
+    assert current_scope() is None
+    push_scope('outer')
+    assert pop_scope() == 'outer'
+
+
+def test_trees_built_concurrently():
+    app = EmptyApp()
+    barrier = threading.Barrier(2)
+    trees = {}
+
+    def body(name: str):
+        with Window(title=name, size=Size(100, 100)) as window:
+            with VerticalStack():
+                for i in range(20):
+                    # both threads are inside their stack at the same time
+                    if i == 10:
+                        barrier.wait()
+                    Label(text=f'{name} {i}')
+        return window
+
+    def build(name: str) -> None:
+        trees[name] = app.build(lambda: body(name))
+
+    threads = [threading.Thread(target=build, args=(name,)) for name in ('a', 'b')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, window in trees.items():
+        stack, = window._stack
+        assert stack.parent is window
+        assert [label.text for label in stack._stack] == [f'{name} {i}' for i in range(20)]
+        assert all(label.parent is stack for label in stack._stack)
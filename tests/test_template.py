@@ -0,0 +1,94 @@
+import pytest
+
+from applepy import Binding, Size, bindable, template
+from applepy.base.errors import UnsuportedParentError
+from applepy.scenes import Window
+from applepy.views.controls import Label, TextField
+from applepy.views.layout import VerticalStack
+
+
+class Document:
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    @bindable(str)
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, val: str) -> None:
+        self._name = val
+
+
+@template
+def document_window(document: Document) -> Window:
+    with Window(title=Binding(Document.name, document), size=Size(640, 480)) as window:
+        with VerticalStack():
+            Label(text='Name')
+            TextField(text=Binding(Document.name, document))
+    return window
+
+
+def test_stamped_windows_are_bound_to_their_arguments():
+    first = Document('a.txt')
+    second = Document('b.txt')
+    document_window(first)
+    window = document_window(second)
+
+    stack, = window._stack
+    label, text_field = stack._stack
+
+    assert stack.parent is window
+    assert label.parent is stack and text_field.parent is stack
+    assert window.bound_title.instance is second
+    assert text_field.bound_text.instance is second
+    assert label.text == 'Name'
+
+    second.name = 'c.txt'
+
+    assert window.title == 'c.txt'
+    assert text_field.text == 'c.txt'
+
+    window.dispose()
+
+
+@template
+def counter_window(title: str, count: int) -> Window:
+    with Window(title=title, size=Size(320, 240)) as window:
+        Label(text=f'count {count}')
+    return window
+
+
+def test_plain_arguments_are_not_frozen_to_the_first_call():
+    counter_window.clear()
+    counter_window('first', 1)
+    window = counter_window('second window', 2)
+    label, = window._stack
+
+    assert window.title == 'second window'
+    assert label.text == 'count 2'
+
+
+def test_equal_plain_arguments_are_stamped():
+    counter_window.clear()
+    counter_window('first', 1)
+    counter_window('same', 3)
+    prototype = counter_window._prototype
+    window = counter_window('same', 3)
+    label, = window._stack
+
+    assert counter_window._prototype is prototype
+    assert window.title == 'same'
+    assert label.text == 'count 3'
+
+
+def test_stamping_a_view_outside_a_scope():
+    @template
+    def name_label(document: Document) -> Label:
+        return Label(text=Binding(Document.name, document))
+
+    with Window(title='scope', size=Size(320, 240)):
+        name_label(Document('a.txt'))
+
+    with pytest.raises(UnsuportedParentError):
+        name_label(Document('b.txt'))
@@ -0,0 +1,82 @@
+import pytest
+
+from applepy import App, Timer, TimerOverrun
+from applepy.base import app as app_module
+from applepy.views import timer as timer_module
+
+
+class EmptyApp(App):
+    def body(self):
+        pass
+
+
+@pytest.fixture
+def no_app():
+    app_module._current_app = None
+    yield
+    app_module._current_app = None
+    app_module._waiting_for_app.clear()
+
+
+def test_timer_enabled_before_the_app_runs(no_app):
+    timer = Timer(interval=60., repeat=True, enabled=True)
+    app = EmptyApp()
+
+    assert not timer._current_timer
+
+    app.run()
+
+    assert timer._current_timer
+    assert len(app.scheduler) == 1
+
+    timer.enabled = False
+
+    assert len(app.scheduler) == 0
+
+
+def test_timer_disabled_before_the_app_runs(no_app):
+    timer = Timer(interval=60., enabled=True)
+    timer.enabled = False
+    app = EmptyApp()
+    app.run()
+
+    assert not timer._current_timer
+    assert len(app.scheduler) == 0
+
+
+@pytest.mark.parametrize('overrun', list(TimerOverrun))
+def test_timer_with_zero_interval(no_app, overrun):
+    timer = Timer(interval=0., repeat=True, enabled=True, overrun=overrun)
+    app = EmptyApp()
+    app.run()
+    timer._current_timer.cancel()
+    timer._current_timer = None
+    timer._deadline -= 1.
+
+    timer._reschedule()
+
+    assert timer._current_timer
+    timer.enabled = False
+
+
+@pytest.mark.parametrize('overrun, ticks_late', [(TimerOverrun.skip, -1),
+                                                 (TimerOverrun.coalesce, 0),
+                                                 (TimerOverrun.catch_up, 2)])
+def test_timer_overrun(no_app, monkeypatch, overrun, ticks_late):
+    now = 1000.
+    monkeypatch.setattr(timer_module, 'monotonic', lambda: now)
+    timer = Timer(interval=1., repeat=True, enabled=True, overrun=overrun)
+    app = EmptyApp()
+    app.run()
+    timer._current_timer.cancel()
+    timer._current_timer = None
+
+    # the action ran from the last deadline until 3.5 ticks later
+    timer._deadline = now - 3.5
+    timer._reschedule()
+
+    # the timer keeps its phase: skip waits for its next tick, coalesce runs a single tick
+    # right away and catch_up runs the 3 missed ticks, starting from the oldest one
+    assert timer._deadline == now - .5 - ticks_late
+    assert timer._current_timer.deadline == timer._deadline
+    timer.enabled = False
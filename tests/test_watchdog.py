@@ -0,0 +1,36 @@
+import threading
+import time
+
+from applepy.base.watchdog import StallDetector
+
+
+def test_stall_is_reported_before_the_main_thread_answers():
+    heartbeats = []
+    caught = threading.Event()
+    detector = StallDetector(heartbeats.append,
+                             threshold_ms=20.,
+                             interval_ms=10.,
+                             on_stall=lambda stall, duration_ms: caught.set())
+    detector.start()
+
+    try:
+        # the main thread never answers while it waits here
+        assert caught.wait(2.)
+
+        stall, = detector.stalls
+        reported_ms = stall.total_ms
+        assert stall.count == 1
+        assert any(name == 'test_stall_is_reported_before_the_main_thread_answers'
+                   for _, _, name in stall.signature)
+
+        time.sleep(.05)
+        heartbeats[0]()
+
+        deadline = time.monotonic() + 2.
+        while stall.total_ms == reported_ms and time.monotonic() < deadline:
+            time.sleep(.01)
+
+        assert stall.count == 1
+        assert stall.max_ms == stall.total_ms >= reported_ms + 50.
+    finally:
+        detector.stop()
@@ -0,0 +1,77 @@
+from pydispatch import dispatcher
+
+from applepy import App, Binding, Size, bindable
+from applepy.base import app as app_module
+from applepy.base.delegates import get_owner
+from applepy.scenes import Window
+from applepy.views.controls import Button, Label
+from applepy.views.layout import VerticalStack
+
+
+class EmptyApp(App):
+    def body(self):
+        pass
+
+
+class ViewModel:
+    def __init__(self) -> None:
+        self._name = 'a.txt'
+
+    @bindable(str)
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, val: str) -> None:
+        self._name = val
+
+    def save(self) -> None:
+        pass
+
+
+def receivers(bindable) -> list:
+    return list(dispatcher.getReceivers(sender=dispatcher.Anonymous, signal=bindable.on_changed._id))
+
+
+def open_window(monkeypatch, vm: ViewModel, **kwargs) -> Window:
+    app = EmptyApp()
+    monkeypatch.setattr(app_module, '_current_app', app)
+
+    with Window(title=Binding(ViewModel.name, vm), size=Size(100, 100), **kwargs) as window:
+        with VerticalStack():
+            Label(text=Binding(ViewModel.name, vm))
+            Button(title='Save', action=vm.save)
+
+    return window.parse()
+
+
+def test_closed_window_is_disposed(monkeypatch):
+    vm = ViewModel()
+    window = open_window(monkeypatch, vm)
+    app = app_module.get_current_app()
+    controller = window._controller
+
+    assert len(receivers(ViewModel.name)) == 2
+    assert len(app._actions) == 1
+    assert get_owner(controller) is window
+
+    controller.windowWillClose_(None)
+
+    assert window._disposed
+    assert not receivers(ViewModel.name)
+    assert len(app._actions) == 0
+    assert get_owner(controller) is None
+
+
+def test_closed_window_kept_when_asked(monkeypatch):
+    vm = ViewModel()
+    window = open_window(monkeypatch, vm, dispose_on_close=False)
+    app = app_module.get_current_app()
+
+    window._controller.windowWillClose_(None)
+
+    assert not window._disposed
+    assert len(receivers(ViewModel.name)) == 2
+    assert len(app._actions) == 1
+
+    window.dispose()